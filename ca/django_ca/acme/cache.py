@@ -0,0 +1,104 @@
+# This file is part of django-ca (https://github.com/mathiasertl/django-ca).
+#
+# django-ca is free software: you can redistribute it and/or modify it under the terms of the GNU General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# django-ca is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the
+# implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License
+# for more details.
+#
+# You should have received a copy of the GNU General Public License along with django-ca. If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""Per-process cache for ACME accounts used to authenticate ACMEv2 requests."""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, NamedTuple, Optional
+
+import josepy as jose
+
+if TYPE_CHECKING:
+    from django_ca.models import AcmeAccount, CertificateAuthority
+
+
+class CachedAcmeAccount(NamedTuple):
+    """An ACME account (with its certificate authority) and its parsed public key."""
+
+    account: "AcmeAccount"
+    jwk: jose.jwk.JWK
+    timestamp: float
+
+
+class AcmeAccountCache:
+    """Least-recently-used cache of ACME accounts, keyed by the CA serial and the account key ID ("kid").
+
+    Cached accounts are returned as copies, so views may modify them without affecting other requests. Entries
+    are removed when the account or its certificate authority is saved or deleted (see
+    :py:mod:`django_ca.receivers`). As this only works within a single process, entries also expire after
+    :ref:`CA_ACME_ACCOUNT_CACHE_TIMEOUT <settings-acme-account-cache-timeout>` seconds.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        The maximum number of accounts held in the cache.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[str, str], CachedAcmeAccount] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, serial: str, kid: str, timeout: int) -> Optional[tuple["AcmeAccount", jose.jwk.JWK]]:
+        """Get the account and its parsed key, or ``None`` if it is not cached or the entry has expired."""
+        key = (serial, kid)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry.timestamp >= timeout:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+
+        account = copy.copy(entry.account)
+        account.ca = copy.copy(entry.account.ca)
+        return account, entry.jwk
+
+    def set(self, serial: str, kid: str, account: "AcmeAccount", jwk: jose.jwk.JWK) -> None:
+        """Add an account (with the CA already loaded) and its parsed key to the cache."""
+        account = copy.copy(account)
+        account.ca = copy.copy(account.ca)
+        with self._lock:
+            self._entries[(serial, kid)] = CachedAcmeAccount(account, jwk, time.monotonic())
+            self._entries.move_to_end((serial, kid))
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(
+        self, account: Optional["AcmeAccount"] = None, ca: Optional["CertificateAuthority"] = None
+    ) -> None:
+        """Remove all entries for the given account and/or certificate authority.
+
+        If neither `account` nor `ca` is given, the whole cache is cleared.
+        """
+        with self._lock:
+            if account is None and ca is None:
+                self._entries.clear()
+                return
+
+            for key, entry in list(self._entries.items()):
+                if (account is not None and entry.account.pk == account.pk) or (
+                    ca is not None and entry.account.ca_id == ca.pk
+                ):
+                    del self._entries[key]
+
+
+#: The cache instance used by the ACMEv2 views.
+account_cache = AcmeAccountCache()
@@ -20,6 +20,7 @@ from django_ca.acme.responses import (
     AcmeResponseError,
     AcmeResponseForbidden,
     AcmeResponseMalformed,
+    AcmeResponseRateLimited,
     AcmeResponseUnauthorized,
 )
 
@@ -60,3 +61,9 @@ class AcmeBadCSR(AcmeException):
     """Exception raised when a CSR is not acceptable."""
 
     response = AcmeResponseBadCSR
+
+
+class AcmeRateLimited(AcmeException):
+    """Exception raised when a rate limit was exceeded."""
+
+    response = AcmeResponseRateLimited  # 429
@@ -0,0 +1,65 @@
+# This file is part of django-ca (https://github.com/mathiasertl/django-ca).
+#
+# django-ca is free software: you can redistribute it and/or modify it under the terms of the GNU General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# django-ca is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the
+# implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License
+# for more details.
+#
+# You should have received a copy of the GNU General Public License along with django-ca. If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""Rate limiting for ACMEv2 requests.
+
+Every limit configured in :ref:`CA_ACME_RATE_LIMITS <settings-acme-rate-limits>` is a bucket of tokens that is
+refilled completely at the start of every period. Buckets are counters in the Django cache, so consuming a
+token is a single atomic ``cache.incr()`` (plus a ``cache.add()`` for the first request in a period).
+"""
+
+import math
+import time
+
+from django.core.cache import cache
+
+from django_ca import ca_settings
+from django_ca.acme.errors import AcmeRateLimited
+
+
+def get_registered_domain(value: str) -> str:
+    """Get the domain under which the given name is registered.
+
+    Note that this function does not use the Public Suffix List and simply returns the last two labels (e.g.
+    ``example.com`` for ``*.www.example.com``).
+    """
+    return ".".join(value.lower().rstrip(".").split(".")[-2:])
+
+
+def consume(scope: str, key: str) -> None:
+    """Consume a token from the bucket identified by `scope` and `key`.
+
+    Nothing is done if no rate limit is configured for `scope`.
+
+    Raises
+    ------
+    AcmeRateLimited
+        If the bucket is empty. The exception includes the time until the bucket is refilled.
+    """
+    limit = ca_settings.ACME_RATE_LIMITS.get(scope)
+    if limit is None:
+        return
+
+    tokens, period = limit
+    now = time.time()
+    retry_after = math.ceil(period - now % period)
+    cache_key = f"acme-rate-limit-{scope}-{key}-{int(now // period)}"
+
+    try:
+        used = cache.incr(cache_key)
+    except ValueError:  # first request in this period
+        # NOTE: If add() fails, a concurrent request has just created the bucket.
+        used = 1 if cache.add(cache_key, 1, retry_after + 1) else cache.incr(cache_key)
+
+    if used > tokens:
+        raise AcmeRateLimited(retry_after=retry_after, message=f"Rate limit exceeded for {scope} {key}.")
@@ -175,6 +175,24 @@ class AcmeResponseBadNonce(AcmeResponseError):
     message = "Bad or invalid nonce."
 
 
+class AcmeResponseRateLimited(AcmeResponseError):
+    """ACME response when a rate limit was exceeded.
+
+    .. seealso:: RFC 8555, section 6.6:
+
+       "When the server refuses a request because the rate limit was exceeded, the server SHOULD include a
+       Retry-After header field to indicate how long the client should wait before retrying the request."
+    """
+
+    status_code = HTTPStatus.TOO_MANY_REQUESTS  # 429
+    type = "rateLimited"
+    message = "Rate limit exceeded."
+
+    def __init__(self, retry_after: int, message: str = "") -> None:
+        super().__init__(message=message)
+        self["Retry-After"] = str(retry_after)
+
+
 class AcmeResponseUnsupportedMediaType(AcmeResponseMalformed):
     """Acme response for unsupported media type."""
 
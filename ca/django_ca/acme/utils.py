@@ -13,10 +13,34 @@
 
 """ACME utility functions."""
 
+from typing import Callable
+
 import josepy as jose
 
 from cryptography import x509
 
+from django.http import HttpRequest
+from django.urls import reverse
+
+# Placeholder for the slug when reversing URLs in acme_url_builder(). It must be a valid ACME slug, but cannot
+# occur in the URL otherwise, because serials are hex-encoded.
+_SLUG_PLACEHOLDER = "SLUG"
+
+
+def acme_url_builder(request: HttpRequest, viewname: str, serial: str) -> Callable[[str], str]:
+    """Get a function that returns the absolute URL to the given view for an ACME slug.
+
+    Unlike calling :py:func:`~django.urls.reverse` and ``request.build_absolute_uri()`` for every object, the
+    URL is reversed only once, which is much faster when building URLs for many objects of the same type.
+
+    >>> build_url = acme_url_builder(request, "django_ca:acme-authz", ca.serial)  # doctest: +SKIP
+    >>> build_url(authorization.slug)  # doctest: +SKIP
+    'http://example.com/django_ca/acme/.../authz/...'
+    """
+    path = reverse(viewname, kwargs={"serial": serial, "slug": _SLUG_PLACEHOLDER})
+    prefix, _placeholder, suffix = request.build_absolute_uri(path).rpartition(_SLUG_PLACEHOLDER)
+    return lambda slug: f"{prefix}{slug}{suffix}"
+
 
 def parse_acme_csr(value: str) -> x509.CertificateSigningRequest:
     """Convert the CSR as received via ACMEv2 into a valid CSR.
@@ -13,9 +13,15 @@
 
 """Module collecting methods for ACME challenge validation."""
 
+import asyncio
 import logging
+from collections.abc import Iterable
+from http import HTTPStatus
+from typing import Optional
 
+import dns.asyncresolver
 import dns.exception
+import requests
 from dns import resolver
 
 from django_ca.models import AcmeChallenge
@@ -23,6 +29,25 @@ from django_ca.models import AcmeChallenge
 log = logging.getLogger(__name__)
 
 
+def _get_dns_01_name(challenge: AcmeChallenge) -> str:
+    if challenge.type != AcmeChallenge.TYPE_DNS_01:
+        raise ValueError("This function can only validate DNS-01 challenges")
+
+    domain = challenge.auth.value  # domain to validate
+    dns_name = f"_acme_challenge.{domain}"
+    log.info("DNS-01 validation of %s: Expect %s on %s", domain, challenge.expected.decode("utf-8"), dns_name)
+    return dns_name
+
+
+def _txt_answers_match(answers: Iterable[dns.rdata.Rdata], expected: bytes) -> bool:
+    # RFC 8555, section 8.4: "Verify that the contents of one of the TXT records match the digest value"
+    for answer in answers:
+        # A single TXT record can have multiple string values, even if rarely seen in practice
+        if expected in answer.strings:  # type: ignore[attr-defined]  # only TXT records are queried
+            return True
+    return False
+
+
 def validate_dns_01(challenge: AcmeChallenge, timeout: int = 1) -> bool:
     """Function to validate a DNS-01 challenge.
 
@@ -33,14 +58,7 @@ def validate_dns_01(challenge: AcmeChallenge, timeout: int = 1) -> bool:
     timeout: int, optional
         Timeout for DNS queries.
     """
-    if challenge.type != AcmeChallenge.TYPE_DNS_01:
-        raise ValueError("This function can only validate DNS-01 challenges")
-
-    domain = challenge.auth.value  # domain to validate
-
-    dns_name = f"_acme_challenge.{domain}"
-    expected = challenge.expected
-    log.info("DNS-01 validation of %s: Expect %s on %s", domain, expected.decode("utf-8"), dns_name)
+    dns_name = _get_dns_01_name(challenge)
 
     try:
         answers = resolver.resolve(dns_name, "TXT", lifetime=timeout, search=False)
@@ -51,13 +69,123 @@ def validate_dns_01(challenge: AcmeChallenge, timeout: int = 1) -> bool:
         log.exception(ex)
         return False
 
-    # RFC 8555, section 8.4: "Verify that the contents of one of the TXT records match the digest value"
-    for answer in answers:
-        txt_data = answer.strings
+    return _txt_answers_match(answers, challenge.expected)
 
-        # A single TXT record can have multiple string values, even if rarely seen in practice
-        for value in txt_data:
-            if value == expected:
-                return True
 
+def validate_http_01(challenge: AcmeChallenge, timeout: int = 1) -> bool:
+    """Function to validate a HTTP-01 challenge.
+
+    Parameters
+    ----------
+    challenge : :py:class:`~django_ca.models.AcmeChallenge`
+        The challenge to validate.
+    timeout: int, optional
+        Timeout for the HTTP request.
+    """
+    if challenge.type != AcmeChallenge.TYPE_HTTP_01:
+        raise ValueError("This function can only validate HTTP-01 challenges")
+
+    decoded_token = challenge.encoded_token.decode("utf-8")
+    expected = challenge.expected
+    url = f"http://{challenge.auth.value}/.well-known/acme-challenge/{decoded_token}"
+
+    try:
+        with requests.get(url, timeout=timeout, stream=True) as response:
+            # Only fetch the response body if the status code is HTTP 200 (OK)
+            if response.status_code == HTTPStatus.OK:
+                # Only fetch the expected number of bytes to prevent a large file ending up in memory
+                # But fetch one extra byte (if available) to make sure that response has no extra bytes
+                received: bytes = response.raw.read(len(expected) + 1, decode_content=True)
+                return received == expected
+    except Exception as ex:  # pylint: disable=broad-except
+        log.exception(ex)
     return False
+
+
+async def _resolve_txt(dns_name: str, timeout: int) -> Optional[dns.resolver.Answer]:
+    try:
+        return await dns.asyncresolver.resolve(dns_name, "TXT", lifetime=timeout, search=False)
+    except resolver.NXDOMAIN:
+        log.debug("TXT %s: record does not exist.", dns_name)
+    except dns.exception.DNSException as ex:
+        log.exception(ex)
+    return None
+
+
+async def validate_dns_01_async(
+    challenge: AcmeChallenge,
+    timeout: int = 1,
+    lookups: Optional[dict[str, asyncio.Task[Optional[dns.resolver.Answer]]]] = None,
+) -> bool:
+    """Asynchronous version of :py:func:`~django_ca.acme.validation.validate_dns_01`.
+
+    The challenge must be loaded with all related objects (see
+    :py:meth:`AcmeChallengeQuerySet.url() <django_ca.querysets.AcmeChallengeQuerySet.url>`), as no database
+    queries can be made from an asynchronous context.
+
+    If `lookups` is passed, DNS queries are shared between all calls that pass the same dictionary, so that
+    every name is only queried once.
+    """
+    dns_name = _get_dns_01_name(challenge)
+
+    if lookups is None:
+        answers = await _resolve_txt(dns_name, timeout)
+    else:
+        if dns_name not in lookups:
+            lookups[dns_name] = asyncio.create_task(_resolve_txt(dns_name, timeout))
+        answers = await lookups[dns_name]
+
+    if answers is None:
+        return False
+    return _txt_answers_match(answers, challenge.expected)
+
+
+async def validate_http_01_async(challenge: AcmeChallenge, timeout: int = 1) -> bool:
+    """Asynchronous version of :py:func:`~django_ca.acme.validation.validate_http_01`.
+
+    The HTTP request is made in a separate thread. Like with
+    :py:func:`~django_ca.acme.validation.validate_dns_01_async`, the challenge must be loaded with all related
+    objects.
+    """
+    return await asyncio.to_thread(validate_http_01, challenge, timeout)
+
+
+async def validate_challenges(
+    challenges: Iterable[AcmeChallenge], concurrency: int = 10, timeout: int = 1
+) -> dict[int, bool]:
+    """Validate many challenges concurrently.
+
+    DNS queries are shared between challenges, so every name is only queried once, even if multiple
+    challenges use the same name (e.g. for ``example.com`` and ``*.example.com``). Unsupported challenge types
+    are considered invalid. Like with :py:func:`~django_ca.acme.validation.validate_dns_01_async`, challenges
+    must be loaded with all related objects.
+
+    Parameters
+    ----------
+    challenges : list of :py:class:`~django_ca.models.AcmeChallenge`
+        The challenges to validate.
+    concurrency : int, optional
+        Maximum number of challenges validated at the same time.
+    timeout: int, optional
+        Timeout for DNS queries and HTTP requests.
+
+    Returns
+    -------
+    dict
+        A dictionary mapping the primary key of each challenge to a boolean indicating if it is valid.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    lookups: dict[str, asyncio.Task[Optional[dns.resolver.Answer]]] = {}
+
+    async def validate(challenge: AcmeChallenge) -> bool:
+        async with semaphore:
+            if challenge.type == AcmeChallenge.TYPE_HTTP_01:
+                return await validate_http_01_async(challenge, timeout=timeout)
+            if challenge.type == AcmeChallenge.TYPE_DNS_01:
+                return await validate_dns_01_async(challenge, timeout=timeout, lookups=lookups)
+            log.error("%s: Challenge type is not supported.", challenge)
+            return False
+
+    challenges = list(challenges)
+    results = await asyncio.gather(*[validate(challenge) for challenge in challenges])
+    return {challenge.pk: result for challenge, result in zip(challenges, results)}
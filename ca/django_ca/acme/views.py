@@ -20,8 +20,11 @@
 """
 
 import abc
+import hmac
 import logging
 import secrets
+import struct
+import time
 import typing
 from collections.abc import Iterable
 from datetime import datetime, timezone as tz
@@ -44,13 +47,17 @@ from django.db import transaction
 from django.http import Http404, HttpRequest, HttpResponse, JsonResponse
 from django.urls import reverse
 from django.utils import timezone
+from django.utils.cache import patch_cache_control
+from django.utils.crypto import salted_hmac
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
 from django.views.generic.base import View
 
 from django_ca import ca_settings
+from django_ca.acme.cache import account_cache
 from django_ca.acme.errors import AcmeBadCSR, AcmeException, AcmeForbidden, AcmeMalformed, AcmeUnauthorized
 from django_ca.acme.messages import CertificateRequest, NewOrder
+from django_ca.acme.ratelimit import consume, get_registered_domain
 from django_ca.acme.responses import (
     AcmeResponse,
     AcmeResponseAccount,
@@ -67,7 +74,7 @@ from django_ca.acme.responses import (
     AcmeResponseUnauthorized,
     AcmeResponseUnsupportedMediaType,
 )
-from django_ca.acme.utils import parse_acme_csr
+from django_ca.acme.utils import acme_url_builder, parse_acme_csr
 from django_ca.constants import REASON_CODES
 from django_ca.models import (
     AcmeAccount,
@@ -79,8 +86,14 @@ from django_ca.models import (
     CertificateAuthority,
 )
 from django_ca.pydantic.validators import email_validator
-from django_ca.tasks import acme_issue_certificate, acme_validate_challenge, run_task
-from django_ca.utils import check_name, int_to_hex
+from django_ca.tasks import (
+    acme_issue_certificate,
+    acme_issue_queued_certificates,
+    acme_validate_challenge,
+    run_task,
+    schedule_acme_order_validation,
+)
+from django_ca.utils import check_name, get_acme_directory_cache_key, int_to_hex
 
 log = logging.getLogger(__name__)
 MessageTypeVar = TypeVar("MessageTypeVar", bound=jose.json_util.JSONObjectWithFields)
@@ -144,30 +157,11 @@ class AcmeDirectory(View):
     def _url(self, request: HttpRequest, name: str, ca: CertificateAuthority) -> str:
         return request.build_absolute_uri(reverse(f"django_ca:{name}", kwargs={"serial": ca.serial}))
 
-    def get(self, request: HttpRequest, serial: Optional[str] = None) -> HttpResponse:
-        # pylint: disable=missing-function-docstring; standard Django view function
-        if not ca_settings.CA_ENABLE_ACME:
-            raise Http404("Page not found.")
-
-        if serial is None:
-            try:
-                # NOTE: default() already calls usable()
-                ca = CertificateAuthority.objects.acme().default()
-            except ImproperlyConfigured:
-                return AcmeResponseNotFound(message="No (usable) default CA configured.")
-        else:
-            try:
-                # NOTE: Serial is already sanitized by URL converter
-                ca = CertificateAuthority.objects.acme().usable().get(serial=serial)
-            except CertificateAuthority.DoesNotExist:
-                return AcmeResponseNotFound(message=f"{serial}: CA not found.")
-
-        # Get some random data into the directory view, as explained in the Let's Encrypt directory:
-        #   https://community.letsencrypt.org/t/adding-random-entries-to-the-directory/33417
-        rnd = jose.json_util.encode_b64jose(secrets.token_bytes(16))
-
+    def get_directory(
+        self, request: HttpRequest, ca: CertificateAuthority
+    ) -> dict[str, Union[str, DirectoryMetaAlias]]:
+        """Get the directory for the given CA (without the random entry)."""
         directory: dict[str, Union[str, DirectoryMetaAlias]] = {
-            rnd: "https://community.letsencrypt.org/t/adding-random-entries-to-the-directory/33417",
             "keyChange": "http://localhost:8000/django_ca/acme/todo/key-change",
             "newAccount": self._url(request, "acme-new-account", ca),
             "newNonce": self._url(request, "acme-new-nonce", ca),
@@ -186,44 +180,105 @@ class AcmeDirectory(View):
             meta["caaIdentities"] = [ca.caa_identity]  # array of string
         if meta:
             directory["meta"] = meta
+        return directory
 
-        return JsonResponse(directory)
+    def get(self, request: HttpRequest, serial: Optional[str] = None) -> HttpResponse:
+        # pylint: disable=missing-function-docstring; standard Django view function
+        if not ca_settings.CA_ENABLE_ACME:
+            raise Http404("Page not found.")
+
+        # Directories are cached per CA. As URLs in the directory depend on the request, the cached value is a
+        # dictionary of directories with the base URL as key.
+        cache_timeout = ca_settings.ACME_DIRECTORY_CACHE_TIMEOUT
+        cache_key = get_acme_directory_cache_key(serial)
+        base_url = request.build_absolute_uri("/")
+        directories: dict[str, dict[str, Union[str, DirectoryMetaAlias]]] = {}
+        if cache_timeout > 0:
+            directories = cache.get(cache_key, {})
+
+        directory = directories.get(base_url)
+        if directory is None:
+            if serial is None:
+                try:
+                    # NOTE: default() already calls usable()
+                    ca = CertificateAuthority.objects.acme().default()
+                except ImproperlyConfigured:
+                    return AcmeResponseNotFound(message="No (usable) default CA configured.")
+            else:
+                try:
+                    # NOTE: Serial is already sanitized by URL converter
+                    ca = CertificateAuthority.objects.acme().usable().get(serial=serial)
+                except CertificateAuthority.DoesNotExist:
+                    return AcmeResponseNotFound(message=f"{serial}: CA not found.")
+
+            directory = self.get_directory(request, ca)
+            if cache_timeout > 0:
+                # Never cache the directory for longer than the CA is usable.
+                expires = min(cache_timeout, int((ca.expires - timezone.now()).total_seconds()))
+                directories[base_url] = directory
+                cache.set(cache_key, directories, expires)
+
+        # Get some random data into the directory view, as explained in the Let's Encrypt directory:
+        #   https://community.letsencrypt.org/t/adding-random-entries-to-the-directory/33417
+        rnd = jose.json_util.encode_b64jose(secrets.token_bytes(16))
+        rnd_url = "https://community.letsencrypt.org/t/adding-random-entries-to-the-directory/33417"
+        response = JsonResponse({rnd: rnd_url, **directory})
+        if cache_timeout > 0:
+            patch_cache_control(response, public=True, max_age=cache_timeout)
+        return response
 
 
 class AcmeGetNonceViewMixin:
     """View mixin that provides methods to get and validate a Nonce.
 
+    Nonces are stateless: They consist of a timestamp and random bytes, authenticated with an HMAC (based on
+    ``SECRET_KEY`` and the serial of the CA), so no I/O is required to generate a nonce. To prevent replay
+    attacks, used nonces are added to the cache until they expire.
+
     Note that this mixin depends on the presence of a ``serial`` argument to the URL resolver.
     """
 
     kwargs: dict[str, str]
-    nonce_length = 32
-    """Length of generated Nonces."""
+    nonce_validity = 3600
+    """Time (in seconds) that a nonce can be used."""
+
+    _nonce_value_length = 16  # 4 bytes timestamp, 12 random bytes
+    _nonce_digest_length = 16
 
     def get_cache_key(self, nonce: str) -> str:
         """Get the cache key for the given request and nonce."""
         return f"acme-nonce-{self.kwargs['serial']}-{nonce}"
 
+    def _get_nonce_digest(self, value: bytes) -> bytes:
+        key_salt = f"django_ca.acme.nonce.{self.kwargs['serial']}"
+        return salted_hmac(key_salt, value, algorithm="sha256").digest()[: self._nonce_digest_length]
+
     def get_nonce(self) -> str:
-        """Get a random Nonce and add it to the cache."""
-        data = secrets.token_bytes(self.nonce_length)
-        nonce = jose.json_util.encode_b64jose(data)
-        cache.set(self.get_cache_key(nonce), 0)
-        return nonce
+        """Get a new Nonce."""
+        value = struct.pack("!I", int(time.time())) + secrets.token_bytes(self._nonce_value_length - 4)
+        return jose.json_util.encode_b64jose(value + self._get_nonce_digest(value))
 
     def validate_nonce(self, nonce: str) -> bool:
         """Validate that the given nonce was issued and was not used before."""
         try:
-            count = cache.incr(self.get_cache_key(nonce))
-        except ValueError:
-            # raised if cache_key is not set
+            data = jose.json_util.decode_b64jose(nonce)
+        except jose.errors.DeserializationError:
             return False
 
-        if count > 1:  # nonce was already used
-            # NOTE: "incr" returns the *new* value, so "1" is the expected value.
+        if len(data) != self._nonce_value_length + self._nonce_digest_length:
             return False
 
-        return True
+        value, digest = data[: self._nonce_value_length], data[self._nonce_value_length :]
+        if not hmac.compare_digest(digest, self._get_nonce_digest(value)):
+            return False
+
+        # Make sure that the nonce did not expire
+        age = int(time.time()) - struct.unpack("!I", value[:4])[0]
+        if not 0 <= age < self.nonce_validity:
+            return False
+
+        # add() only sets the key (and returns True) if it does not exist, so a nonce can only be used once
+        return cache.add(self.get_cache_key(nonce), 0, timeout=self.nonce_validity - age)
 
 
 @method_decorator(csrf_exempt, name="dispatch")
@@ -243,6 +298,23 @@ class AcmeBaseView(AcmeGetNonceViewMixin, View, metaclass=abc.ABCMeta):
         either create an object or do not process any object.
         """
 
+    def get_cached_account(
+        self, serial: str, kid: Optional[str]
+    ) -> Optional[tuple[AcmeAccount, jose.jwk.JWK]]:
+        """Get the account and its parsed key from the account cache, if enabled and present.
+
+        The account is only returned if the certificate authority is still usable. Otherwise, the request
+        will query the database and return the appropriate error response.
+        """
+        timeout = ca_settings.ACME_ACCOUNT_CACHE_TIMEOUT
+        if not kid or timeout <= 0:
+            return None
+
+        cached = account_cache.get(serial, kid, timeout)
+        if cached is None or cached[0].ca.acme_enabled is False or cached[0].ca.usable is False:
+            return None
+        return cached
+
     def is_account_usable(self, account: AcmeAccount) -> bool:
         """Method determining if an account is usable.
 
@@ -310,6 +382,7 @@ class AcmeBaseView(AcmeGetNonceViewMixin, View, metaclass=abc.ABCMeta):
             raise ImproperlyConfigured("View expects a str for a slug")
 
         try:
+            consume("ca", serial)
             response = super().dispatch(request, serial=serial, slug=slug)
         except AcmeException as ex:
             response = ex.get_response()
@@ -356,11 +429,15 @@ class AcmeBaseView(AcmeGetNonceViewMixin, View, metaclass=abc.ABCMeta):
             # both.'
             return AcmeResponseMalformed(message="jwk and kid are mutually exclusive.")
 
-        # Get certificate authority for this request
-        try:
-            self.ca = CertificateAuthority.objects.acme().usable().get(serial=serial)
-        except CertificateAuthority.DoesNotExist:
-            return AcmeResponseNotFound(message="The requested CA cannot be found.")
+        # Get certificate authority for this request (from the account cache for kid-authenticated requests)
+        cached_account = self.get_cached_account(serial, combined.kid)
+        if cached_account is not None:
+            self.ca = cached_account[0].ca
+        else:
+            try:
+                self.ca = CertificateAuthority.objects.acme().usable().get(serial=serial)
+            except CertificateAuthority.DoesNotExist:
+                return AcmeResponseNotFound(message="The requested CA cannot be found.")
 
         if combined.jwk:
             if not self.requires_key and not self.accepts_kid_or_jwk:
@@ -371,11 +448,19 @@ class AcmeBaseView(AcmeGetNonceViewMixin, View, metaclass=abc.ABCMeta):
             if self.requires_key and not self.accepts_kid_or_jwk:
                 return AcmeResponseMalformed(message="Request requires a full JWK key.")
 
-            # combined.kid is a full URL pointing to the account.
-            try:
-                account = AcmeAccount.objects.viewable().get(ca=self.ca, kid=combined.kid)
-            except AcmeAccount.DoesNotExist:
-                return AcmeResponseUnauthorized(message="Account not found.")
+            if cached_account is not None:
+                account, jwk = cached_account
+            else:
+                # combined.kid is a full URL pointing to the account.
+                try:
+                    account = AcmeAccount.objects.viewable().get(ca=self.ca, kid=combined.kid)
+                except AcmeAccount.DoesNotExist:
+                    return AcmeResponseUnauthorized(message="Account not found.")
+
+                account.ca = self.ca  # CA was already loaded above, so don't fetch it again
+                jwk = jose.jwk.JWK.load(account.pem.encode("utf-8"))  # load JWK from database
+                if ca_settings.ACME_ACCOUNT_CACHE_TIMEOUT > 0:
+                    account_cache.set(serial, combined.kid, account, jwk)
 
             if self.is_account_usable(account) is False:
                 # RFC 855, 7.3.6:
@@ -388,7 +473,7 @@ class AcmeBaseView(AcmeGetNonceViewMixin, View, metaclass=abc.ABCMeta):
             # self.prepared['pem'] = account.pem
             # self.prepared['account_pk'] = account.pk
 
-            self.jwk = jose.jwk.JWK.load(account.pem.encode("utf-8"))  # load JWK from database
+            self.jwk = jwk
             self.account = account
         else:
             # ... 'Either "jwk" (JSON Web Key) or "kid" (Key ID)'
@@ -421,6 +506,9 @@ class AcmeBaseView(AcmeGetNonceViewMixin, View, metaclass=abc.ABCMeta):
             # match, then the server MUST reject the request as unauthorized."
             return AcmeResponseUnauthorized(message="URL does not match.")
 
+        if combined.kid:
+            consume("account", self.account.slug)
+
         return self.process_acme_request(slug=slug)
 
 
@@ -715,6 +803,9 @@ class AcmeNewOrderView(AcmeMessageBaseView[NewOrder]):
             # NOTE: Catches sending an empty tuple, which is not caught in message deserialization
             raise AcmeMalformed(message="The following fields are required: identifiers")
 
+        for domain in sorted({get_registered_domain(identifier.value) for identifier in identifiers}):
+            consume("domain", domain)
+
         if settings.USE_TZ is False:
             if not_before is not None and timezone.is_aware(not_before):
                 not_before = timezone.make_naive(not_before)
@@ -722,9 +813,8 @@ class AcmeNewOrderView(AcmeMessageBaseView[NewOrder]):
                 not_after = timezone.make_naive(not_after)
 
         order = AcmeOrder.objects.create(account=self.account, not_before=not_before, not_after=not_after)
-        authorizations = [
-            self.request.build_absolute_uri(authz.acme_url) for authz in order.add_authorizations(identifiers)
-        ]
+        build_authz_url = acme_url_builder(self.request, "django_ca:acme-authz", self.account.serial)
+        authorizations = [build_authz_url(authz.slug) for authz in order.add_authorizations(identifiers)]
 
         expires = order.expires
         if expires.tzinfo is None:  # acme.messages.Order requires a timezone-aware object
@@ -757,12 +847,19 @@ class AcmeOrderView(AcmePostAsGetView):
 
     def acme_request(self, slug: str) -> AcmeResponseOrder:
         try:
-            order = AcmeOrder.objects.viewable().account(self.account).get(slug=slug)
+            # The certificate (if any) is fetched in the same query.
+            order = (
+                AcmeOrder.objects.viewable()
+                .account(self.account)
+                .select_related("acmecertificate")
+                .get(slug=slug)
+            )
         except AcmeOrder.DoesNotExist as ex:
             # RFC 8555, section 10.5: Avoid leaking info that this slug does not exist by
             # return a normal unauthorized message.
             raise AcmeUnauthorized() from ex
         # self.prepared['order'] = order.slug
+        order.account = self.account  # account was already loaded, so don't fetch it again
 
         expires = order.expires
         if expires.tzinfo is None:  # acme.messages.Order requires a timezone-aware object
@@ -777,8 +874,8 @@ class AcmeOrderView(AcmePostAsGetView):
 
         cert_url = None
         try:
-            cert = AcmeCertificate.objects.get(order=order)
-            if cert.cert and order.status == AcmeOrder.STATUS_VALID:
+            cert = order.acmecertificate
+            if cert.cert_id is not None and order.status == AcmeOrder.STATUS_VALID:
                 # WARNING: certbot (at least version 0.31.0) will try to fetch the certificate immediately if
                 # we return the URL. That view will fail if the certificate is not yet issued, and certbot
                 # fails with an error.
@@ -788,11 +885,12 @@ class AcmeOrderView(AcmePostAsGetView):
         except AcmeCertificate.DoesNotExist:
             pass
 
+        build_authz_url = acme_url_builder(self.request, "django_ca:acme-authz", self.account.serial)
         response = AcmeResponseOrder(
             status=order.status,
             expires=expires,
             identifiers=tuple({"type": a.type, "value": a.value} for a in authorizations),
-            authorizations=tuple(self.request.build_absolute_uri(a.acme_url) for a in authorizations),
+            authorizations=tuple(build_authz_url(a.slug) for a in authorizations),
             certificate=cert_url,
         )
         response["Location"] = self.request.build_absolute_uri(order.acme_url)
@@ -864,6 +962,17 @@ class AcmeOrderFinalizeView(AcmeMessageBaseView[CertificateRequest]):
 
         return csr.public_bytes(Encoding.PEM).decode("utf-8")
 
+    def is_renewal(self, authorizations: Iterable[AcmeAuthorization]) -> bool:
+        """Test if the account has a certificate for any of the names that is about to expire."""
+        now = timezone.now()
+        return Certificate.objects.filter(
+            acmecertificate__order__account=self.account,
+            acmecertificate__order__authorizations__value__in=[auth.value for auth in authorizations],
+            revoked=False,
+            expires__gt=now,
+            expires__lte=now + ca_settings.ACME_ISSUANCE_RENEWAL_WINDOW,
+        ).exists()
+
     def acme_request(self, message: CertificateRequest, slug: Optional[str]) -> AcmeResponseOrder:
         """Process ACME request."""
         try:
@@ -873,6 +982,7 @@ class AcmeOrderFinalizeView(AcmeMessageBaseView[CertificateRequest]):
             # return a normal unauthorized message.
             raise AcmeUnauthorized() from ex
         # self.prepared['order'] = order.slug
+        order.account = self.account  # account was already loaded, so don't fetch it again
 
         # RFC 8555, section 7.4:
         #
@@ -895,7 +1005,7 @@ class AcmeOrderFinalizeView(AcmeMessageBaseView[CertificateRequest]):
         if expires.tzinfo is None:  # acme.messages.Order requires a timezone-aware object
             expires = expires.replace(tzinfo=tz.utc)
 
-        authorizations = order.authorizations.all()
+        authorizations = list(order.authorizations.all())
         for auth in authorizations:
             if auth.status != AcmeAuthorization.STATUS_VALID:
                 # This is a state that should never happen in practice, because the order is only marked as
@@ -908,7 +1018,10 @@ class AcmeOrderFinalizeView(AcmeMessageBaseView[CertificateRequest]):
         csr = self.validate_csr(message, authorizations)
 
         # Create AcmeCertificate object (at this point without cert, as it hasn't been issued yet)
-        cert = AcmeCertificate.objects.create(order=order, csr=csr)
+        priority = AcmeCertificate.PRIORITY_DEFAULT
+        if ca_settings.ACME_ISSUANCE_QUEUE and self.is_renewal(authorizations):
+            priority = AcmeCertificate.PRIORITY_RENEWAL
+        cert = AcmeCertificate.objects.create(order=order, csr=csr, priority=priority)
 
         # Update the status of the order to "processing"
         order.status = AcmeOrder.STATUS_PROCESSING
@@ -916,13 +1029,18 @@ class AcmeOrderFinalizeView(AcmeMessageBaseView[CertificateRequest]):
 
         # start task only after commit, see:
         # https://docs.djangoproject.com/en/dev/topics/db/transactions/#django.db.transaction.on_commit
-        transaction.on_commit(lambda: run_task(acme_issue_certificate, acme_certificate_pk=cert.pk))
+        if ca_settings.ACME_ISSUANCE_QUEUE is False:
+            transaction.on_commit(lambda: run_task(acme_issue_certificate, acme_certificate_pk=cert.pk))
+        elif ca_settings.CA_USE_CELERY is True:
+            # Without Celery, queued certificates are issued by manage.py acme_issuance_worker.
+            transaction.on_commit(lambda: run_task(acme_issue_queued_certificates, reschedule=True))
 
+        build_authz_url = acme_url_builder(self.request, "django_ca:acme-authz", self.account.serial)
         response = AcmeResponseOrder(
             status=order.status,
             expires=expires,
             identifiers=tuple({"type": a.type, "value": a.value} for a in authorizations),
-            authorizations=tuple(self.request.build_absolute_uri(a.acme_url) for a in authorizations),
+            authorizations=tuple(build_authz_url(a.slug) for a in authorizations),
         )
         response["Location"] = self.request.build_absolute_uri(order.acme_url)
         return response
@@ -1066,7 +1184,11 @@ class AcmeChallengeView(AcmePostAsGetView):
             # Actually perform challenge validation asynchronously
             # start task only after commit, see:
             # https://docs.djangoproject.com/en/2.2/topics/db/transactions/#django.db.transaction.on_commit
-            transaction.on_commit(lambda: run_task(acme_validate_challenge, challenge.pk))
+            if ca_settings.ACME_VALIDATE_ORDERS:
+                order_pk = challenge.auth.order_id
+                transaction.on_commit(lambda: schedule_acme_order_validation(order_pk))
+            else:
+                transaction.on_commit(lambda: run_task(acme_validate_challenge, challenge.pk))
 
         return AcmeResponseChallenge(
             chall=challenge.acme_challenge,
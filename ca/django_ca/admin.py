@@ -234,8 +234,11 @@ class CertificateMixin(
     @admin.display(description=_("Primary name"))
     def primary_name(self, obj: X509CertMixinTypeVar) -> "StrOrPromise":
         """Display the first Subject Alternative Name or the Common Name."""
-        extensions = obj.extensions
-        if san := extensions.get(ExtensionOID.SUBJECT_ALTERNATIVE_NAME):
+        if obj.fingerprint_sha256:  # metadata is populated, so the certificate does not have to be loaded
+            if obj.subject_alternative_names:
+                # NOTE: Strip the type of the general name, as this should be obvious from the list display.
+                return obj.subject_alternative_names.split("\n", 1)[0].split(":", 1)[1]
+        elif san := obj.extensions.get(ExtensionOID.SUBJECT_ALTERNATIVE_NAME):
             # NOTE: Do not format the general name here, as this should be obvious from the list display.
             return san.value[0].value  # type: ignore[no-any-return,index]
         if obj.cn:
@@ -406,7 +409,7 @@ class CertificateAuthorityAdmin(CertificateMixin[CertificateAuthority], Certific
     form = CertificateAuthorityForm  # type: ignore[assignment]
     list_display = ("enabled", "name", "serial_field")
     list_display_links = ("enabled", "name")
-    search_fields = ("cn", "name", "serial")
+    search_fields = ("cn", "name", "serial", "fingerprint_sha256")
     readonly_fields = ("issuer_field", "serial_field", "subject_field", "pub_pem", "parent", "expires")
     x509_fieldset_index = 4
 
@@ -576,7 +579,7 @@ class CertificateAdmin(DjangoObjectActions, CertificateMixin[Certificate], Certi
     add_form_template = "admin/django_ca/certificate/add_form.html"
     change_form_template = "admin/django_ca/certificate/change_form.html"
     list_display = ("primary_name", "profile", "serial_field", "status", "expires_date")
-    list_filter = ("profile", AutoGeneratedFilter, StatusListFilter, "ca")
+    list_filter = ("profile", AutoGeneratedFilter, StatusListFilter, "ca", "public_key_type")
     readonly_fields = (
         "expires",
         "issuer_field",
@@ -591,7 +594,7 @@ class CertificateAdmin(DjangoObjectActions, CertificateMixin[Certificate], Certi
         "profile",
         "oid_2_5_29_17",  # SubjectAlternativeName
     )
-    search_fields = ("cn", "serial")
+    search_fields = ("cn", "serial", "subject_alternative_names", "fingerprint_sha256")
 
     fieldsets = (
         (
@@ -21,6 +21,8 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractUser
 from django.http import HttpRequest
 
+from django_ca import ca_settings
+from django_ca.api.cache import user_cache
 from django_ca.api.errors import Forbidden
 
 User = get_user_model()
@@ -30,6 +32,8 @@ class BasicAuth(HttpBasicAuth):
     """HTTP Basic Authentication and permission checking.
 
     The class will raise :py:class:`~django_ca.api.errors.Forbidden` if the user lacks sufficient permissions.
+    If :ref:`CA_API_AUTH_CACHE_TIMEOUT <settings-ca-api-auth-cache-timeout>` is set, users that successfully
+    authenticated are cached (see :py:class:`~django_ca.api.cache.ApiUserCache`).
 
     Parameters
     ----------
@@ -44,9 +48,27 @@ class BasicAuth(HttpBasicAuth):
     def authenticate(
         self, request: HttpRequest, username: str, password: str
     ) -> Union[Literal[False], AbstractUser]:
-        user = User.objects.get(username=username)
-        if user.check_password(password) is False:
-            return False
-        if user.has_perm(self.permission) is False:
+        timeout = ca_settings.CA_API_AUTH_CACHE_TIMEOUT
+        user = cached_user = user_cache.get(username, password, timeout) if timeout else None
+
+        if user is None:
+            try:
+                user = User.objects.get(username=username)
+            except User.DoesNotExist:
+                # Run the password hasher once to reduce the timing difference between an existing and a
+                # nonexistent user (same as django.contrib.auth.backends.ModelBackend does).
+                User().set_password(password)
+                return False
+            if user.check_password(password) is False:
+                return False
+
+        has_perm = user.has_perm(self.permission)
+
+        # Cache the user only after checking permissions, so that the permissions cached by the authentication
+        # backend are cached as well.
+        if timeout and cached_user is None:
+            user_cache.set(username, password, user)
+
+        if has_perm is False:
             raise Forbidden(self.permission)
         return user
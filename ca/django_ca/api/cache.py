@@ -0,0 +1,98 @@
+# This file is part of django-ca (https://github.com/mathiasertl/django-ca).
+#
+# django-ca is free software: you can redistribute it and/or modify it under the terms of the GNU General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# django-ca is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the
+# implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License
+# for more details.
+#
+# You should have received a copy of the GNU General Public License along with django-ca. If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""Per-process cache for users that successfully authenticated to the REST API."""
+
+import copy
+import hashlib
+import hmac
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+from django.contrib.auth.models import AbstractUser
+
+
+class CachedApiUser(NamedTuple):
+    """A user with a digest of the password it authenticated with."""
+
+    user: AbstractUser
+    digest: bytes
+    timestamp: float
+
+
+class ApiUserCache:
+    """Least-recently-used cache of users that authenticated to the REST API, keyed by the username.
+
+    Verifying a password with the password hashers configured in Django is deliberately slow. This cache
+    instead stores an HMAC of the password, keyed with a random key that is generated for every process and
+    never stored anywhere, so that later requests with the same credentials can be verified quickly.
+
+    Users are cached after their permissions were checked, so cached users (which are returned as copies)
+    also carry the permissions loaded by the authentication backend. The whole cache is cleared when a user,
+    group or permission is changed (see :py:mod:`django_ca.receivers`). As this only works within a single
+    process, entries also expire after :ref:`CA_API_AUTH_CACHE_TIMEOUT <settings-ca-api-auth-cache-timeout>`
+    seconds.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        The maximum number of users held in the cache.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, CachedApiUser] = OrderedDict()
+        self._key = secrets.token_bytes(32)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _digest(self, password: str) -> bytes:
+        return hmac.new(self._key, password.encode("utf-8"), hashlib.sha256).digest()
+
+    def get(self, username: str, password: str, timeout: int) -> Optional[AbstractUser]:
+        """Get the user, or ``None`` if it is not cached, the entry has expired or the password differs."""
+        with self._lock:
+            entry = self._entries.get(username)
+            if entry is None:
+                return None
+            if time.monotonic() - entry.timestamp >= timeout:
+                del self._entries[username]
+                return None
+            self._entries.move_to_end(username)
+
+        if hmac.compare_digest(entry.digest, self._digest(password)) is False:
+            return None
+        return copy.copy(entry.user)
+
+    def set(self, username: str, password: str, user: AbstractUser) -> None:
+        """Add a user that successfully authenticated with the given password to the cache."""
+        entry = CachedApiUser(copy.copy(user), self._digest(password), time.monotonic())
+        with self._lock:
+            self._entries[username] = entry
+            self._entries.move_to_end(username)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Clear the whole cache."""
+        with self._lock:
+            self._entries.clear()
+
+
+#: The cache instance used by the REST API.
+user_cache = ApiUserCache()
@@ -21,21 +21,24 @@ from ninja.errors import HttpError
 from django.core.exceptions import ValidationError
 from django.core.handlers.wsgi import WSGIRequest
 from django.db import transaction
-from django.http import Http404, HttpResponse
+from django.http import Http404, HttpResponse, StreamingHttpResponse
 
-from django_ca import __version__
+from django_ca import __version__, ca_settings
 from django_ca.api.auth import BasicAuth
 from django_ca.api.errors import Forbidden
 from django_ca.api.schemas import (
     CertificateAuthorityFilterSchema,
     CertificateAuthoritySchema,
     CertificateAuthorityUpdateSchema,
+    CertificateExportFilterSchema,
     CertificateFilterSchema,
+    CertificateListFilterSchema,
     CertificateOrderSchema,
     CertificateSchema,
     RevokeCertificateSchema,
 )
 from django_ca.api.utils import get_certificate_authority
+from django_ca.export import EXPORT_CONTENT_TYPES, export_certificates as export_certificates_iterator
 from django_ca.models import Certificate, CertificateAuthority, CertificateOrder
 from django_ca.pydantic.messages import SignCertificateMessage
 from django_ca.querysets import CertificateAuthorityQuerySet, CertificateQuerySet
@@ -162,6 +165,16 @@ def get_certificate_order(request: WSGIRequest, serial: str, slug: str) -> Certi
     )
 
 
+def _filter_certificates(ca: CertificateAuthority, filters: CertificateFilterSchema) -> CertificateQuerySet:
+    """Get certificates of the given CA, filtered by the given filters."""
+    qs = Certificate.objects.filter(ca=ca).listed(
+        expired=filters.expired, revoked=filters.revoked, autogenerated=filters.autogenerated
+    )
+    if filters.profile is not None:
+        qs = qs.filter(profile=filters.profile)
+    return qs
+
+
 @api.get(
     "/ca/{serial:serial}/certs/",
     response=list[CertificateSchema],
@@ -171,23 +184,61 @@ def get_certificate_order(request: WSGIRequest, serial: str, slug: str) -> Certi
 )
 def list_certificates(
     request: WSGIRequest,
+    response: HttpResponse,
     serial: str,
-    filters: CertificateFilterSchema = Query(...),  # type: ignore[type-arg]  # noqa: B008
-) -> CertificateQuerySet:
-    """Retrieve certificates signed by the certificate authority named by `serial`."""
+    filters: CertificateListFilterSchema = Query(...),  # type: ignore[type-arg]  # noqa: B008
+) -> list[Certificate]:
+    """Retrieve certificates signed by the certificate authority named by `serial`.
+
+    Certificates are returned in pages of up to `limit` certificates. If there are more certificates, the
+    response has a `Link` header with the URL of the next page (`rel="next"`).
+    """
     ca = get_certificate_authority(serial, expired=True)  # You can list certificates of expired CAs
-    qs = Certificate.objects.filter(ca=ca)
+    qs = _filter_certificates(ca, filters)
+    if filters.cursor is not None:
+        qs = qs.filter(pk__gt=filters.cursor)
 
-    if filters.expired is False:
-        qs = qs.currently_valid()
-    if filters.autogenerated is False:
-        qs = qs.exclude(autogenerated=True)
-    if filters.revoked is False:
-        qs = qs.exclude(revoked=True)
-    if filters.profile is not None:
-        qs = qs.filter(profile=filters.profile)
+    # Use keyset pagination on the primary key, so that the cost of a request does not depend on the page.
+    # One more certificate than requested is fetched to know if there is a next page.
+    limit = min(filters.limit or ca_settings.CA_API_PAGE_SIZE, ca_settings.CA_API_MAX_PAGE_SIZE)
+    qs = qs.only("created", "updated", "pub", "serial", "revoked", "autogenerated", "profile")
+    certs = list(qs.order_by("pk")[: limit + 1])
 
-    return qs
+    if len(certs) > limit:
+        certs = certs[:limit]
+        query = request.GET.copy()
+        query["cursor"] = str(certs[-1].pk)
+        next_url = request.build_absolute_uri(f"{request.path}?{query.urlencode()}")
+        response["Link"] = f'<{next_url}>; rel="next"'
+
+    return certs
+
+
+@api.get(
+    "/ca/{serial:serial}/certs/export/",
+    auth=BasicAuth("django_ca.view_certificate"),
+    summary="Export certificates",
+    tags=["Certificates"],
+)
+def export_certificates(
+    request: WSGIRequest,
+    serial: str,
+    filters: CertificateExportFilterSchema = Query(...),  # type: ignore[type-arg]  # noqa: B008
+) -> StreamingHttpResponse:
+    """Export all certificates signed by the certificate authority named by `serial`.
+
+    Unlike the list endpoint, this endpoint is not paginated: The response is streamed as newline-delimited
+    JSON (one object per certificate) or CSV, depending on `format`.
+    """
+    ca = get_certificate_authority(serial, expired=True)  # You can export certificates of expired CAs
+    qs = _filter_certificates(ca, filters)
+
+    response = StreamingHttpResponse(
+        export_certificates_iterator(qs, filters.format, pem=filters.pem),
+        content_type=EXPORT_CONTENT_TYPES[filters.format],
+    )
+    response["Content-Disposition"] = f'attachment; filename="{ca.serial}.{filters.format}"'
+    return response
 
 
 @api.get(
@@ -15,7 +15,7 @@
 
 import abc
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 
 from ninja import Field, ModelSchema, Schema
 from pydantic import field_serializer
@@ -212,6 +212,31 @@ class CertificateFilterSchema(Schema):
     revoked: bool = Field(default=False, description="Include revoked certificates.")
 
 
+class CertificateListFilterSchema(CertificateFilterSchema):
+    """Filter schema for listing certificates."""
+
+    cursor: Optional[int] = Field(
+        default=None,
+        description="Only return certificates after the given cursor. Use the `Link` header of the previous "
+        "page instead of setting this value yourself.",
+    )
+    limit: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Return at most the given number of certificates. The default and the maximum are "
+        "configured by the CA_API_PAGE_SIZE and CA_API_MAX_PAGE_SIZE settings.",
+    )
+
+
+class CertificateExportFilterSchema(CertificateFilterSchema):
+    """Filter schema for exporting certificates."""
+
+    format: Literal["ndjson", "csv"] = Field(
+        default="ndjson", description="Export certificates as newline-delimited JSON or as CSV."
+    )
+    pem: bool = Field(default=False, description="Include the PEM-encoded certificate.")
+
+
 class RevokeCertificateSchema(Schema):
     """Schema for revoking certificates."""
 
@@ -31,5 +31,8 @@ class DjangoCAConfig(AppConfig):
     verbose_name = _("Certificate Authority")
 
     def ready(self) -> None:
-        # pylint: disable-next=import-outside-toplevel  # that's how checks work
-        from django_ca import checks  # NOQA: F401  # import already registers the checks
+        # pylint: disable-next=import-outside-toplevel  # that's how checks and receivers work
+        from django_ca import (
+            checks,  # NOQA: F401  # import already registers the checks
+            receivers,  # NOQA: F401  # import already connects the receivers
+        )
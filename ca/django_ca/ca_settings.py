@@ -113,6 +113,14 @@ def _get_hash_algorithm(setting: str, default: "HashAlgorithms") -> "AllowedHash
         raise ImproperlyConfigured(f"{setting}: {raw_value}: Unknown hash algorithm.") from ex2
 
 
+def _get_acme_rate_limits() -> dict[str, tuple[int, int]]:
+    rate_limits: dict[str, tuple[int, int]] = getattr(settings, "CA_ACME_RATE_LIMITS", {})
+    for scope in rate_limits:
+        if scope not in ("account", "ca", "domain"):
+            raise ImproperlyConfigured(f"CA_ACME_RATE_LIMITS: {scope}: Unknown rate limit.")
+    return rate_limits
+
+
 CA_DEFAULT_KEY_SIZE: int = getattr(settings, "CA_DEFAULT_KEY_SIZE", 4096)
 
 CA_PROFILES: dict[str, dict[str, Any]] = {
@@ -309,6 +317,21 @@ ACME_ORDER_VALIDITY: timedelta = getattr(settings, "CA_ACME_ORDER_VALIDITY", tim
 ACME_ACCOUNT_REQUIRES_CONTACT = getattr(settings, "CA_ACME_ACCOUNT_REQUIRES_CONTACT", True)
 ACME_MAX_CERT_VALIDITY = getattr(settings, "CA_ACME_MAX_CERT_VALIDITY", timedelta(days=90))
 ACME_DEFAULT_CERT_VALIDITY = getattr(settings, "CA_ACME_DEFAULT_CERT_VALIDITY", timedelta(days=90))
+ACME_ACCOUNT_CACHE_TIMEOUT: int = getattr(settings, "CA_ACME_ACCOUNT_CACHE_TIMEOUT", 0)
+ACME_VALIDATION_CONCURRENCY: int = getattr(settings, "CA_ACME_VALIDATION_CONCURRENCY", 10)
+ACME_VALIDATION_TIMEOUT: int = getattr(settings, "CA_ACME_VALIDATION_TIMEOUT", 1)
+ACME_VALIDATE_ORDERS: bool = getattr(settings, "CA_ACME_VALIDATE_ORDERS", False)
+ACME_DIRECTORY_CACHE_TIMEOUT: int = getattr(settings, "CA_ACME_DIRECTORY_CACHE_TIMEOUT", 300)
+ACME_RATE_LIMITS: dict[str, tuple[int, int]] = _get_acme_rate_limits()
+ACME_ISSUANCE_QUEUE: bool = getattr(settings, "CA_ACME_ISSUANCE_QUEUE", False)
+ACME_ISSUANCE_CONCURRENCY: int = getattr(settings, "CA_ACME_ISSUANCE_CONCURRENCY", 1)
+ACME_ISSUANCE_RENEWAL_WINDOW: timedelta = getattr(
+    settings, "CA_ACME_ISSUANCE_RENEWAL_WINDOW", timedelta(days=7)
+)
+if ACME_ISSUANCE_CONCURRENCY < 1:
+    raise ImproperlyConfigured(
+        f"CA_ACME_ISSUANCE_CONCURRENCY: {ACME_ISSUANCE_CONCURRENCY}: Must be at least 1."
+    )
 
 CA_MIN_KEY_SIZE = getattr(settings, "CA_MIN_KEY_SIZE", 2048)
 
@@ -330,6 +353,8 @@ if isinstance(ACME_DEFAULT_CERT_VALIDITY, int):
     ACME_DEFAULT_CERT_VALIDITY = timedelta(days=ACME_DEFAULT_CERT_VALIDITY)
 if isinstance(ACME_ORDER_VALIDITY, int):
     ACME_ORDER_VALIDITY = timedelta(days=ACME_ORDER_VALIDITY)
+if isinstance(ACME_ISSUANCE_RENEWAL_WINDOW, int):
+    ACME_ISSUANCE_RENEWAL_WINDOW = timedelta(days=ACME_ISSUANCE_RENEWAL_WINDOW)
 if CA_DEFAULT_EXPIRES <= timedelta():
     raise ImproperlyConfigured(f"CA_DEFAULT_EXPIRES: {CA_DEFAULT_EXPIRES}: Must have positive value")
 
@@ -371,6 +396,11 @@ CA_FILE_STORAGE_KWARGS = getattr(
 )
 
 CA_ENABLE_REST_API: bool = getattr(settings, "CA_ENABLE_REST_API", False)
+CA_API_AUTH_CACHE_TIMEOUT: int = getattr(settings, "CA_API_AUTH_CACHE_TIMEOUT", 0)
+CA_API_PAGE_SIZE: int = getattr(settings, "CA_API_PAGE_SIZE", 100)
+CA_API_MAX_PAGE_SIZE: int = getattr(settings, "CA_API_MAX_PAGE_SIZE", 1000)
+CA_ENABLE_OCSP_RESPONSE_CACHE: bool = getattr(settings, "CA_ENABLE_OCSP_RESPONSE_CACHE", False)
+CA_ENABLE_CRL_STORAGE: bool = getattr(settings, "CA_ENABLE_CRL_STORAGE", True)
 
 # CA_OCSP_RESPONDER_CERTIFICATE_RENEWAL was added in 1.26.0
 CA_OCSP_RESPONDER_CERTIFICATE_RENEWAL: Union[timedelta] = getattr(
@@ -0,0 +1,134 @@
+# This file is part of django-ca (https://github.com/mathiasertl/django-ca).
+#
+# django-ca is free software: you can redistribute it and/or modify it under the terms of the GNU General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# django-ca is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the
+# implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License
+# for more details.
+#
+# You should have received a copy of the GNU General Public License along with django-ca. If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""Export certificates in bulk (used by the REST API and :command:`manage.py export_certs`)."""
+
+import csv
+import json
+from collections.abc import Iterator
+from datetime import datetime
+from typing import Literal, Union
+
+from cryptography import x509
+
+from django.utils import timezone
+
+from django_ca.models import Certificate
+from django_ca.querysets import CertificateQuerySet
+from django_ca.utils import format_general_name
+
+ExportFormats = Literal["ndjson", "csv"]
+
+#: Content types for export formats.
+EXPORT_CONTENT_TYPES: dict[ExportFormats, str] = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+#: Fields of every exported certificate (``pem`` is only included if requested).
+EXPORT_FIELDS = (
+    "serial",
+    "cn",
+    "subject_alternative_names",
+    "not_before",
+    "not_after",
+    "status",
+    "profile",
+    "ca",
+)
+
+
+class _Echo:
+    """Pseudo-buffer for :py:func:`csv.writer` that returns written values instead of storing them."""
+
+    def write(self, value: str) -> str:
+        """Return the written value."""
+        return value
+
+
+def get_status(cert: Certificate, now: datetime) -> str:
+    """Get the status of a certificate ("revoked", "expired", "not yet valid" or "valid")."""
+    if cert.revoked:
+        return "revoked"
+    if cert.expires <= now:
+        return "expired"
+    if cert.valid_from > now:
+        return "not yet valid"
+    return "valid"
+
+
+def get_row(cert: Certificate, now: datetime, pem: bool = False) -> dict[str, Union[str, list[str]]]:
+    """Get the exported data of a single certificate.
+
+    The certificate must have been loaded together with the serial of its certificate authority.
+    """
+    if cert.fingerprint_sha256:  # metadata is populated, so the certificate does not have to be loaded
+        names = cert.subject_alternative_names.split("\n") if cert.subject_alternative_names else []
+    else:
+        try:
+            san = cert.pub.loaded.extensions.get_extension_for_class(x509.SubjectAlternativeName).value
+            names = [format_general_name(name) for name in san]
+        except x509.ExtensionNotFound:
+            names = []
+
+    row: dict[str, Union[str, list[str]]] = {
+        "serial": cert.serial,
+        "cn": cert.cn,
+        "subject_alternative_names": names,
+        "not_before": cert.valid_from.isoformat(),
+        "not_after": cert.expires.isoformat(),
+        "status": get_status(cert, now),
+        "profile": cert.profile,
+        "ca": cert.ca.serial,
+    }
+    if pem:
+        row["pem"] = cert.pub.pem
+    return row
+
+
+def export_certificates(
+    queryset: CertificateQuerySet,
+    export_format: ExportFormats = "ndjson",
+    pem: bool = False,
+    chunk_size: int = 1000,
+) -> Iterator[str]:
+    """Export certificates as NDJSON (one JSON object per line) or CSV (including a header line).
+
+    Certificates are fetched from the database in chunks of `chunk_size` certificates using
+    :py:meth:`~django.db.models.query.QuerySet.iterator`, so memory usage does not depend on the number of
+    exported certificates. The function yields one line at a time.
+    """
+    fields = (*EXPORT_FIELDS, "pem") if pem else EXPORT_FIELDS
+    loaded = [
+        "serial",
+        "cn",
+        "pub",
+        "valid_from",
+        "expires",
+        "revoked",
+        "profile",
+        "fingerprint_sha256",
+        "subject_alternative_names",
+        "ca__serial",
+    ]
+    queryset = queryset.select_related("ca").only(*loaded).order_by("pk")
+
+    now = timezone.now()
+    rows = (get_row(cert, now, pem=pem) for cert in queryset.iterator(chunk_size=chunk_size))
+
+    if export_format == "ndjson":
+        for row in rows:
+            yield json.dumps(row) + "\n"
+    else:
+        writer = csv.writer(_Echo())
+        yield writer.writerow(fields)
+        for row in rows:
+            row["subject_alternative_names"] = ",".join(row["subject_alternative_names"])
+            yield writer.writerow([row[field] for field in fields])
@@ -16,6 +16,7 @@
 import abc
 import typing
 from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from threading import local
 from typing import Any, Optional
@@ -276,6 +277,21 @@ class KeyBackend(
     ) -> x509.CertificateRevocationList:
         """Sign a certificate revocation list request."""
 
+    @contextmanager
+    def keep_key_loaded(
+        self,
+        ca: "CertificateAuthority",  # pylint: disable=unused-argument
+        use_private_key_options: UsePrivateKeyOptionsTypeVar,  # pylint: disable=unused-argument
+    ) -> Iterator[None]:
+        """Context manager indicating that the private key of `ca` is about to be used many times.
+
+        Backends can implement this method to load the private key only once, e.g. when signing many
+        certificates at once. The default implementation does nothing.
+
+        .. versionadded:: 1.29.0
+        """
+        yield
+
     def get_ocsp_key_size(
         self,
         ca: "CertificateAuthority",  # pylint: disable=unused-argument
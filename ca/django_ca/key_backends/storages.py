@@ -13,7 +13,11 @@
 
 """Storages."""
 
+import hashlib
+import time
 import typing
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Annotated, Any, Optional
@@ -50,6 +54,11 @@ from django_ca.utils import generate_private_key, get_cert_builder
 if typing.TYPE_CHECKING:
     from django_ca.models import CertificateAuthority
 
+# Cache of loaded private keys in the current process, see StoragesBackend.get_key(). Keys are tuples of the
+# storage alias, the CA serial and a fingerprint of the password, values are tuples of the path, the time
+# (as returned by time.monotonic()) when the key was loaded and the private key itself.
+_LOADED_KEYS: dict[tuple[str, str, str], tuple[str, float, CertificateIssuerPrivateKeyTypes]] = {}
+
 
 class CreatePrivateKeyOptions(BaseModel):
     """Options for initializing private keys."""
@@ -121,7 +130,7 @@ class StoragesBackend(KeyBackend[CreatePrivateKeyOptions, StorePrivateKeyOptions
     `django-storages <https://django-storages.readthedocs.io/en/latest/>`_.
 
 
-    This backend takes a single option, ``storage_alias``. It defines the storage system (as defined in
+    This backend takes the ``storage_alias`` option. It defines the storage system (as defined in
     `STORAGES <https://docs.djangoproject.com/en/5.0/ref/settings/#std-setting-STORAGES>`_) to use.
     The default configuration is a good example:
 
@@ -135,6 +144,15 @@ class StoragesBackend(KeyBackend[CreatePrivateKeyOptions, StorePrivateKeyOptions
        .. literalinclude:: /include/config/settings_default_ca_key_backends.yaml
           :language: YAML
 
+    The optional ``key_cache_timeout`` option enables caching of loaded (and decrypted) private keys in the
+    memory of the current process for the given number of seconds. This way, signing many certificates or
+    CRLs does not need to read and decrypt the private key every time. The cache is disabled by default
+    (``0``), since the unencrypted private key is kept in memory for longer.
+
+    .. versionadded:: 1.29.0
+
+       The ``key_cache_timeout`` option was added.
+
     .. seealso::
 
        * `STORAGES setting <https://docs.djangoproject.com/en/5.0/ref/settings/#std-setting-STORAGES>`_
@@ -151,11 +169,17 @@ class StoragesBackend(KeyBackend[CreatePrivateKeyOptions, StorePrivateKeyOptions
 
     # Backend options
     storage_alias: str
+    key_cache_timeout: int
 
-    def __init__(self, alias: str, storage_alias: str) -> None:
+    def __init__(self, alias: str, storage_alias: str, key_cache_timeout: int = 0) -> None:
         if storage_alias not in settings.STORAGES:
             raise ValueError(f"{alias}: {storage_alias}: Storage alias is not configured.")
-        super().__init__(alias, storage_alias=storage_alias)
+        if key_cache_timeout < 0:
+            raise ValueError(f"{alias}: {key_cache_timeout}: key_cache_timeout must not be negative.")
+        super().__init__(alias, storage_alias=storage_alias, key_cache_timeout=key_cache_timeout)
+
+        # Keys kept loaded by keep_key_loaded()
+        self._kept_keys: dict[tuple[str, str], tuple[str, CertificateIssuerPrivateKeyTypes]] = {}
 
     def __eq__(self, other: Any) -> bool:
         return isinstance(other, StoragesBackend) and self.storage_alias == other.storage_alias
@@ -259,6 +283,7 @@ class StoragesBackend(KeyBackend[CreatePrivateKeyOptions, StorePrivateKeyOptions
 
         # Update model instance
         ca.key_backend_options = {"path": path}
+        self.clear_key_cache(ca)
 
         use_private_key_options = UsePrivateKeyOptions.model_validate(
             {"password": options.password}, context={"ca": ca}
@@ -288,13 +313,70 @@ class StoragesBackend(KeyBackend[CreatePrivateKeyOptions, StorePrivateKeyOptions
 
         # Update model instance
         ca.key_backend_options = {"path": path}
+        self.clear_key_cache(ca)
+
+    def clear_key_cache(self, ca: Optional["CertificateAuthority"] = None) -> None:
+        """Remove private keys loaded by this backend from the cache of the current process.
+
+        If `ca` is given, only private keys for the given certificate authority are removed. Keys are removed
+        automatically when a new private key is stored by this backend, but you have to call this function if
+        you replace the private key of a certificate authority in some other way (e.g. when rotating keys
+        manually) and use the ``key_cache_timeout`` option.
+        """
+        for cache_key in list(_LOADED_KEYS):
+            if cache_key[0] == self.storage_alias and (ca is None or cache_key[1] == ca.serial):
+                _LOADED_KEYS.pop(cache_key, None)
+
+    def _get_password_fingerprint(self, use_private_key_options: UsePrivateKeyOptions) -> str:
+        password = use_private_key_options.password
+        if password is None:
+            return ""
+        return hashlib.sha256(password).hexdigest()
+
+    @contextmanager
+    def keep_key_loaded(
+        self, ca: "CertificateAuthority", use_private_key_options: UsePrivateKeyOptions
+    ) -> Iterator[None]:
+        """Load the private key only once while signing many certificates."""
+        kept_key = (ca.serial, self._get_password_fingerprint(use_private_key_options))
+        if kept_key in self._kept_keys:  # already kept loaded by an outer context
+            yield
+            return
+
+        path = ca.key_backend_options["path"]
+        self._kept_keys[kept_key] = (path, self.get_key(ca, use_private_key_options))
+        try:
+            yield
+        finally:
+            self._kept_keys.pop(kept_key, None)
 
     def get_key(
         self, ca: "CertificateAuthority", use_private_key_options: UsePrivateKeyOptions
     ) -> CertificateIssuerPrivateKeyTypes:
         """The CAs private key as private key."""
-        storage = storages[self.storage_alias]
         path = ca.key_backend_options["path"]
+        fingerprint = self._get_password_fingerprint(use_private_key_options)
+        kept = self._kept_keys.get((ca.serial, fingerprint))
+        if kept is not None and kept[0] == path:
+            return kept[1]
+
+        if self.key_cache_timeout <= 0:
+            return self._load_key(path, use_private_key_options)
+
+        cache_key = (self.storage_alias, ca.serial, fingerprint)
+        now = time.monotonic()
+        cached = _LOADED_KEYS.get(cache_key)
+        if cached is not None and cached[0] == path and now - cached[1] < self.key_cache_timeout:
+            return cached[2]
+
+        key = self._load_key(path, use_private_key_options)
+        _LOADED_KEYS[cache_key] = (path, now, key)
+        return key
+
+    def _load_key(
+        self, path: str, use_private_key_options: UsePrivateKeyOptions
+    ) -> CertificateIssuerPrivateKeyTypes:
+        storage = storages[self.storage_alias]
 
         # Load encoded private key data from the filesystem
         stream = storage.open(path, mode="rb")
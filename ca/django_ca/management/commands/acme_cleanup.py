@@ -0,0 +1,58 @@
+# This file is part of django-ca (https://github.com/mathiasertl/django-ca).
+#
+# django-ca is free software: you can redistribute it and/or modify it under the terms of the GNU General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# django-ca is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the
+# implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License
+# for more details.
+#
+# You should have received a copy of the GNU General Public License along with django-ca. If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""Management command to remove expired ACME orders.
+
+.. seealso:: https://docs.djangoproject.com/en/dev/howto/custom-management-commands/
+"""
+
+import argparse
+from typing import Any
+
+from django.core.management.base import CommandError
+
+from django_ca.management.base import BaseCommand
+from django_ca.models import AcmeOrder
+
+
+class Command(BaseCommand):
+    """Implement the :command:`manage.py acme_cleanup` command."""
+
+    help = "Remove expired ACME orders (including authorizations, challenges and certificates)."
+
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            metavar="N",
+            help="Delete N orders per transaction (default: %(default)s).",
+        )
+        parser.add_argument(
+            "-q", "--quiet", action="store_true", default=False, help="Do not print progress."
+        )
+
+    def handle(self, batch_size: int, quiet: bool, **options: Any) -> None:
+        if batch_size < 1:
+            raise CommandError("--batch-size must be at least 1.")
+
+        label = AcmeOrder._meta.label
+        orders = total = 0
+        for deleted, counts in AcmeOrder.objects.expired().delete_in_batches(batch_size):
+            orders += counts[label]
+            total += deleted
+            if not quiet:
+                self.stdout.write(f"Deleted {orders} orders ({total} objects) so far...")
+
+        if not quiet:
+            self.stdout.write(f"Deleted {orders} expired orders ({total} objects).")
@@ -0,0 +1,73 @@
+# This file is part of django-ca (https://github.com/mathiasertl/django-ca).
+#
+# django-ca is free software: you can redistribute it and/or modify it under the terms of the GNU General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# django-ca is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the
+# implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License
+# for more details.
+#
+# You should have received a copy of the GNU General Public License along with django-ca. If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""Management command to issue queued ACME certificates.
+
+.. seealso:: https://docs.djangoproject.com/en/dev/howto/custom-management-commands/
+"""
+
+import argparse
+import time
+from typing import Any
+
+from django.core.management.base import CommandError
+
+from django_ca import ca_settings
+from django_ca.management.base import BaseCommand
+from django_ca.tasks import acme_issue_queued_certificates
+
+
+class Command(BaseCommand):
+    """Implement the :command:`manage.py acme_issuance_worker` command."""
+
+    help = "Issue queued ACME certificates (requires CA_ACME_ISSUANCE_QUEUE = True)."
+
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10,
+            metavar="N",
+            help="Claim up to N certificates per CA at a time (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=1.0,
+            metavar="SECONDS",
+            help="Wait SECONDS seconds before checking again if the queue was empty (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--once", action="store_true", default=False, help="Exit once the queue is empty."
+        )
+        parser.add_argument(
+            "-q", "--quiet", action="store_true", default=False, help="Do not print progress."
+        )
+
+    def handle(self, batch_size: int, interval: float, once: bool, quiet: bool, **options: Any) -> None:
+        if batch_size < 1:
+            raise CommandError("--batch-size must be at least 1.")
+        if interval < 0:
+            raise CommandError("--interval must not be negative.")
+        if not ca_settings.CA_ENABLE_ACME:
+            raise CommandError("ACME is not enabled.")
+
+        while True:
+            issued = acme_issue_queued_certificates(batch_size=batch_size)
+            if issued and not quiet:
+                self.stdout.write(f"Issued {issued} certificates.")
+
+            if not issued:
+                if once:
+                    return
+                time.sleep(interval)
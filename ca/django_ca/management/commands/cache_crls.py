@@ -17,10 +17,31 @@
 """
 
 import argparse
-from typing import Any
+import time
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Optional
+
+import django
+from django.core.management.base import CommandError
+from django.db import connections
 
 from django_ca.management.base import BaseCommand
-from django_ca.tasks import cache_crls, run_task
+from django_ca.models import CertificateAuthority
+from django_ca.tasks import cache_crl, cache_crls, run_task
+
+
+def _cache_crl(serial: str, delta: bool) -> tuple[str, float, Optional[str]]:
+    """Cache CRLs for a single CA, returning the serial, the elapsed time and an optional error message.
+
+    This function is module-level so that it can be passed to a process pool.
+    """
+    start = time.monotonic()
+    try:
+        cache_crl(serial, delta=delta)
+    except Exception as ex:  # pylint: disable=broad-exception-caught
+        return serial, time.monotonic() - start, str(ex)
+    return serial, time.monotonic() - start, None
 
 
 class Command(BaseCommand):
@@ -34,6 +55,48 @@ class Command(BaseCommand):
             nargs="*",
             help="Generate CRLs for the given CAs. If omitted, generate CRLs for all CAs.",
         )
+        parser.add_argument(
+            "--delta",
+            action="store_true",
+            default=False,
+            help="Only generate delta CRLs (for CRL profiles that enable delta CRLs).",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            metavar="N",
+            help="Generate CRLs locally using N processes (one CA per process) and print timings. By "
+            "default, CRLs are generated by a Celery task (if Celery is enabled).",
+        )
+
+    def cache_crls(self, serials: list[str], delta: bool, workers: int) -> None:
+        """Generate CRLs for the given CAs in up to `workers` processes."""
+        if not serials:
+            serials = list(CertificateAuthority.objects.usable().values_list("serial", flat=True))
+
+        start = time.monotonic()
+        results: Iterable[tuple[str, float, Optional[str]]]
+        if workers == 1:
+            results = [_cache_crl(serial, delta) for serial in serials]
+        else:
+            # Database connections must not be shared with forked child processes.
+            connections.close_all()
+            with ProcessPoolExecutor(max_workers=workers, initializer=django.setup) as executor:
+                results = list(executor.map(_cache_crl, serials, [delta] * len(serials)))
+
+        for serial, elapsed, error in results:
+            if error is None:
+                self.stdout.write(f"{serial}: {elapsed:.3f}s")
+            else:
+                self.stderr.write(self.style.ERROR(f"{serial}: {error}"))
+        total = time.monotonic() - start
+        self.stdout.write(f"Generated CRLs for {len(serials)} CA(s) in {total:.3f}s ({workers} worker(s)).")
+
+    def handle(self, serial: list[str], delta: bool, workers: Optional[int], **options: Any) -> None:
+        if workers is None:
+            run_task(cache_crls, serial, delta=delta)
+            return
+        if workers < 1:
+            raise CommandError("--workers must be at least 1.")
 
-    def handle(self, serial: list[str], **options: Any) -> None:
-        run_task(cache_crls, serial)
+        self.cache_crls(serial, delta, workers)
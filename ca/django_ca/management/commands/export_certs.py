@@ -0,0 +1,84 @@
+# This file is part of django-ca (https://github.com/mathiasertl/django-ca).
+#
+# django-ca is free software: you can redistribute it and/or modify it under the terms of the GNU General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# django-ca is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the
+# implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License
+# for more details.
+#
+# You should have received a copy of the GNU General Public License along with django-ca. If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""Management command to export certificates as newline-delimited JSON or CSV.
+
+.. seealso:: https://docs.djangoproject.com/en/dev/howto/custom-management-commands/
+"""
+
+from typing import Any, Optional
+
+from django.core.management.base import CommandError, CommandParser
+
+from django_ca.export import ExportFormats, export_certificates
+from django_ca.management.base import BaseCommand
+from django_ca.models import Certificate, CertificateAuthority
+
+
+class Command(BaseCommand):
+    """Implement the :command:`manage.py export_certs` command."""
+
+    help = "Export certificates as newline-delimited JSON or CSV."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        self.add_ca(parser, no_default=True, help_text="Only export certificates by the named authority.")
+        parser.add_argument(
+            "--format",
+            dest="export_format",
+            choices=["ndjson", "csv"],
+            default="ndjson",
+            help="Export format (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--pem", default=False, action="store_true", help="Include the PEM-encoded certificate."
+        )
+        parser.add_argument(
+            "--expired", default=False, action="store_true", help="Also export expired certificates."
+        )
+        parser.add_argument(
+            "--autogenerated",
+            default=False,
+            action="store_true",
+            help="Also export automatically generated certificates.",
+        )
+        parser.add_argument(
+            "--revoked", default=False, action="store_true", help="Also export revoked certificates."
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            metavar="N",
+            help="Load N certificates from the database at a time (default: %(default)s).",
+        )
+
+    def handle(
+        self,
+        ca: Optional[CertificateAuthority],
+        export_format: ExportFormats,
+        pem: bool,
+        expired: bool,
+        revoked: bool,
+        autogenerated: bool,
+        chunk_size: int,
+        **options: Any,
+    ) -> None:
+        if chunk_size < 1:
+            raise CommandError("--chunk-size must be at least 1.")
+
+        certs = Certificate.objects.listed(expired=expired, revoked=revoked, autogenerated=autogenerated)
+        if ca is not None:
+            certs = certs.filter(ca=ca)
+
+        for line in export_certificates(certs, export_format, pem=pem, chunk_size=chunk_size):
+            self.stdout.write(line, ending="")
@@ -0,0 +1,170 @@
+# This file is part of django-ca (https://github.com/mathiasertl/django-ca).
+#
+# django-ca is free software: you can redistribute it and/or modify it under the terms of the GNU General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# django-ca is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the
+# implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License
+# for more details.
+#
+# You should have received a copy of the GNU General Public License along with django-ca. If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""Management command to sign many certificates at once.
+
+.. seealso:: https://docs.djangoproject.com/en/dev/howto/custom-management-commands/
+"""
+
+import re
+import sys
+from collections.abc import Iterator
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Optional
+
+from pydantic import ValidationError
+
+from cryptography import x509
+
+from django.core.management.base import CommandError, CommandParser
+
+from django_ca import ca_settings
+from django_ca.management import actions
+from django_ca.management.base import BaseSignCertCommand
+from django_ca.models import Certificate, CertificateAuthority
+from django_ca.profiles import profiles
+from django_ca.typehints import AllowedHashTypes
+
+PEM_CSR_REGEX = re.compile(
+    rb"-----BEGIN CERTIFICATE REQUEST-----.+?-----END CERTIFICATE REQUEST-----", flags=re.DOTALL
+)
+
+
+class Command(BaseSignCertCommand):
+    """Implement the :command:`manage.py sign_certs` command."""
+
+    help = f"""Sign many CSRs at once and output the signed certificates. The subject of each certificate
+is taken from the CSR. The defaults depend on the configured default profile, currently
+{ca_settings.CA_DEFAULT_PROFILE}."""
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "path",
+            nargs="*",
+            type=Path,
+            help="Files or directories with CSRs (in PEM or DER format). PEM-encoded files may contain "
+            "multiple CSRs. If omitted, PEM-encoded CSRs are read from standard input.",
+        )
+
+        general_group = parser.add_argument_group("General")
+        self.add_algorithm(general_group)
+        self.add_ca(general_group)
+        general_group.add_argument(
+            "--expires",
+            action=actions.ExpiresAction,
+            help=f"Sign certificates for DAYS days (default: {ca_settings.CA_DEFAULT_EXPIRES})",
+        )
+        general_group.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            metavar="N",
+            help="Number of threads used for signing certificates (default: %(default)s).",
+        )
+        general_group.add_argument(
+            "--out-dir",
+            type=Path,
+            metavar="DIR",
+            help="Write certificates to DIR (named by their serial). If omitted, print to stdout.",
+        )
+        self.add_use_private_key_arguments(parser)
+        self.add_profile(parser, "Sign certificates based on the given profile.")
+
+    def load_csrs(self, data: bytes) -> Iterator[x509.CertificateSigningRequest]:
+        """Load all CSRs from the given bytes (either multiple PEM-encoded CSRs or a single DER CSR)."""
+        if data.lstrip().startswith(b"-----BEGIN"):
+            for match in PEM_CSR_REGEX.finditer(data):
+                yield x509.load_pem_x509_csr(match.group(0))
+        elif data:
+            yield x509.load_der_x509_csr(data)
+
+    def read_csrs(self, paths: list[Path]) -> list[x509.CertificateSigningRequest]:
+        """Read all CSRs from the given files and directories (or stdin, if no paths are given)."""
+        files: list[Path] = []
+        for path in paths:
+            if path.is_dir():
+                files += sorted(child for child in path.iterdir() if child.is_file())
+            else:
+                files.append(path)
+
+        csrs: list[x509.CertificateSigningRequest] = []
+        try:
+            if not paths:
+                csrs += self.load_csrs(sys.stdin.buffer.read())
+            for file in files:
+                csrs += self.load_csrs(file.read_bytes())
+        except (OSError, ValueError) as ex:
+            source = file if paths else "stdin"
+            raise CommandError(f"{source}: Could not read CSR: {ex}") from ex
+        return csrs
+
+    def handle(
+        self,
+        path: list[Path],
+        ca: CertificateAuthority,
+        expires: Optional[timedelta],
+        profile: Optional[str],
+        algorithm: Optional[AllowedHashTypes],
+        workers: int,
+        out_dir: Optional[Path],
+        **options: Any,
+    ) -> None:
+        if workers < 1:
+            raise CommandError("--workers must be at least 1.")
+
+        # Validate parameters early so that we can return better feedback to the user.
+        profile_obj = profiles[profile]
+        self.verify_certificate_authority(ca=ca, expires=expires, profile=profile_obj)
+
+        # Get key backend options
+        try:
+            key_backend_options = ca.key_backend.get_use_private_key_options(ca, options)
+        except ValidationError as ex:
+            self.validation_error_to_command_error(ex)
+
+        # Check if the private key is usable
+        try:
+            ca.check_usable(key_backend_options)
+        except ValueError as ex:
+            raise CommandError(*ex.args) from ex
+
+        # Get/validate signature hash algorithm
+        algorithm = self.get_hash_algorithm(ca.key_type, algorithm, ca.algorithm)
+
+        csrs = self.read_csrs(path)
+        if not csrs:
+            raise CommandError("No CSRs found.")
+
+        try:
+            certs = Certificate.objects.create_certs(
+                ca,
+                key_backend_options,
+                csrs,
+                profile=profile_obj,
+                expires=expires,
+                algorithm=algorithm,
+                workers=workers,
+            )
+        except Exception as ex:
+            raise CommandError(ex) from ex
+
+        if out_dir is None:
+            for cert in certs:
+                self.stdout.write(cert.pub.pem, ending="")
+            return
+
+        out_dir.mkdir(parents=True, exist_ok=True)
+        for cert in certs:
+            (out_dir / f"{cert.serial}.pem").write_text(cert.pub.pem, encoding="ascii")
+        self.stdout.write(f"Wrote {len(certs)} certificate(s) to {out_dir}.")
@@ -0,0 +1,61 @@
+# This file is part of django-ca (https://github.com/mathiasertl/django-ca).
+#
+# django-ca is free software: you can redistribute it and/or modify it under the terms of the GNU General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# django-ca is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the
+# implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License
+# for more details.
+#
+# You should have received a copy of the GNU General Public License along with django-ca. If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""Management command to populate the metadata fields of certificates and certificate authorities.
+
+.. seealso:: https://docs.djangoproject.com/en/dev/howto/custom-management-commands/
+"""
+
+from typing import Any
+
+from django.core.management.base import CommandError, CommandParser
+
+from django_ca.management.base import BaseCommand
+from django_ca.migration_helpers import update_certificate_metadata
+from django_ca.models import Certificate, CertificateAuthority
+
+
+class Command(BaseCommand):
+    """Implement the :command:`manage.py update_certificate_metadata` command."""
+
+    help = "Populate metadata fields (key type, fingerprint, ...) of certificates that do not have them yet."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--all",
+            dest="update_all",
+            default=False,
+            action="store_true",
+            help="Update all certificates, not just certificates without metadata.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            metavar="N",
+            help="Load and update N certificates at a time (default: %(default)s).",
+        )
+
+    def handle(self, update_all: bool, chunk_size: int, **options: Any) -> None:
+        if chunk_size < 1:
+            raise CommandError("--chunk-size must be at least 1.")
+
+        cas = CertificateAuthority.objects.all()
+        certs = Certificate.objects.all()
+        if update_all is False:
+            cas = cas.filter(fingerprint_sha256="")
+            certs = certs.filter(fingerprint_sha256="")
+
+        updated_cas = update_certificate_metadata(cas, chunk_size=chunk_size)
+        updated_certs = update_certificate_metadata(certs, chunk_size=chunk_size)
+        self.stdout.write(f"Updated {updated_cas} certificate authorities and {updated_certs} certificates.")
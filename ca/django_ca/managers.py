@@ -14,7 +14,9 @@
 """Django model managers."""
 
 import typing
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from typing import Any, Generic, Optional, TypeVar, Union
 
 from pydantic import BaseModel
@@ -22,7 +24,7 @@ from pydantic import BaseModel
 from cryptography import x509
 from cryptography.x509.oid import AuthorityInformationAccessOID, ExtensionOID
 
-from django.db import models
+from django.db import models, transaction
 from django.urls import reverse
 
 from django_ca import ca_settings, constants
@@ -31,7 +33,7 @@ from django_ca.key_backends.base import KeyBackend
 from django_ca.modelfields import LazyCertificateSigningRequest
 from django_ca.openssh import SshHostCaExtension, SshUserCaExtension
 from django_ca.profiles import Profile, profiles
-from django_ca.signals import post_create_ca, post_issue_cert, pre_create_ca
+from django_ca.signals import post_create_ca, post_issue_cert, post_issue_certs, pre_create_ca
 from django_ca.typehints import (
     AllowedHashTypes,
     Expires,
@@ -55,6 +57,8 @@ if typing.TYPE_CHECKING:
     from django_ca.querysets import (
         AcmeAccountQuerySet,
         AcmeAuthorizationQuerySet,
+        AcmeCertificateQuerySet,
+        AcmeOrderQuerySet,
         CertificateAuthorityQuerySet,
         CertificateQuerySet,
     )
@@ -549,11 +553,15 @@ class CertificateManager(
     if typing.TYPE_CHECKING:
         # See CertificateManagerMixin for description on this branch
         #
-        # pylint: disable=missing-function-docstring; just defining stubs here
+        # pylint: disable=missing-function-docstring,unused-argument; just defining stubs here
         def currently_valid(self) -> "CertificateQuerySet": ...
 
         def expired(self) -> "CertificateQuerySet": ...
 
+        def listed(
+            self, expired: bool = False, revoked: bool = False, autogenerated: bool = False
+        ) -> "CertificateQuerySet": ...
+
         def not_yet_valid(self) -> "CertificateQuerySet": ...
 
         def preferred_order(self) -> "CertificateQuerySet": ...
@@ -642,6 +650,120 @@ class CertificateManager(
 
         return obj
 
+    def _init_cert(
+        self,
+        ca: "CertificateAuthority",
+        csr: x509.CertificateSigningRequest,
+        cert: x509.Certificate,
+        profile: str,
+        autogenerated: bool,
+    ) -> "Certificate":
+        """Get an unsaved certificate model instance for a signed certificate."""
+        obj = self.model(ca=ca, csr=LazyCertificateSigningRequest(csr), profile=profile)
+        obj.autogenerated = autogenerated
+        obj.update_certificate(cert)
+        return obj
+
+    def create_certs(  # noqa: PLR0913
+        self,
+        ca: "CertificateAuthority",
+        key_backend_options: BaseModel,
+        csrs: Iterable[x509.CertificateSigningRequest],
+        profile: Optional[Profile] = None,
+        autogenerated: Optional[bool] = None,
+        expires: Expires = None,
+        algorithm: Optional[AllowedHashTypes] = None,
+        extensions: Optional[Iterable[x509.Extension[x509.ExtensionType]]] = None,
+        add_crl_url: Optional[bool] = None,
+        add_ocsp_url: Optional[bool] = None,
+        add_issuer_url: Optional[bool] = None,
+        add_issuer_alternative_name: Optional[bool] = None,
+        workers: int = 1,
+    ) -> list["Certificate"]:
+        """Create and sign many certificates at once based on the given profile.
+
+        This function works like :py:func:`~django_ca.managers.CertificateManager.create_cert`, but is
+        optimized for issuing a large number of certificates with the same certificate authority and profile:
+        The private key of the certificate authority is loaded only once, certificates can be signed in
+        multiple threads and all certificates are stored with a single bulk query in one transaction. If
+        signing any certificate fails, no certificate is stored.
+
+        Unlike :py:func:`~django_ca.managers.CertificateManager.create_cert`, the subject of each certificate
+        is taken from the respective CSR (merged with the subject of the profile, if any). Instead of
+        :py:attr:`~django_ca.signals.post_issue_cert`, the :py:attr:`~django_ca.signals.post_issue_certs`
+        signal is sent once for all certificates.
+
+        .. versionadded:: 1.29.0
+
+        Parameters
+        ----------
+        ca : :py:class:`~django_ca.models.CertificateAuthority`
+            The certificate authority to sign the certificates with.
+        key_backend_options : BaseModel
+            Transient parameters required for signing certificates with `ca` (e.g. a password).
+        csrs : list of :py:class:`~cg:cryptography.x509.CertificateSigningRequest`
+            The certificate signing requests to sign certificates for.
+        workers : int, optional
+            The number of threads used for signing certificates (default: ``1``).
+
+        All other parameters are passed to :py:func:`Profiles.create_cert()
+        <django_ca.profiles.Profile.create_cert>` for every certificate.
+
+        Returns
+        -------
+        list of :py:class:`~django_ca.models.Certificate`
+            The issued certificates, in the same order as `csrs`.
+        """
+        # Get the profile object if none was passed
+        if profile is None:
+            profile = profiles[None]
+        elif not isinstance(profile, Profile):
+            raise TypeError("profile must be of type django_ca.profiles.Profile.")
+        if workers < 1:
+            raise ValueError("workers must be at least 1.")
+        if autogenerated is None:
+            autogenerated = profile.autogenerated
+
+        csrs = list(csrs)
+        if extensions is not None:
+            extensions = list(extensions)  # we use this iterable for every certificate
+
+        # All certificates expire at the same time
+        parsed_expires = profile.get_expires(expires)
+
+        def sign(csr: x509.CertificateSigningRequest) -> x509.Certificate:
+            return profile.create_cert(
+                ca,
+                key_backend_options,
+                csr,
+                subject=csr.subject,
+                expires=parsed_expires,
+                algorithm=algorithm,
+                extensions=extensions,
+                add_crl_url=add_crl_url,
+                add_ocsp_url=add_ocsp_url,
+                add_issuer_url=add_issuer_url,
+                add_issuer_alternative_name=add_issuer_alternative_name,
+            )
+
+        with ca.key_backend.keep_key_loaded(ca, key_backend_options):
+            if workers == 1:
+                signed_certs = [sign(csr) for csr in csrs]
+            else:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    signed_certs = list(executor.map(sign, csrs))
+
+        objs = [
+            self._init_cert(ca, csr, cert, profile.name, autogenerated)
+            for csr, cert in zip(csrs, signed_certs)
+        ]
+        with transaction.atomic():
+            objs = self.bulk_create(objs)
+
+        post_issue_certs.send(sender=self.model, certs=objs)
+
+        return objs
+
 
 class AcmeAccountManager(AcmeAccountManagerBase):
     """Model manager for :py:class:`~django_ca.models.AcmeAccount`."""
@@ -657,6 +779,19 @@ class AcmeAccountManager(AcmeAccountManagerBase):
 class AcmeOrderManager(AcmeOrderManagerBase):
     """Model manager for :py:class:`~django_ca.models.AcmeOrder`."""
 
+    if typing.TYPE_CHECKING:
+        # See CertificateManagerMixin for description on this branch
+        #
+        # pylint: disable=missing-function-docstring,unused-argument; just defining stubs here
+
+        def account(self, account: "AcmeAccount") -> "AcmeOrderQuerySet": ...
+
+        def delete_in_batches(self, batch_size: int = 1000) -> Iterator[tuple[int, dict[str, int]]]: ...
+
+        def expired(self, grace: timedelta = timedelta(days=1)) -> "AcmeOrderQuerySet": ...
+
+        def viewable(self) -> "AcmeOrderQuerySet": ...
+
 
 class AcmeAuthorizationManager(AcmeAuthorizationManagerBase):
     """Model manager for :py:class:`~django_ca.models.AcmeAuthorization`."""
@@ -683,3 +818,18 @@ class AcmeChallengeManager(AcmeChallengeManagerBase):
 
 class AcmeCertificateManager(AcmeCertificateManagerBase):
     """Model manager for :py:class:`~django_ca.models.AcmeCertificate`."""
+
+    if typing.TYPE_CHECKING:
+        # See CertificateManagerMixin for description on this branch
+        #
+        # pylint: disable=missing-function-docstring,unused-argument; just defining stubs here
+
+        def claim(
+            self,
+            ca: "CertificateAuthority",
+            limit: int,
+            timeout: timedelta = timedelta(minutes=10),
+            window: int = 100,
+        ) -> list["AcmeCertificate"]: ...
+
+        def queued(self) -> "AcmeCertificateQuerySet": ...
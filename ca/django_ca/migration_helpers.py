@@ -18,12 +18,45 @@ that they are tested properly.
 """
 
 import typing
-from typing import Optional
+from typing import Any, Optional
 
 from cryptography import x509
 from cryptography.x509.oid import AuthorityInformationAccessOID, ExtensionOID
 
-from django_ca.utils import format_general_name, parse_general_name, split_str
+from django.db.models import QuerySet
+
+from django_ca.typehints import CertificateMetadata
+from django_ca.utils import format_general_name, get_certificate_metadata, parse_general_name, split_str
+
+
+def update_certificate_metadata(queryset: "QuerySet[Any]", chunk_size: int = 1000) -> int:
+    """Populate the certificate metadata fields for all certificates in `queryset`.
+
+    This function is used by migration 0048 and :command:`manage.py update_certificate_metadata`, so it only
+    uses the `pub` field. Certificates are loaded and updated in chunks of `chunk_size` rows (ordered by
+    primary key), so memory usage does not depend on the number of certificates.
+
+    Returns the number of updated certificates.
+    """
+    fields = list(CertificateMetadata.__annotations__)
+    updated = 0
+    last_pk = None
+
+    while True:
+        chunk = queryset.order_by("pk").only("pk", "pub")
+        if last_pk is not None:
+            chunk = chunk.filter(pk__gt=last_pk)
+        objs = list(chunk[:chunk_size])
+        if not objs:
+            return updated
+
+        for obj in objs:
+            for field, value in get_certificate_metadata(obj.pub.loaded).items():
+                setattr(obj, field, value)
+        queryset.model.objects.bulk_update(objs, fields)
+
+        updated += len(objs)
+        last_pk = objs[-1].pk
 
 
 class Migration0040Helper:
@@ -0,0 +1,21 @@
+# Generated by Django 5.0.3 on 2026-10-18 06:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_ca', '0044_remove_certificateauthority_private_key_path'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='acmeorder',
+            index=models.Index(fields=['expires'], name='django_ca_acmeorder_expires'),
+        ),
+        migrations.AddIndex(
+            model_name='acmeorder',
+            index=models.Index(fields=['status', 'expires'], name='django_ca_acmeorder_status'),
+        ),
+    ]
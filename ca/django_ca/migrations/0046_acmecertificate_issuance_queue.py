@@ -0,0 +1,33 @@
+# Generated by Django 5.0.3 on 2026-10-18 06:00
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_ca', '0045_acmeorder_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='acmecertificate',
+            name='created',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddField(
+            model_name='acmecertificate',
+            name='priority',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='acmecertificate',
+            name='started',
+            field=models.DateTimeField(blank=True, help_text='When issuance was last started.', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='acmecertificate',
+            index=models.Index(fields=['cert', 'priority', 'created'], name='django_ca_acmecert_queue'),
+        ),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 5.0.3 on 2026-10-18 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_ca', '0046_acmecertificate_issuance_queue'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='certificate',
+            name='fingerprint_sha256',
+            field=models.CharField(blank=True, db_index=True, default='', max_length=64, verbose_name='SHA-256 fingerprint'),
+        ),
+        migrations.AddField(
+            model_name='certificate',
+            name='issuer_hash',
+            field=models.CharField(blank=True, db_index=True, default='', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='certificate',
+            name='public_key_size',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='Key size'),
+        ),
+        migrations.AddField(
+            model_name='certificate',
+            name='public_key_type',
+            field=models.CharField(blank=True, default='', max_length=16, verbose_name='Key type'),
+        ),
+        migrations.AddField(
+            model_name='certificate',
+            name='signature_algorithm',
+            field=models.CharField(blank=True, default='', max_length=64, verbose_name='Signature algorithm'),
+        ),
+        migrations.AddField(
+            model_name='certificate',
+            name='subject_alternative_names',
+            field=models.TextField(blank=True, default='', verbose_name='Subject Alternative Names'),
+        ),
+        migrations.AddField(
+            model_name='certificateauthority',
+            name='fingerprint_sha256',
+            field=models.CharField(blank=True, db_index=True, default='', max_length=64, verbose_name='SHA-256 fingerprint'),
+        ),
+        migrations.AddField(
+            model_name='certificateauthority',
+            name='issuer_hash',
+            field=models.CharField(blank=True, db_index=True, default='', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='certificateauthority',
+            name='public_key_size',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='Key size'),
+        ),
+        migrations.AddField(
+            model_name='certificateauthority',
+            name='public_key_type',
+            field=models.CharField(blank=True, default='', max_length=16, verbose_name='Key type'),
+        ),
+        migrations.AddField(
+            model_name='certificateauthority',
+            name='signature_algorithm',
+            field=models.CharField(blank=True, default='', max_length=64, verbose_name='Signature algorithm'),
+        ),
+        migrations.AddField(
+            model_name='certificateauthority',
+            name='subject_alternative_names',
+            field=models.TextField(blank=True, default='', verbose_name='Subject Alternative Names'),
+        ),
+    ]
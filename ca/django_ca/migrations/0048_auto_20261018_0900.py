@@ -0,0 +1,43 @@
+# This file is part of django-ca (https://github.com/mathiasertl/django-ca).
+#
+# django-ca is free software: you can redistribute it and/or modify it under the terms of the GNU General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# django-ca is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the
+# implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License
+# for more details.
+#
+# You should have received a copy of the GNU General Public License along with django-ca. If not, see
+# <http://www.gnu.org/licenses/>.
+#
+# Generated by Django 5.0.3 on 2026-10-18 09:00
+
+"""Data migration to populate certificate metadata fields added in migration 0047."""
+
+import typing
+
+from django.db import migrations
+
+from django_ca.migration_helpers import update_certificate_metadata
+
+if typing.TYPE_CHECKING:
+    from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+    from django.db.migrations.state import StateApps
+
+
+def populate_metadata(apps: "StateApps", schema_editor: "BaseDatabaseSchemaEditor") -> None:
+    """Populate metadata fields of certificate authorities and certificates (forward migration)."""
+    for model_name in ("CertificateAuthority", "Certificate"):
+        model = apps.get_model("django_ca", model_name)
+        update_certificate_metadata(model.objects.all())
+
+
+class Migration(migrations.Migration):  # noqa: D101
+    dependencies = [  # noqa: RUF012
+        ("django_ca", "0047_x509certmixin_metadata"),
+    ]
+
+    operations = [  # noqa: RUF012
+        migrations.RunPython(populate_metadata, migrations.RunPython.noop),
+    ]
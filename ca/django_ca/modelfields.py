@@ -17,6 +17,7 @@
 """
 
 import abc
+import base64
 import typing
 from collections.abc import Sequence
 from typing import Any, Optional, Union
@@ -81,15 +82,20 @@ class LazyField(typing.Generic[LoadedTypeVar, DecodableTypeVar], metaclass=abc.A
     """Abstract base class for lazy field values.
 
     Subclasses of this class can be used by *binary* fields to load a cryptography value when first accessed.
+    PEM and DER encodings are computed from the stored DER value and never require loading the value.
     """
 
+    __slots__ = ("_bytes", "_loaded")
+
     _bytes: bytes
-    _loaded: Optional[LoadedTypeVar] = None
+    _loaded: Optional[LoadedTypeVar]
+    _pem_label: typing.ClassVar[bytes]
     _pem_token: typing.ClassVar[bytes]
     _type: type[LoadedTypeVar]
 
     def __init__(self, value: DecodableTypeVar) -> None:
         """Constructor must accept a decodable type var."""
+        self._loaded = None
         if isinstance(value, bytes):  # SQLite passes bytes
             if value.startswith(self._pem_token):
                 self._loaded = self.load_pem(value)
@@ -133,10 +139,26 @@ class LazyField(typing.Generic[LoadedTypeVar, DecodableTypeVar], metaclass=abc.A
         ----------
         encoding : attr of :py:class:`~cg:cryptography.hazmat.primitives.serialization.Encoding`, optional
             The format to return, defaults to ``Encoding.PEM``.
+
+        Raises
+        ------
+        ValueError
+            If `encoding` is neither ``Encoding.DER`` nor ``Encoding.PEM``.
         """
         if encoding == Encoding.DER:
             return self._bytes
-        return self.loaded.public_bytes(encoding)
+        if encoding == Encoding.PEM:
+            return self._encode_pem()
+        raise ValueError(f"{encoding}: Only Encoding.DER and Encoding.PEM are supported.")
+
+    def _encode_pem(self) -> bytes:
+        # PEM is just the base64-encoded DER value wrapped at 64 characters (RFC 7468), just like
+        # public_bytes(Encoding.PEM) would return it.
+        data = base64.b64encode(self._bytes)
+        lines: list[bytes] = [data[i : i + 64] for i in range(0, len(data), 64)]
+        header = b"-----BEGIN %s-----" % self._pem_label
+        footer = b"-----END %s-----\n" % self._pem_label
+        return b"\n".join([header, *lines, footer])
 
     @property
     def der(self) -> bytes:
@@ -146,7 +168,7 @@ class LazyField(typing.Generic[LoadedTypeVar, DecodableTypeVar], metaclass=abc.A
     @property
     def pem(self) -> str:
         """The handled object as str-encoded PEM."""
-        return self.loaded.public_bytes(Encoding.PEM).decode()
+        return self._encode_pem().decode()
 
 
 class LazyCertificateSigningRequest(
@@ -154,6 +176,9 @@ class LazyCertificateSigningRequest(
 ):
     """A lazy field for a :py:class:`~cg:cryptography.x509.CertificateSigningRequest."""
 
+    __slots__ = ()
+
+    _pem_label = b"CERTIFICATE REQUEST"
     _pem_token = b"-----BEGIN CERTIFICATE REQUEST-----"
     _type = x509.CertificateSigningRequest
 
@@ -171,6 +196,9 @@ class LazyCertificateSigningRequest(
 class LazyCertificate(LazyField[x509.Certificate, DecodableCertificate]):
     """A lazy field for a :py:class:`~cg:cryptography.x509.Certificate."""
 
+    __slots__ = ()
+
+    _pem_label = b"CERTIFICATE"
     _pem_token = b"-----BEGIN CERTIFICATE-----"
     _type = x509.Certificate
 
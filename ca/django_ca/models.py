@@ -23,11 +23,12 @@ import logging
 import random
 import re
 import typing
+import warnings
 from collections import OrderedDict
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone as tz
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
 import josepy as jose
 from acme import challenges, messages
@@ -35,7 +36,7 @@ from pydantic import BaseModel
 
 from cryptography import x509
 from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import dsa, ec, ed448, ed25519, rsa
+from cryptography.hazmat.primitives.asymmetric import dsa, ec, ed448, ed25519
 from cryptography.hazmat.primitives.asymmetric.types import CertificateIssuerPublicKeyTypes
 from cryptography.hazmat.primitives.serialization import Encoding, PrivateFormat, PublicFormat
 from cryptography.x509.oid import ExtensionOID, NameOID
@@ -45,7 +46,7 @@ from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.core.files.base import ContentFile
 from django.core.validators import MinValueValidator, URLValidator
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.http import HttpRequest
 from django.urls import reverse
 from django.utils import timezone
@@ -56,7 +57,7 @@ from django.utils.translation import gettext_lazy as _
 from django_ca import ca_settings, constants
 from django_ca.acme.constants import BASE64_URL_ALPHABET, IdentifierType, Status
 from django_ca.constants import REVOCATION_REASONS, ReasonFlags
-from django_ca.deprecation import not_valid_after, not_valid_before
+from django_ca.deprecation import RemovedInDjangoCA200Warning, not_valid_after, not_valid_before
 from django_ca.extensions import get_extension_name
 from django_ca.key_backends import KeyBackend, key_backends
 from django_ca.managers import (
@@ -92,13 +93,17 @@ from django_ca.signals import post_revoke_cert, post_sign_cert, pre_revoke_cert,
 from django_ca.typehints import AllowedHashTypes, Expires, ParsableKeyType
 from django_ca.utils import (
     bytes_to_hex,
+    clear_cached_files,
     generate_private_key,
+    get_certificate_metadata,
     get_crl_cache_key,
+    get_crl_storage_path,
+    get_public_key_type,
     get_storage,
     int_to_hex,
+    load_cached_file,
     parse_encoding,
     parse_expires,
-    read_file,
     validate_private_key_parameters,
     validate_public_key_parameters,
 )
@@ -108,6 +113,9 @@ if typing.TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+#: Number of rows fetched from the database at once when generating CRLs.
+CRL_CHUNK_SIZE = 2000
+
 
 def acme_slug() -> str:
     """Default function to get an ACME conforming slug."""
@@ -231,6 +239,21 @@ class X509CertMixin(DjangoCAModel):
     cn = models.CharField(max_length=128, verbose_name=_("CommonName"))
     serial = models.CharField(max_length=64, unique=True)
 
+    # Metadata of the certificate stored in separate columns, so that certificates can be searched and
+    # filtered without loading them. Populated by update_certificate().
+    public_key_type = models.CharField(max_length=16, blank=True, default="", verbose_name=_("Key type"))
+    public_key_size = models.PositiveIntegerField(null=True, blank=True, verbose_name=_("Key size"))
+    signature_algorithm = models.CharField(
+        max_length=64, blank=True, default="", verbose_name=_("Signature algorithm")
+    )
+    fingerprint_sha256 = models.CharField(
+        max_length=64, blank=True, default="", db_index=True, verbose_name=_("SHA-256 fingerprint")
+    )
+    issuer_hash = models.CharField(max_length=64, blank=True, default="", db_index=True)
+    subject_alternative_names = models.TextField(
+        blank=True, default="", verbose_name=_("Subject Alternative Names")
+    )
+
     # revocation information
     revoked = models.BooleanField(default=False)
     revoked_date = models.DateTimeField(
@@ -375,9 +398,12 @@ class X509CertMixin(DjangoCAModel):
     def update_certificate(self, value: x509.Certificate) -> None:
         """Update this instance with data from a :py:class:`cg:cryptography.x509.Certificate`.
 
-        This function will also populate the `cn`, `serial, `expires` and `valid_from` fields.
+        This function will also populate the `cn`, `serial`, `expires` and `valid_from` fields, as well as the
+        fields for certificate metadata (see :py:func:`~django_ca.utils.get_certificate_metadata`).
         """
         self.pub = LazyCertificate(value)
+        for field, field_value in get_certificate_metadata(value).items():
+            setattr(self, field, field_value)
         self.cn = next(
             (attr.value for attr in value.subject if attr.oid == NameOID.COMMON_NAME),  # type: ignore[misc]
             "",
@@ -414,23 +440,40 @@ class X509CertMixin(DjangoCAModel):
         """
         if self.revoked is False:
             raise ValueError("Certificate is not revoked.")
-        if self.revoked_date is None:
+        return self.build_revocation(self.serial, self.revoked_date, self.revoked_reason, self.compromised)
+
+    @staticmethod
+    def build_revocation(
+        serial: str, revoked_date: Optional[datetime], revoked_reason: str, compromised: Optional[datetime]
+    ) -> x509.RevokedCertificate:
+        """Build a `RevokedCertificate` from the raw revocation data of a certificate.
+
+        This function allows building CRL entries from database values without loading the model instance
+        (and thus the certificate itself).
+
+        Raises
+        ------
+        ValueError
+            If `revoked_date` is ``None``.
+        """
+        if revoked_date is None:
             raise ValueError("Certificate has no revocation date")
 
         revoked_cert = (
-            x509.RevokedCertificateBuilder()
-            .serial_number(self.pub.loaded.serial_number)
-            .revocation_date(self.revoked_date)
+            x509.RevokedCertificateBuilder().serial_number(int(serial, 16)).revocation_date(revoked_date)
         )
 
-        reason = self.get_revocation_reason()
-        if reason != x509.ReasonFlags.unspecified and reason is not None:
+        reason = x509.ReasonFlags[revoked_reason]
+        if reason != x509.ReasonFlags.unspecified:
             # RFC 5270, 5.3.1: "reason code CRL entry extension SHOULD be absent instead of using the
             # unspecified (0) reasonCode value"
             revoked_cert = revoked_cert.add_extension(x509.CRLReason(reason), critical=False)
 
-        compromised = self.get_compromised_time()
-        if compromised:
+        if compromised is not None:
+            if timezone.is_aware(compromised):
+                # convert datetime object to UTC and make it naive
+                compromised = timezone.make_naive(compromised, tz.utc)
+
             # RFC 5280, 5.3.2 says that this extension MUST be non-critical
             revoked_cert = revoked_cert.add_extension(x509.InvalidityDate(compromised), critical=False)
 
@@ -593,6 +636,9 @@ class CertificateAuthority(X509CertMixin):
 
     _key_backend = None
 
+    # CRL entries shared between CRL profiles while caching CRLs, see cache_crls()
+    _shared_crl_entries: Optional[dict[str, list[x509.RevokedCertificate]]] = None
+
     class Meta:
         verbose_name = _("Certificate Authority")
         verbose_name_plural = _("Certificate Authorities")
@@ -618,18 +664,8 @@ class CertificateAuthority(X509CertMixin):
     @property
     def key_type(self) -> ParsableKeyType:
         """The type of key as a string, e.g. "RSA" or "Ed448"."""
-        pub = self.pub.loaded.public_key()
-        if isinstance(pub, dsa.DSAPublicKey):
-            return "DSA"
-        if isinstance(pub, rsa.RSAPublicKey):
-            return "RSA"
-        if isinstance(pub, ec.EllipticCurvePublicKey):
-            return "EC"
-        if isinstance(pub, ed25519.Ed25519PublicKey):
-            return "Ed25519"
-        if isinstance(pub, ed448.Ed448PublicKey):
-            return "Ed448"
-        raise ValueError(f"{pub}: Unknown key type.")  # pragma: no cover
+        public_key = typing.cast(CertificateIssuerPublicKeyTypes, self.pub.loaded.public_key())
+        return get_public_key_type(public_key)
 
     @property
     def ocsp_responder_certificate(self) -> x509.Certificate:
@@ -637,16 +673,34 @@ class CertificateAuthority(X509CertMixin):
 
         This property raises FileNotFoundError if no key has (yet) been generated.
         """
-        data = read_file(f"ocsp/{self.serial}.pem")
-        return x509.load_pem_x509_certificate(data)
+        return load_cached_file(f"ocsp/{self.serial}.pem", x509.load_pem_x509_certificate)
 
-    def cache_crls(self, key_backend_options: BaseModel) -> None:
+    def cache_crls(self, key_backend_options: BaseModel, delta: bool = False) -> None:
         """Function to cache all CRLs for this CA.
 
+        By default, complete CRLs are generated for all profiles in :ref:`settings-ca-crl-profiles`, as well
+        as a delta CRL for profiles that enable them. If ``delta=True`` is passed, only delta CRLs are
+        generated (for profiles that enable them).
+
+        Unless :ref:`settings-ca-enable-crl-storage` is set to ``False``, CRLs are also written to the file
+        storage, so that they can still be served if they are evicted from the cache.
+
+        .. versionchanged:: 1.29.0
+
+           The ``delta`` parameter was added and CRLs are now also written to the file storage.
+
         .. versionchanged:: 1.25.0
 
            Support for passing a custom hash algorithm to this function was removed.
         """
+        # Revoked certificates are only fetched once for all profiles (that generate complete CRLs)
+        self._shared_crl_entries = {}
+        try:
+            self._cache_crls(key_backend_options, delta)
+        finally:
+            self._shared_crl_entries = None
+
+    def _cache_crls(self, key_backend_options: BaseModel, delta: bool) -> None:
         for config in deepcopy(ca_settings.CA_CRL_PROFILES).values():
             # create a copy of the overrides with the serials sanitized so that the user can use a
             # case-insensitive string and can have colons (":").
@@ -656,31 +710,63 @@ class CertificateAuthority(X509CertMixin):
             if ca_override.get("skip"):
                 continue
 
-            expires = ca_override.get("expires", config.get("expires", 86400))
+            delta_enabled = ca_override.get("delta", config.get("delta", False))
+            if delta is True and delta_enabled is False:
+                continue
+
+            # List of CRLs to generate with their expiry
+            crls: list[tuple[bool, int]] = []
+            if delta is False:
+                crls.append((False, ca_override.get("expires", config.get("expires", 86400))))
+            if delta_enabled is True:
+                crls.append((True, ca_override.get("delta_expires", config.get("delta_expires", 3600))))
+
             scope = ca_override.get("scope", config.get("scope"))
             full_name = ca_override.get("full_name", config.get("full_name"))
             relative_name = ca_override.get("relative_name", config.get("relative_name"))
             encodings = ca_override.get("encodings", config.get("encodings", ["DER"]))
-            crl = self.get_crl(
-                key_backend_options=key_backend_options,
-                expires=expires,
-                algorithm=self.algorithm,
-                scope=scope,
-                full_name=full_name,
-                relative_name=relative_name,
-            )
 
-            for encoding in encodings:
-                encoding = parse_encoding(encoding)
-                cache_key = get_crl_cache_key(self.serial, encoding, scope=scope)
-
-                if expires >= 600:  # pragma: no branch
-                    # for longer expiries we subtract a random value so that regular CRL regeneration is
-                    # distributed a bit
-                    expires = expires - random.randint(1, 5) * 60
+            for delta_crl, expires in crls:
+                crl = self.get_crl(
+                    key_backend_options=key_backend_options,
+                    expires=expires,
+                    algorithm=self.algorithm,
+                    scope=scope,
+                    full_name=full_name,
+                    relative_name=relative_name,
+                    delta=delta_crl,
+                )
+                self._store_crl(crl, encodings, expires, scope=scope, delta=delta_crl)
 
-                encoded_crl = crl.public_bytes(encoding)
-                cache.set(cache_key, encoded_crl, expires)
+    def _store_crl(
+        self,
+        crl: x509.CertificateRevocationList,
+        encodings: Iterable[str],
+        expires: int,
+        scope: Optional[str],
+        delta: bool,
+    ) -> None:
+        """Add a CRL to the cache (and the file storage, if enabled) in the given encodings."""
+        for encoding_name in encodings:
+            encoding = parse_encoding(encoding_name)
+            cache_key = get_crl_cache_key(self.serial, encoding, scope=scope, delta=delta)
+
+            if expires >= 600:  # pragma: no branch
+                # for longer expiries we subtract a random value so that regular CRL regeneration is
+                # distributed a bit
+                expires = expires - random.randint(1, 5) * 60
+
+            encoded_crl = crl.public_bytes(encoding)
+            cache.set(cache_key, encoded_crl, expires)
+
+            if ca_settings.CA_ENABLE_CRL_STORAGE is True:
+                storage = get_storage()
+                path = get_crl_storage_path(self.serial, encoding, scope=scope, delta=delta)
+                if storage.exists(path):
+                    with storage.open(path, "wb") as stream:
+                        stream.write(encoded_crl)
+                else:
+                    storage.save(path, ContentFile(encoded_crl))
 
     @property
     def extensions_for_certificate(
@@ -970,6 +1056,9 @@ class CertificateAuthority(X509CertMixin):
                     stream.write(contents)
             else:
                 storage.save(path, ContentFile(contents))
+
+        # Make sure that responder key/certificate cached in this process are reloaded
+        clear_cached_files(private_path, cert_path)
         return private_path, cert_path, cert
 
     def get_authority_key_identifier(self) -> x509.AuthorityKeyIdentifier:
@@ -992,24 +1081,95 @@ class CertificateAuthority(X509CertMixin):
             value=self.get_authority_key_identifier(),
         )
 
-    def get_crl_certs(
-        self, scope: typing.Literal[None, "ca", "user", "attribute"], now: datetime
-    ) -> Iterable[X509CertMixin]:
-        """Get CRLs for the given scope."""
+    def _get_crl_querysets(
+        self,
+        scope: typing.Literal[None, "ca", "user", "attribute"],
+        now: datetime,
+        revoked_since: Optional[datetime] = None,
+    ) -> list[tuple[str, Union[CertificateAuthorityQuerySet, CertificateQuerySet]]]:
         ca_qs = self.children.filter(expires__gt=now).revoked()
         cert_qs = self.certificate_set.filter(expires__gt=now).revoked()
+        if revoked_since is not None:
+            ca_qs = ca_qs.filter(revoked_date__gt=revoked_since)
+            cert_qs = cert_qs.filter(revoked_date__gt=revoked_since)
 
         if scope == "ca":
-            return ca_qs
+            return [("ca", ca_qs)]
         if scope == "user":
-            return cert_qs
+            return [("user", cert_qs)]
         if scope == "attribute":
             return []  # not really supported
         if scope is None:
-            return itertools.chain(ca_qs, cert_qs)
+            return [("ca", ca_qs), ("user", cert_qs)]
         raise ValueError('scope must be either None, "ca", "user" or "attribute"')
 
-    def get_crl(
+    def get_crl_certs(
+        self,
+        scope: typing.Literal[None, "ca", "user", "attribute"],
+        now: datetime,
+        revoked_since: Optional[datetime] = None,
+    ) -> Iterable[X509CertMixin]:
+        """Get certificates for CRLs of the given scope.
+
+        If `revoked_since` is passed, only certificates revoked after the given timestamp are returned.
+
+        .. deprecated:: 1.29.0
+
+           This function will be removed in django-ca 2.0. Use :py:func:`get_crl_entries` instead.
+        """
+        warnings.warn(
+            "CertificateAuthority.get_crl_certs() is deprecated and will be removed in django-ca==2.0. "
+            "Use get_crl_entries() instead.",
+            RemovedInDjangoCA200Warning,
+            stacklevel=2,
+        )
+        querysets = self._get_crl_querysets(scope, now, revoked_since=revoked_since)
+        return itertools.chain.from_iterable(queryset for _kind, queryset in querysets)
+
+    def get_crl_entries(
+        self,
+        scope: typing.Literal[None, "ca", "user", "attribute"],
+        now: datetime,
+        revoked_since: Optional[datetime] = None,
+    ) -> Iterator[x509.RevokedCertificate]:
+        """Get CRL entries for the given scope.
+
+        Only the fields required for building CRL entries are fetched from the database (in chunks of
+        ``CRL_CHUNK_SIZE`` rows), so generating CRLs with many entries does not require loading every
+        certificate.
+
+        .. versionadded:: 1.29.0
+        """
+        fields = ("serial", "revoked_date", "revoked_reason", "compromised")
+        for kind, queryset in self._get_crl_querysets(scope, now, revoked_since=revoked_since):
+            rows = queryset.values_list(*fields).iterator(chunk_size=CRL_CHUNK_SIZE)
+
+            # Entries for complete CRLs are only fetched once while caching CRLs for all profiles.
+            if self._shared_crl_entries is not None and revoked_since is None:
+                if kind not in self._shared_crl_entries:
+                    self._shared_crl_entries[kind] = [X509CertMixin.build_revocation(*row) for row in rows]
+                yield from self._shared_crl_entries[kind]
+            else:
+                for row in rows:
+                    yield X509CertMixin.build_revocation(*row)
+
+    def has_base_crl(
+        self,
+        scope: Optional[typing.Literal["ca", "user", "attribute"]] = None,
+        counter: Optional[str] = None,
+    ) -> bool:
+        """Return ``True`` if a complete CRL was generated that a delta CRL can be based on.
+
+        The `scope` and `counter` parameters have the same meaning as in :py:func:`get_crl`.
+
+        .. versionadded:: 1.29.0
+        """
+        if counter is None:
+            counter = scope or "all"
+        crl_number_data = json.loads(self.crl_number)
+        return counter in crl_number_data.get("base", {})
+
+    def get_crl(  # noqa: PLR0912,PLR0915
         self,
         key_backend_options: BaseModel,
         expires: int = 86400,
@@ -1019,6 +1179,7 @@ class CertificateAuthority(X509CertMixin):
         full_name: Optional[Iterable[x509.GeneralName]] = None,
         relative_name: Optional[x509.RelativeDistinguishedName] = None,
         include_issuing_distribution_point: Optional[bool] = None,
+        delta: bool = False,
     ) -> x509.CertificateRevocationList:
         """Generate a Certificate Revocation List (CRL).
 
@@ -1027,6 +1188,15 @@ class CertificateAuthority(X509CertMixin):
         The former defaults to the ``crl_url`` field, pass ``None`` to not include the value. At most one of
         the two may be set.
 
+        If ``delta=True`` is passed, a `delta CRL <https://tools.ietf.org/html/rfc5280.html#section-5.2.4>`_
+        is generated. It only contains certificates revoked since the last complete CRL with the same
+        `counter` was generated and references it in the Delta CRL Indicator extension. Delta CRLs share the
+        same CRL Number sequence with complete CRLs.
+
+        .. versionchanged:: 1.29.0
+
+           The ``delta`` parameter was added.
+
         Parameters
         ----------
         key_backend_options : BaseModel
@@ -1053,6 +1223,9 @@ class CertificateAuthority(X509CertMixin):
         include_issuing_distribution_point: bool, optional
             Force the inclusion/exclusion of the IssuingDistributionPoint extension. By default, the inclusion
             is automatically determined.
+        delta : bool, optional
+            Set to ``True`` to generate a delta CRL. A complete CRL must have been generated for the given
+            scope/counter before, otherwise ``ValueError`` is raised.
 
         Returns
         -------
@@ -1069,11 +1242,6 @@ class CertificateAuthority(X509CertMixin):
         if algorithm is None:
             algorithm = self.algorithm
 
-        builder = x509.CertificateRevocationListBuilder()
-        builder = builder.issuer_name(self.pub.loaded.subject)
-        builder = builder.last_update(now_naive)
-        builder = builder.next_update(now_naive + timedelta(seconds=expires))
-
         parsed_full_name = None
         if full_name is not None:
             parsed_full_name = full_name
@@ -1117,13 +1285,43 @@ class CertificateAuthority(X509CertMixin):
             # sorry, nothing we support right now
             only_contains_attribute_certs = True
 
+        # Load data for the CRLNumber (RFC 5280, 5.2.3) and DeltaCRLIndicator (RFC 5280, 5.2.4) extensions
+        if counter is None:
+            counter = scope or "all"
+        crl_number_data = json.loads(self.crl_number)
+        crl_number = int(crl_number_data["scope"].get(counter, 0))
+
+        # Delta CRLs only contain certificates revoked since the last complete CRL (the "base CRL").
+        revoked_since: Optional[datetime] = None
+        delta_crl_indicator: Optional[x509.DeltaCRLIndicator] = None
+        if delta is True:
+            base_crl: Optional[dict[str, Any]] = crl_number_data.get("base", {}).get(counter)
+            if base_crl is None:
+                raise ValueError(
+                    f"{counter}: Cannot generate a delta CRL before a complete CRL was generated."
+                )
+            revoked_since = datetime.fromisoformat(base_crl["last_update"])
+            if settings.USE_TZ is False:
+                revoked_since = revoked_since.replace(tzinfo=None)
+
+            delta_crl_indicator = x509.DeltaCRLIndicator(crl_number=base_crl["crl_number"])
+
+        # Collect all entries first: Adding them to the builder one by one copies the builder every time.
         if settings.USE_TZ is True:
-            crl_certificates = self.get_crl_certs(scope, now)
+            revoked_certificates = list(self.get_crl_entries(scope, now, revoked_since=revoked_since))
         else:
-            crl_certificates = self.get_crl_certs(scope, now_naive)
+            revoked_certificates = list(self.get_crl_entries(scope, now_naive, revoked_since=revoked_since))
+
+        builder = x509.CertificateRevocationListBuilder(
+            issuer_name=self.pub.loaded.subject,
+            last_update=now_naive,
+            next_update=now_naive + timedelta(seconds=expires),
+            revoked_certificates=revoked_certificates,
+        )
 
-        for cert in crl_certificates:
-            builder = builder.add_revoked_certificate(cert.get_revocation())
+        if delta_crl_indicator is not None:
+            # The DeltaCRLIndicator extension MUST be marked as critical (RFC 5280, 5.2.4)
+            builder = builder.add_extension(delta_crl_indicator, critical=True)
 
         # Validate that the user has selected a usable algorithm
         validate_public_key_parameters(self.key_type, algorithm)
@@ -1157,10 +1355,6 @@ class CertificateAuthority(X509CertMixin):
         builder = builder.add_extension(aki, critical=False)
 
         # Add the CRLNumber extension (RFC 5280, 5.2.3)
-        if counter is None:
-            counter = scope or "all"
-        crl_number_data = json.loads(self.crl_number)
-        crl_number = int(crl_number_data["scope"].get(counter, 0))
         builder = builder.add_extension(x509.CRLNumber(crl_number=crl_number), critical=False)
 
         # Get the backend.
@@ -1169,8 +1363,15 @@ class CertificateAuthority(X509CertMixin):
 
         # increase crl_number for the given scope and save
         crl_number_data["scope"][counter] = crl_number + 1
+
+        # Remember number and time of complete CRLs, so that delta CRLs can be generated later.
+        if delta is False:
+            crl_number_data.setdefault("base", {})[counter] = {
+                "crl_number": crl_number,
+                "last_update": now.isoformat(),
+            }
         self.crl_number = json.dumps(crl_number_data)
-        self.save()
+        self.save(update_fields=["crl_number"])
 
         return self.key_backend.sign_certificate_revocation_list(
             ca=self, use_private_key_options=key_backend_options, builder=builder, algorithm=algorithm
@@ -1475,6 +1676,11 @@ class AcmeOrder(DjangoCAModel):
     class Meta:
         verbose_name = _("ACME Order")
         verbose_name_plural = _("ACME Orders")
+        indexes = (
+            # Used by acme_cleanup() to find expired orders
+            models.Index(fields=("expires",), name="django_ca_acmeorder_expires"),
+            models.Index(fields=("status", "expires"), name="django_ca_acmeorder_status"),
+        )
 
     def __str__(self) -> str:
         return f"{self.slug} ({self.account})"
@@ -1634,13 +1840,36 @@ class AcmeAuthorization(DjangoCAModel):
     def get_challenges(self) -> list["AcmeChallenge"]:
         """Get list of :py:class:`~django_ca.models.AcmeChallenge` objects for this authorization.
 
-        Note that challenges will be created if they don't exist.
+        Note that challenges will be created if they don't exist. Existing challenges are retrieved with a
+        single query (or none at all if they were prefetched) and missing challenges are created with a
+        single query.
         """
-        return [
-            AcmeChallenge.objects.get_or_create(auth=self, type=AcmeChallenge.TYPE_HTTP_01)[0],
-            # AcmeChallenge.objects.get_or_create(auth=self, type=AcmeChallenge.TYPE_TLS_ALPN_01)[0],
-            AcmeChallenge.objects.get_or_create(auth=self, type=AcmeChallenge.TYPE_DNS_01)[0],
-        ]
+        types = (
+            AcmeChallenge.TYPE_HTTP_01,
+            # AcmeChallenge.TYPE_TLS_ALPN_01,
+            AcmeChallenge.TYPE_DNS_01,
+        )
+        existing = {challenge.type: challenge for challenge in self.challenges.all()}
+        missing = [AcmeChallenge(auth=self, type=typ) for typ in types if typ not in existing]
+        if missing:
+            try:
+                with transaction.atomic():
+                    AcmeChallenge.objects.bulk_create(missing)
+            except IntegrityError:
+                missing = []  # Another request created the challenges in the meantime.
+
+            if missing and all(challenge.pk is not None for challenge in missing):
+                existing.update((challenge.type, challenge) for challenge in missing)
+            else:
+                # Query challenges again if the database does not return primary keys for bulk inserts or if
+                # another request created them. Note that self.challenges.all() might return prefetched
+                # challenges again.
+                existing = {}
+                for challenge in AcmeChallenge.objects.filter(auth=self):
+                    challenge.auth = self
+                    existing[challenge.type] = challenge
+
+        return [existing[typ] for typ in types]
 
     @property
     def usable(self) -> bool:
@@ -1799,18 +2028,32 @@ class AcmeChallenge(DjangoCAModel):
 
 
 class AcmeCertificate(DjangoCAModel):
-    """Intermediate model for certificates to be issued via ACME."""
+    """Intermediate model for certificates to be issued via ACME.
+
+    If :ref:`CA_ACME_ISSUANCE_QUEUE <settings-acme-issuance-queue>` is enabled, instances without a
+    certificate also serve as entries in the issuance queue.
+    """
+
+    PRIORITY_DEFAULT = 0
+    PRIORITY_RENEWAL = 10
 
     slug = models.SlugField(unique=True, default=acme_slug)
     order = models.OneToOneField(AcmeOrder, on_delete=models.CASCADE)
     cert = models.OneToOneField(Certificate, on_delete=models.CASCADE, null=True)
     csr = models.TextField(verbose_name=_("CSR"))
+    created = models.DateTimeField(default=timezone.now)
+    priority = models.PositiveSmallIntegerField(default=PRIORITY_DEFAULT)
+    started = models.DateTimeField(null=True, blank=True, help_text=_("When issuance was last started."))
 
     objects = AcmeCertificateManager.from_queryset(AcmeCertificateQuerySet)()
 
     class Meta:
         verbose_name = _("ACME Certificate")
         verbose_name_plural = _("ACME Certificate")
+        indexes = (
+            # Used by acme_issue_queued_certificates() to find queued certificates
+            models.Index(fields=("cert", "priority", "created"), name="django_ca_acmecert_queue"),
+        )
 
     def __str__(self) -> str:
         return f"{self.slug} ({self.order.get_status_display()})"
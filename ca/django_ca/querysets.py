@@ -15,10 +15,12 @@
 
 import abc
 import typing
+from collections.abc import Iterator
+from datetime import timedelta
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from django.core.exceptions import ImproperlyConfigured
-from django.db import models
+from django.db import models, transaction
 from django.db.models import Q
 from django.utils import timezone
 
@@ -216,6 +218,24 @@ class CertificateQuerySet(DjangoCAMixin["Certificate"], CertificateQuerySetBase)
         """Return revoked certificates."""
         return self.filter(revoked=True)
 
+    def listed(
+        self, expired: bool = False, revoked: bool = False, autogenerated: bool = False
+    ) -> "CertificateQuerySet":
+        """Return certificates that are listed or exported unless other certificates are requested.
+
+        Certificates that are not currently valid (see :py:meth:`currently_valid`), revoked certificates and
+        automatically generated certificates are excluded, unless `expired`, `revoked` or `autogenerated` is
+        ``True``.
+        """
+        qs = self
+        if expired is False:
+            qs = qs.currently_valid()
+        if autogenerated is False:
+            qs = qs.exclude(autogenerated=True)
+        if revoked is False:
+            qs = qs.exclude(revoked=True)
+        return qs
+
 
 class AcmeAccountQuerySet(AcmeAccountQuerySetBase):
     """QuerySet for :py:class:`~django_ca.models.AcmeAccount`."""
@@ -252,6 +272,50 @@ class AcmeOrderQuerySet(AcmeOrderQuerySetBase):
             account__ca__valid_from__lt=now,
         ).exclude(account__status=Status.REVOKED.value)
 
+    def expired(self, grace: timedelta = timedelta(days=1)) -> "AcmeOrderQuerySet":
+        """Filter ACME orders that can be removed because they have expired.
+
+        Pending or invalid orders can no longer be used once they expire, so they are included right away.
+        Other orders are only included once they expired more than `grace` ago, so that clients can still
+        retrieve them (and the certificate issued for them) for a while.
+        """
+        now = timezone.now()
+        unused = Q(status__in=(Status.PENDING.value, Status.INVALID.value), expires__lt=now)
+        return self.filter(unused | Q(expires__lt=now - grace))
+
+    def delete_in_batches(self, batch_size: int = 1000) -> Iterator[tuple[int, dict[str, int]]]:
+        """Delete ACME orders (including authorizations, challenges and certificates) in batches.
+
+        Unlike :py:meth:`~django.db.models.query.QuerySet.delete`, this method does not load any objects into
+        memory and sends no signals. Every batch is deleted in its own transaction, so an interrupted run
+        keeps the progress made so far and a later run simply continues where it stopped.
+
+        After each batch, the total number of deleted objects and a dictionary with the number of deleted
+        objects per model is yielded, just like ``delete()`` returns it.
+        """
+        # pylint: disable-next=import-outside-toplevel  # models import this module
+        from django_ca import models as ca_models
+
+        while True:
+            with transaction.atomic(using=self.db):
+                pks = list(self.order_by("pk").values_list("pk", flat=True)[:batch_size])
+                if not pks:
+                    return
+
+                # Delete from the bottom up, so that no foreign key constraint is ever violated.
+                querysets: tuple[models.QuerySet[Any], ...] = (
+                    ca_models.AcmeChallenge.objects.filter(auth__order__in=pks),
+                    ca_models.AcmeAuthorization.objects.filter(order__in=pks),
+                    ca_models.AcmeCertificate.objects.filter(order__in=pks),
+                    self.model.objects.filter(pk__in=pks),
+                )
+                counts = {
+                    # pylint: disable-next=protected-access  # only way to delete without the collector
+                    queryset.model._meta.label: queryset._raw_delete(self.db)  # type: ignore[attr-defined]
+                    for queryset in querysets
+                }
+            yield sum(counts.values()), counts
+
 
 class AcmeAuthorizationQuerySet(AcmeAuthorizationQuerySetBase):
     """QuerySet for :py:class:`~django_ca.models.AcmeAuthorization`."""
@@ -322,6 +386,67 @@ class AcmeCertificateQuerySet(AcmeCertificateQuerySetBase):
         """Filter certificates belonging to the given account."""
         return self.filter(order__account=account)
 
+    def claim(
+        self,
+        ca: "CertificateAuthority",
+        limit: int,
+        timeout: timedelta = timedelta(minutes=10),
+        window: int = 100,
+    ) -> list["AcmeCertificate"]:
+        """Claim up to `limit` queued certificates of `ca` for issuance as a single batch.
+
+        Nothing is claimed if :ref:`CA_ACME_ISSUANCE_CONCURRENCY <settings-acme-issuance-concurrency>` batches
+        of the certificate authority are currently being issued. Batches that were claimed more than `timeout`
+        ago are considered abandoned (e.g. because a worker crashed) and their certificates may be claimed
+        again.
+
+        Certificates with a higher priority are claimed first. Within the same priority, the oldest `window`
+        certificates are distributed round-robin among accounts, so that a single account requesting many
+        certificates does not delay certificates of other accounts.
+        """
+        with transaction.atomic(using=self.db):
+            # Lock the CA, so that concurrent workers see each other's claims when counting them.
+            list(type(ca).objects.select_for_update().filter(pk=ca.pk).values_list("pk"))
+
+            # Get the timestamp only after acquiring the lock, so that every batch has a unique timestamp.
+            now = timezone.now()
+            stale = now - timeout
+
+            # All certificates of a batch are claimed with the same timestamp, so the number of distinct
+            # timestamps is the number of batches that are currently being issued.
+            queryset = self.queued().filter(order__account__ca=ca)
+            started = queryset.filter(started__gt=stale).order_by().values("started").distinct().count()
+            if started >= ca_settings.ACME_ISSUANCE_CONCURRENCY:
+                return []
+
+            candidates = list(
+                queryset.exclude(started__gt=stale)
+                .select_related("order__account")
+                .select_for_update(skip_locked=True, of=("self",))
+                .order_by("-priority", "created", "pk")[: max(limit, window)]
+            )
+
+            # Rank certificates by their position in the queue of their account, so that accounts take turns.
+            # sorted() is stable, so certificates with the same rank remain in FIFO order.
+            ranks: dict[tuple[int, int], int] = {}
+            ranked: list[tuple[int, int, "AcmeCertificate"]] = []
+            for acme_cert in candidates:
+                key = (acme_cert.priority, acme_cert.order.account_id)
+                ranks[key] = ranks.get(key, -1) + 1
+                ranked.append((-acme_cert.priority, ranks[key], acme_cert))
+            claimed = [item[2] for item in sorted(ranked, key=lambda item: item[:2])[:limit]]
+
+            self.model.objects.filter(pk__in=[acme_cert.pk for acme_cert in claimed]).update(started=now)
+            for acme_cert in claimed:
+                acme_cert.started = now
+        return claimed
+
+    def queued(self) -> "AcmeCertificateQuerySet":
+        """Filter ACME certificates that are waiting to be issued."""
+        return self.filter(
+            cert__isnull=True, order__status=Status.PROCESSING.value, order__expires__gt=timezone.now()
+        )
+
     def url(self) -> "AcmeCertificateQuerySet":
         """Prepare queryset to get the ACME URL of objects without subsequent database lookups."""
         return self.select_related("order__account__ca")
@@ -0,0 +1,109 @@
+# This file is part of django-ca (https://github.com/mathiasertl/django-ca).
+#
+# django-ca is free software: you can redistribute it and/or modify it under the terms of the GNU General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# django-ca is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the
+# implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License
+# for more details.
+#
+# You should have received a copy of the GNU General Public License along with django-ca. If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""Signal receivers used by django-ca itself.
+
+.. seealso:: https://docs.djangoproject.com/en/dev/topics/signals/
+"""
+# pylint: disable=unused-argument; signal receivers must accept the sender argument
+
+from collections.abc import Iterable
+from typing import Any, Optional, Union
+
+from django.conf import settings
+from django.contrib.auth.models import Group, Permission
+from django.core.cache import cache
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from django_ca.acme.cache import account_cache
+from django_ca.api.cache import user_cache
+from django_ca.models import AcmeAccount, Certificate, CertificateAuthority
+from django_ca.signals import post_issue_cert, post_issue_certs, post_revoke_cert
+from django_ca.utils import get_acme_directory_cache_key, get_ocsp_response_cache_key
+
+# Fields of a certificate authority that influence if and how its ACME directory is displayed
+ACME_DIRECTORY_FIELDS = frozenset(
+    ["acme_enabled", "caa_identity", "enabled", "expires", "terms_of_service", "valid_from", "website"]
+)
+
+
+@receiver(post_issue_cert)
+@receiver(post_revoke_cert)
+def invalidate_ocsp_response_cache(
+    sender: Any, cert: Union[Certificate, CertificateAuthority], **kwargs: Any
+) -> None:
+    """Remove any pre-signed OCSP responses for a certificate that was issued or revoked."""
+    if isinstance(cert, CertificateAuthority):
+        if cert.parent is None:  # root certificate authorities are never checked via OCSP
+            return
+        cache_key = get_ocsp_response_cache_key(cert.parent.serial, cert.serial, ca_ocsp=True)
+    else:
+        cache_key = get_ocsp_response_cache_key(cert.ca.serial, cert.serial)
+
+    cache.delete(cache_key)
+
+
+@receiver(post_issue_certs)
+def invalidate_ocsp_response_cache_for_certificates(
+    sender: Any, certs: list[Certificate], **kwargs: Any
+) -> None:
+    """Remove any pre-signed OCSP responses for certificates that were issued in bulk."""
+    cache.delete_many([get_ocsp_response_cache_key(cert.ca.serial, cert.serial) for cert in certs])
+
+
+@receiver(post_save, sender=AcmeAccount)
+@receiver(post_delete, sender=AcmeAccount)
+def invalidate_acme_account_cache_for_account(sender: Any, instance: AcmeAccount, **kwargs: Any) -> None:
+    """Remove an ACME account from the account cache when it is updated or deleted."""
+    account_cache.invalidate(account=instance)
+
+
+@receiver(post_save, sender=CertificateAuthority)
+@receiver(post_delete, sender=CertificateAuthority)
+def invalidate_acme_account_cache_for_ca(sender: Any, instance: CertificateAuthority, **kwargs: Any) -> None:
+    """Remove all ACME accounts of a certificate authority from the account cache when the CA is updated."""
+    account_cache.invalidate(ca=instance)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+@receiver(post_save, sender=Group)
+@receiver(post_delete, sender=Group)
+@receiver(post_delete, sender=Permission)
+def invalidate_api_user_cache(sender: Any, **kwargs: Any) -> None:
+    """Clear the cache of REST API users when a user, group or permission is changed."""
+    user_cache.invalidate()
+
+
+@receiver(m2m_changed)
+def invalidate_api_user_cache_for_permissions(sender: Any, instance: Any, model: Any, **kwargs: Any) -> None:
+    """Clear the cache of REST API users when permissions or group memberships are changed."""
+    if model in (Group, Permission) or isinstance(instance, (Group, Permission)):
+        user_cache.invalidate()
+
+
+@receiver(post_save, sender=CertificateAuthority)
+@receiver(post_delete, sender=CertificateAuthority)
+def invalidate_acme_directory_cache(
+    sender: Any,
+    instance: CertificateAuthority,
+    update_fields: Optional[Iterable[str]] = None,
+    **kwargs: Any,
+) -> None:
+    """Remove the cached ACME directory of a certificate authority when it is updated."""
+    if update_fields is not None and not ACME_DIRECTORY_FIELDS.intersection(update_fields):
+        return
+
+    # The default CA may also have changed.
+    cache.delete_many([get_acme_directory_cache_key(instance.serial), get_acme_directory_cache_key()])
@@ -55,6 +55,21 @@ cert : :py:class:`~django_ca.models.Certificate`
     The certificate that was just issued.
 """
 
+post_issue_certs = django.dispatch.Signal()
+"""Called after multiple certificates were issued with
+:py:func:`Certificate.objects.create_certs() <django_ca.managers.CertificateManager.create_certs>`.
+
+.. versionadded:: 1.29.0
+
+Note that :py:attr:`~django_ca.signals.post_issue_cert` is **not** called for certificates issued this way.
+
+Parameters
+----------
+
+certs : list of :py:class:`~django_ca.models.Certificate`
+    The certificates that were just issued.
+"""
+
 pre_sign_cert = django.dispatch.Signal()
 """Called before signing a certificate.
 
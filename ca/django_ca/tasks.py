@@ -16,23 +16,24 @@
 .. seealso:: https://docs.celeryproject.org/en/stable/index.html
 """
 
+import asyncio
 import logging
 import typing
 from collections.abc import Iterable
-from datetime import datetime, timedelta, timezone as tz
-from http import HTTPStatus
+from datetime import datetime, timezone as tz
 from typing import Any, Optional
 
-import requests
+from pydantic import BaseModel
 
 from cryptography import x509
 from cryptography.x509.oid import ExtensionOID
 
+from django.core.cache import cache
 from django.db import transaction
 from django.utils import timezone
 
 from django_ca import ca_settings
-from django_ca.acme.validation import validate_dns_01
+from django_ca.acme.validation import validate_challenges, validate_dns_01, validate_http_01
 from django_ca.constants import EXTENSION_DEFAULT_CRITICAL
 from django_ca.models import (
     AcmeAuthorization,
@@ -53,12 +54,21 @@ from django_ca.typehints import (
     SerializedPydanticExtension,
     SerializedPydanticName,
 )
-from django_ca.utils import parse_general_name
+from django_ca.utils import get_acme_order_validation_cache_key, parse_general_name
 
 log = logging.getLogger(__name__)
 
 FuncTypeVar = typing.TypeVar("FuncTypeVar", bound=typing.Callable[..., Any])
 
+#: Seconds after which a scheduled (but not yet started) order validation may be scheduled again.
+ACME_ORDER_VALIDATION_LOCK_TIMEOUT = 300
+
+#: Seconds after which queued ACME certificates are issued again if a task was blocked by other workers.
+ACME_ISSUANCE_RETRY_DELAY = 10
+
+#: Cache key that is set while a retry of acme_issue_queued_certificates() is scheduled.
+ACME_ISSUANCE_RETRY_CACHE_KEY = "acme_issuance_retry"
+
 try:
     from celery import shared_task
     from celery.local import Proxy
@@ -85,8 +95,13 @@ def run_task(task: "Proxy[FuncTypeVar]", *args: Any, **kwargs: Any) -> Any:
 
 
 @shared_task
-def cache_crl(serial: str, key_backend_options: Optional[dict[str, JSON]] = None) -> None:
-    """Task to cache the CRL for a given CA."""
+def cache_crl(
+    serial: str, key_backend_options: Optional[dict[str, JSON]] = None, delta: bool = False
+) -> None:
+    """Task to cache the CRL for a given CA.
+
+    If `delta` is ``True``, only delta CRLs are cached.
+    """
     if key_backend_options is None:
         key_backend_options = {}
 
@@ -94,14 +109,19 @@ def cache_crl(serial: str, key_backend_options: Optional[dict[str, JSON]] = None
     key_backend_options_model = ca.key_backend.use_model.model_validate(
         key_backend_options, context={"ca": ca}, strict=True
     )
-    ca.cache_crls(key_backend_options_model)
+    ca.cache_crls(key_backend_options_model, delta=delta)
 
 
 @shared_task
 def cache_crls(
-    serials: Optional[Iterable[str]] = None, key_backend_options: Optional[dict[str, dict[str, JSON]]] = None
+    serials: Optional[Iterable[str]] = None,
+    key_backend_options: Optional[dict[str, dict[str, JSON]]] = None,
+    delta: bool = False,
 ) -> None:
-    """Task to cache the CRLs for all CAs."""
+    """Task to cache the CRLs for all CAs.
+
+    If `delta` is ``True``, only delta CRLs are cached.
+    """
     if serials is None:
         serials = []
     if key_backend_options is None:
@@ -114,7 +134,7 @@ def cache_crls(
 
     for serial in serials:
         try:
-            run_task(cache_crl, serial, key_backend_options=key_backend_options.get(serial, {}))
+            run_task(cache_crl, serial, key_backend_options=key_backend_options.get(serial, {}), delta=delta)
         except Exception:  # pylint: disable=broad-exception-caught
             # NOTE: When using Celery, an exception will only be raised here if task.delay() itself raises an
             # exception, e.g. if the connection to the broker fails. Without celery, exceptions in cache_crl()
@@ -289,33 +309,9 @@ def acme_validate_challenge(challenge_pk: int) -> None:
         log.error("%s: Authentication is not usable", challenge)
         return
 
-    # General data for challenge validation
-    value = challenge.auth.value
-
-    # Challenge is marked as invalid by default
-    challenge_valid = False
-
     # Validate HTTP challenge (only thing supported so far)
     if challenge.type == AcmeChallenge.TYPE_HTTP_01:
-        decoded_token = challenge.encoded_token.decode("utf-8")
-        expected = challenge.expected
-
-        if requests is None:  # pragma: no cover
-            log.error("requests is not installed, cannot do http-01 challenge validation.")
-            return
-
-        url = f"http://{value}/.well-known/acme-challenge/{decoded_token}"
-
-        try:
-            with requests.get(url, timeout=1, stream=True) as response:
-                # Only fetch the response body if the status code is HTTP 200 (OK)
-                if response.status_code == HTTPStatus.OK:
-                    # Only fetch the expected number of bytes to prevent a large file ending up in memory
-                    # But fetch one extra byte (if available) to make sure that response has no extra bytes
-                    received = response.raw.read(len(expected) + 1, decode_content=True)
-                    challenge_valid = received == expected
-        except Exception as ex:  # pylint: disable=broad-except
-            log.exception(ex)
+        challenge_valid = validate_http_01(challenge)
     elif challenge.type == AcmeChallenge.TYPE_DNS_01:
         challenge_valid = validate_dns_01(challenge)
 
@@ -327,7 +323,12 @@ def acme_validate_challenge(challenge_pk: int) -> None:
     #     )
     else:
         log.error("%s: Challenge type is not supported.", challenge)
+        challenge_valid = False
+
+    _acme_update_challenge_status(challenge, challenge_valid)
+
 
+def _acme_update_challenge_status(challenge: AcmeChallenge, challenge_valid: bool) -> None:
     # Transition state of the challenge depending on if the challenge is valid or not. RFC8555, Section 7.1.6:
     #
     #   "If validation is successful, the challenge moves to the "valid" state; if there is an error, the
@@ -376,23 +377,146 @@ def acme_validate_challenge(challenge_pk: int) -> None:
 
 
 @shared_task
-@transaction.atomic
-def acme_issue_certificate(acme_certificate_pk: int) -> None:
-    """Actually issue an ACME certificate."""
+def acme_validate_challenges(challenge_pks: list[int]) -> None:
+    """Validate many ACME challenges concurrently.
+
+    Unlike :py:func:`~django_ca.tasks.acme_validate_challenge`, DNS queries and HTTP requests for all
+    challenges are made concurrently (see :py:func:`~django_ca.acme.validation.validate_challenges`) and
+    outside of a database transaction. The state of each challenge is then updated in a separate, short
+    transaction.
+    """
     if not ca_settings.CA_ENABLE_ACME:
         log.error("ACME is not enabled.")
         return
 
-    try:
-        acme_cert = AcmeCertificate.objects.select_related("order__account__ca").get(pk=acme_certificate_pk)
-    except AcmeCertificate.DoesNotExist:
-        log.error("Certificate with id=%s not found", acme_certificate_pk)
+    challenges: list[AcmeChallenge] = []
+    queryset = AcmeChallenge.objects.url().filter(pk__in=challenge_pks).order_by("pk")
+    for challenge in queryset:
+        # Whoever is invoking this task is responsible for setting the status to "processing" first.
+        if challenge.status != AcmeChallenge.STATUS_PROCESSING:
+            log.error(
+                "%s: %s: Invalid state (must be %s)",
+                challenge,
+                challenge.status,
+                AcmeChallenge.STATUS_PROCESSING,
+            )
+        elif challenge.auth.usable is False:
+            log.error("%s: Authentication is not usable", challenge)
+        else:
+            challenges.append(challenge)
+
+    for challenge_pk in sorted(set(challenge_pks) - {challenge.pk for challenge in queryset}):
+        log.error("Challenge with id=%s not found", challenge_pk)
+
+    if not challenges:
         return
 
-    if acme_cert.usable is False:
-        log.error("%s: Cannot issue certificate for this order", acme_cert.order)
+    results = asyncio.run(
+        validate_challenges(
+            challenges,
+            concurrency=ca_settings.ACME_VALIDATION_CONCURRENCY,
+            timeout=ca_settings.ACME_VALIDATION_TIMEOUT,
+        )
+    )
+
+    for challenge in challenges:
+        with transaction.atomic():
+            # Another challenge of the same order may have changed its state in the meantime.
+            challenge.auth.order.refresh_from_db(fields=["status"])
+            _acme_update_challenge_status(challenge, results[challenge.pk])
+
+
+@shared_task
+def acme_validate_order(order_pk: int) -> None:
+    """Validate all challenges of an ACME order that are in the "processing" state.
+
+    Challenges are validated concurrently like in :py:func:`~django_ca.tasks.acme_validate_challenges`, and
+    DNS queries are shared between challenges. All state transitions (including the order itself) are then
+    stored in a single, short transaction.
+    """
+    if not ca_settings.CA_ENABLE_ACME:
+        log.error("ACME is not enabled.")
         return
 
+    # Release the lock acquired by schedule_acme_order_validation() *before* loading challenges, so that a
+    # challenge that is set to "processing" after this point schedules a new task.
+    cache.delete(get_acme_order_validation_cache_key(order_pk))
+
+    challenges: list[AcmeChallenge] = []
+    queryset = AcmeChallenge.objects.url().filter(auth__order_id=order_pk)
+    for challenge in queryset.filter(status=AcmeChallenge.STATUS_PROCESSING).order_by("pk"):
+        if challenge.auth.usable is False:
+            log.error("%s: Authentication is not usable", challenge)
+        else:
+            challenges.append(challenge)
+
+    if not challenges:
+        log.info("Order with id=%s has no challenges to validate.", order_pk)
+        return
+
+    results = asyncio.run(
+        validate_challenges(
+            challenges,
+            concurrency=ca_settings.ACME_VALIDATION_CONCURRENCY,
+            timeout=ca_settings.ACME_VALIDATION_TIMEOUT,
+        )
+    )
+
+    now = timezone.now()
+    with transaction.atomic():
+        order = AcmeOrder.objects.select_for_update().get(pk=order_pk)
+
+        # Another task may have validated some challenges in the meantime.
+        processing = set(
+            AcmeChallenge.objects.select_for_update()
+            .filter(pk__in=results, status=AcmeChallenge.STATUS_PROCESSING)
+            .values_list("pk", flat=True)
+        )
+        challenges = [challenge for challenge in challenges if challenge.pk in processing]
+        if not challenges:
+            return
+
+        # See _acme_update_challenge_status() for the state transitions mandated by RFC 8555.
+        for challenge in challenges:
+            if results[challenge.pk]:
+                challenge.status = AcmeChallenge.STATUS_VALID
+                challenge.validated = now
+                challenge.auth.status = AcmeAuthorization.STATUS_VALID
+            else:
+                challenge.status = AcmeChallenge.STATUS_INVALID
+                challenge.auth.status = AcmeAuthorization.STATUS_INVALID
+            log.info("%s is %s", challenge, challenge.status)
+
+        AcmeChallenge.objects.bulk_update(challenges, ["status", "validated"])
+        AcmeAuthorization.objects.bulk_update([challenge.auth for challenge in challenges], ["status"])
+
+        if any(challenge.status == AcmeChallenge.STATUS_INVALID for challenge in challenges):
+            order.status = AcmeOrder.STATUS_INVALID
+            order.save()
+        elif not order.authorizations.exclude(status=AcmeAuthorization.STATUS_VALID).exists():
+            log.info("Order is now valid")
+            order.status = AcmeOrder.STATUS_READY
+            order.save()
+
+
+def schedule_acme_order_validation(order_pk: int) -> None:
+    """Run :py:func:`~django_ca.tasks.acme_validate_order` for the given order unless it is already queued.
+
+    If a task for the order is queued but has not started yet, it will also validate any challenge that was
+    set to "processing" in the meantime, so no second task is required. The lock expires after
+    ``ACME_ORDER_VALIDATION_LOCK_TIMEOUT`` seconds in case a queued task is lost.
+    """
+    cache_key = get_acme_order_validation_cache_key(order_pk)
+    if cache.add(cache_key, True, ACME_ORDER_VALIDATION_LOCK_TIMEOUT):
+        run_task(acme_validate_order, order_pk)
+    else:
+        log.debug("Validation of order with id=%s is already scheduled.", order_pk)
+
+
+def _acme_issue_certificate(
+    acme_cert: AcmeCertificate, ca: CertificateAuthority, key_backend_options: BaseModel
+) -> None:
+    """Issue the certificate for `acme_cert`, signed by `ca` (the CA of the ACME account)."""
     names = [a.subject_alternative_name for a in acme_cert.order.authorizations.all()]
     log.info("%s: Issuing certificate for %s", acme_cert.order, ",".join(names))
     subject_alternative_names = x509.SubjectAlternativeName([parse_general_name(name) for name in names])
@@ -405,7 +529,6 @@ def acme_issue_certificate(acme_certificate_pk: int) -> None:
         )
     ]
 
-    ca = acme_cert.order.account.ca
     profile = profiles[ca.acme_profile]
 
     # Honor not_after from the order if set
@@ -420,9 +543,6 @@ def acme_issue_certificate(acme_certificate_pk: int) -> None:
 
     csr = acme_cert.parse_csr()
 
-    # Initialize key backend options
-    key_backend_options = ca.key_backend.get_use_private_key_options(ca, {})
-
     # Finally, actually create a certificate
     cert = Certificate.objects.create_cert(
         ca, key_backend_options, csr=csr, profile=profile, expires=expires, extensions=extensions
@@ -436,13 +556,112 @@ def acme_issue_certificate(acme_certificate_pk: int) -> None:
 
 @shared_task
 @transaction.atomic
-def acme_cleanup() -> None:
-    """Cleanup expired ACME orders."""
+def acme_issue_certificate(acme_certificate_pk: int) -> None:
+    """Actually issue an ACME certificate."""
+    if not ca_settings.CA_ENABLE_ACME:
+        log.error("ACME is not enabled.")
+        return
+
+    try:
+        acme_cert = AcmeCertificate.objects.select_related("order__account__ca").get(pk=acme_certificate_pk)
+    except AcmeCertificate.DoesNotExist:
+        log.error("Certificate with id=%s not found", acme_certificate_pk)
+        return
+
+    if acme_cert.usable is False:
+        log.error("%s: Cannot issue certificate for this order", acme_cert.order)
+        return
+
+    ca = acme_cert.order.account.ca
+
+    # Initialize key backend options
+    key_backend_options = ca.key_backend.get_use_private_key_options(ca, {})
+
+    _acme_issue_certificate(acme_cert, ca, key_backend_options)
+
+
+def _acme_issue_queued_certificates(ca: CertificateAuthority, batch_size: int) -> int:
+    """Claim and issue queued certificates of `ca` in batches until no more certificates can be claimed."""
+    claimed = AcmeCertificate.objects.claim(ca, batch_size)
+    if not claimed:
+        return 0
+
+    issued = 0
+    key_backend_options = ca.key_backend.get_use_private_key_options(ca, {})
+    with ca.key_backend.keep_key_loaded(ca, key_backend_options):
+        while claimed:
+            for acme_cert in claimed:
+                try:
+                    with transaction.atomic():
+                        _acme_issue_certificate(acme_cert, ca, key_backend_options)
+                except Exception:  # pylint: disable=broad-exception-caught  # issue remaining certificates
+                    log.exception("%s: Could not issue certificate.", acme_cert.order)
+                    AcmeOrder.objects.filter(pk=acme_cert.order_id).update(status=AcmeOrder.STATUS_INVALID)
+                else:
+                    issued += 1
+
+            claimed = AcmeCertificate.objects.claim(ca, batch_size)
+    return issued
+
+
+@shared_task
+def acme_issue_queued_certificates(batch_size: int = 10, reschedule: bool = False) -> int:
+    """Issue certificates queued if :ref:`CA_ACME_ISSUANCE_QUEUE <settings-acme-issuance-queue>` is enabled.
+
+    For every CA, batches of up to `batch_size` certificates are claimed (see
+    :py:meth:`~django_ca.querysets.AcmeCertificateQuerySet.claim`) and issued while the private key of the CA
+    is kept loaded, until the queue of the CA is empty or other workers already issue as many batches as
+    allowed. Every certificate is issued in its own transaction. If issuing a certificate fails, the order is
+    marked as invalid.
+
+    If `reschedule` is ``True`` and Celery is used, the task schedules itself again after
+    ``ACME_ISSUANCE_RETRY_DELAY`` seconds if certificates remain queued because other workers issue
+    certificates. This makes sure that certificates are issued even if the other workers stop (e.g. because
+    they crashed) and their claims time out.
+
+    Returns the number of certificates issued.
+    """
+    if not ca_settings.CA_ENABLE_ACME:
+        log.error("ACME is not enabled.")
+        return 0
+
+    issued = 0
+    cas = list(CertificateAuthority.objects.acme().usable())
+    for ca in cas:
+        issued += _acme_issue_queued_certificates(ca, batch_size)
+
+    # Certificates that are still queued are claimed by other workers.
+    if reschedule is True and ca_settings.CA_USE_CELERY is True:
+        blocked = AcmeCertificate.objects.queued().filter(order__account__ca__in=cas).exists()
+
+        # Only schedule one retry at a time. The lock expires when the retry is started.
+        if blocked and cache.add(ACME_ISSUANCE_RETRY_CACHE_KEY, True, ACME_ISSUANCE_RETRY_DELAY):
+            log.debug("Queued certificates are issued by other workers, retrying later.")
+            acme_issue_queued_certificates.apply_async(
+                (), {"batch_size": batch_size, "reschedule": True}, countdown=ACME_ISSUANCE_RETRY_DELAY
+            )
+
+    return issued
+
+
+@shared_task
+def acme_cleanup(batch_size: int = 1000) -> None:
+    """Cleanup expired ACME orders.
+
+    Orders that expired more than a day ago are deleted, pending or invalid orders are deleted as soon as they
+    expire. Orders are deleted (together with their authorizations, challenges and certificates) in batches
+    of `batch_size` orders, each in its own transaction. If the task is interrupted, the next run will
+    continue where it stopped.
+    """
     if not ca_settings.CA_ENABLE_ACME:
         # NOTE: Since this task does only cleanup, log message is only info.
         log.info("ACME is not enabled, not doing anything.")
         return
 
-    # Delete orders that expired more than a day ago.
-    threshold = timezone.now() - timedelta(days=1)
-    AcmeOrder.objects.filter(expires__lt=threshold).delete()
+    orders = total = 0
+    for deleted, counts in AcmeOrder.objects.expired().delete_in_batches(batch_size):
+        orders += counts[AcmeOrder._meta.label]
+        total += deleted
+        log.debug("Deleted %s expired ACME orders (%s objects) so far.", orders, total)
+
+    log.info("Deleted %s expired ACME orders (%s objects).", orders, total)
@@ -0,0 +1,124 @@
+# This file is part of django-ca (https://github.com/mathiasertl/django-ca).
+#
+# django-ca is free software: you can redistribute it and/or modify it under the terms of the GNU General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# django-ca is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the
+# implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License
+# for more details.
+#
+# You should have received a copy of the GNU General Public License along with django-ca. If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""Test the per-process ACME account cache."""
+
+from collections.abc import Iterator
+from unittest import mock
+
+import josepy as jose
+
+import pytest
+
+from django_ca.acme.cache import AcmeAccountCache, account_cache
+from django_ca.models import AcmeAccount, CertificateAuthority
+from django_ca.tests.base.constants import CERT_DATA
+
+JWK = jose.jwk.JWKRSA(key=CERT_DATA["root-cert"]["key"]["parsed"].public_key())
+
+
+def create_account(ca: CertificateAuthority, slug: str) -> AcmeAccount:
+    """Create a minimal account."""
+    return AcmeAccount.objects.create(ca=ca, slug=slug, kid=slug, pem=slug, thumbprint=slug)
+
+
+@pytest.fixture(name="cache")
+def fixture_cache() -> Iterator[AcmeAccountCache]:
+    """Fixture for an empty cache with room for two accounts."""
+    yield AcmeAccountCache(maxsize=2)
+
+
+@pytest.fixture()
+def clear_account_cache() -> Iterator[None]:
+    """Fixture to make sure that the global account cache is empty after the test."""
+    yield
+    account_cache.invalidate()
+
+
+def test_get_and_set(cache: AcmeAccountCache, root: CertificateAuthority) -> None:
+    """Test basic cache operations."""
+    account = create_account(root, "abc")
+    assert cache.get(root.serial, "abc", 60) is None
+
+    cache.set(root.serial, "abc", account, JWK)
+    cached = cache.get(root.serial, "abc", 60)
+    assert cached is not None
+    assert cached[0] == account
+    assert cached[0].ca == root
+    assert cached[1] is JWK
+
+    # Accounts are copied, so that views cannot modify cached accounts
+    assert cached[0] is not account
+    assert cached[0].ca is not root
+    cached[0].status = AcmeAccount.STATUS_DEACTIVATED
+    assert cache.get(root.serial, "abc", 60)[0].status == AcmeAccount.STATUS_VALID  # type: ignore[index]
+
+
+def test_timeout(cache: AcmeAccountCache, root: CertificateAuthority) -> None:
+    """Test that entries expire after the timeout."""
+    cache.set(root.serial, "abc", create_account(root, "abc"), JWK)
+    with mock.patch("django_ca.acme.cache.time.monotonic", return_value=10e9):
+        assert cache.get(root.serial, "abc", 60) is None
+    assert len(cache) == 0
+
+
+def test_lru(cache: AcmeAccountCache, root: CertificateAuthority) -> None:
+    """Test that the least recently used entry is removed if the cache is full."""
+    cache.set(root.serial, "a", create_account(root, "a"), JWK)
+    cache.set(root.serial, "b", create_account(root, "b"), JWK)
+    assert cache.get(root.serial, "a", 60) is not None  # "b" is now the least recently used entry
+    cache.set(root.serial, "c", create_account(root, "c"), JWK)
+
+    assert len(cache) == 2
+    assert cache.get(root.serial, "a", 60) is not None
+    assert cache.get(root.serial, "b", 60) is None
+    assert cache.get(root.serial, "c", 60) is not None
+
+
+def test_invalidate(root: CertificateAuthority, child: CertificateAuthority) -> None:
+    """Test invalidating accounts."""
+    cache = AcmeAccountCache()
+    root_account = create_account(root, "a")
+    cache.set(root.serial, "a", root_account, JWK)
+    cache.set(root.serial, "b", create_account(root, "b"), JWK)
+    cache.set(child.serial, "c", create_account(child, "c"), JWK)
+
+    cache.invalidate(account=root_account)
+    assert cache.get(root.serial, "a", 60) is None
+    assert len(cache) == 2
+
+    cache.invalidate(ca=root)
+    assert cache.get(root.serial, "b", 60) is None
+    assert len(cache) == 1
+
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+@pytest.mark.usefixtures("clear_account_cache")
+def test_invalidate_with_signals(root: CertificateAuthority, child: CertificateAuthority) -> None:
+    """Test that saving or deleting accounts and certificate authorities invalidates the cache."""
+    accounts = [create_account(root, "a"), create_account(root, "b"), create_account(child, "c")]
+    for account in accounts:
+        account_cache.set(account.ca.serial, account.kid, account, JWK)
+
+    accounts[0].save()
+    assert account_cache.get(root.serial, "a", 60) is None
+    assert len(account_cache) == 2
+
+    root.save()
+    assert account_cache.get(root.serial, "b", 60) is None
+    assert len(account_cache) == 1
+
+    accounts[2].delete()
+    assert len(account_cache) == 0
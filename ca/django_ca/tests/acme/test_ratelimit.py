@@ -0,0 +1,90 @@
+# This file is part of django-ca (https://github.com/mathiasertl/django-ca).
+#
+# django-ca is free software: you can redistribute it and/or modify it under the terms of the GNU General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# django-ca is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the
+# implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License
+# for more details.
+#
+# You should have received a copy of the GNU General Public License along with django-ca. If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""Test rate limiting of ACMEv2 requests."""
+
+from http import HTTPStatus
+from unittest import mock
+
+from django.core.cache import cache
+
+import pytest
+from pytest_django.fixtures import SettingsWrapper
+
+from django_ca.acme.errors import AcmeRateLimited
+from django_ca.acme.ratelimit import consume, get_registered_domain
+
+
+@pytest.fixture(autouse=True)
+def rate_limits(settings: SettingsWrapper) -> None:
+    """Fixture to configure a rate limit of two tokens per minute for accounts."""
+    cache.clear()
+    settings.CA_ACME_RATE_LIMITS = {"account": (2, 60)}
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    (
+        ("example.com", "example.com"),
+        ("www.example.com", "example.com"),
+        ("*.a.b.EXAMPLE.com.", "example.com"),
+        ("localhost", "localhost"),
+    ),
+)
+def test_get_registered_domain(value: str, expected: str) -> None:
+    """Test get_registered_domain()."""
+    assert get_registered_domain(value) == expected
+
+
+def test_consume() -> None:
+    """Test consuming tokens."""
+    with mock.patch("django_ca.acme.ratelimit.time.time", return_value=90.5):
+        consume("account", "abc")
+        consume("account", "abc")
+        consume("account", "def")  # other accounts are not affected
+        with pytest.raises(AcmeRateLimited) as excinfo:
+            consume("account", "abc")
+    assert excinfo.value.kwargs == {"retry_after": 30, "message": "Rate limit exceeded for account abc."}
+
+    # Bucket is refilled in the next period
+    with mock.patch("django_ca.acme.ratelimit.time.time", return_value=120):
+        consume("account", "abc")
+
+
+def test_consume_without_limit() -> None:
+    """Test that nothing is done for scopes without a rate limit."""
+    with mock.patch("django_ca.acme.ratelimit.cache") as cache_mock:
+        consume("ca", "abc")
+    assert cache_mock.method_calls == []
+
+
+def test_concurrent_first_request() -> None:
+    """Test that a bucket created by a concurrent request is used."""
+
+    def add(key: str, value: int, timeout: int) -> bool:
+        cache.set(key, value, timeout)  # simulate a concurrent request creating the bucket
+        return False
+
+    with mock.patch("django_ca.acme.ratelimit.time.time", return_value=90.5):
+        with mock.patch.object(cache, "add", side_effect=add):
+            consume("account", "abc")  # bucket now holds two used tokens
+        with pytest.raises(AcmeRateLimited):
+            consume("account", "abc")
+
+
+def test_rate_limited_response() -> None:
+    """Test the response for a rate limited request."""
+    response = AcmeRateLimited(retry_after=30, message="foo").get_response()
+    assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    assert response["Retry-After"] == "30"
+    assert response["Content-Type"] == "application/problem+json"
@@ -160,6 +160,17 @@ class AcmeTestCaseMixin(TestCaseMixin):
             resp, "unauthorized", status=HTTPStatus.UNAUTHORIZED, message=message, **kwargs
         )
 
+    # NOINSPECTION NOTE: PyCharm does not detect mixins as a TestCase
+    # noinspection PyPep8Naming
+    def assertRateLimited(  # pylint: disable=invalid-name
+        self, resp: "HttpResponse", message: str, retry_after: int, **kwargs: Any
+    ) -> None:
+        """Assert a rateLimited response."""
+        self.assertAcmeProblem(
+            resp, "rateLimited", status=HTTPStatus.TOO_MANY_REQUESTS, message=message, **kwargs
+        )
+        self.assertEqual(resp["Retry-After"], str(retry_after))
+
     def get_nonce(self, ca: Optional[CertificateAuthority] = None) -> bytes:
         """Get a nonce with an actual request.
 
@@ -416,6 +427,15 @@ class AcmeBaseViewTestCaseMixin(AcmeTestCaseMixin, typing.Generic[MessageTypeVar
                 resp = self.acme(self.url, self.message, kid=kid)
         self.assertUnauthorized(resp, "URL does not match.", link_relations={"index": "foo"})
 
+    @override_tmpcadir(CA_ACME_RATE_LIMITS={"ca": (1, 60)})
+    def test_rate_limit_ca(self) -> None:
+        """Test the rate limit for requests to a certificate authority."""
+        kid = self.kid if self.requires_kid else None
+        with mock.patch("django_ca.acme.ratelimit.time.time", return_value=90.5):
+            self.acme(self.url, self.message, kid=kid)
+            resp = self.acme(self.url, self.message, kid=kid)
+        self.assertRateLimited(resp, f"Rate limit exceeded for ca {self.ca.serial}.", retry_after=30)
+
     @override_tmpcadir()
     def test_payload_in_post_as_get(self) -> None:
         """Test sending a payload to a post-as-get request."""
@@ -485,6 +505,15 @@ class AcmeWithAccountViewTestCaseMixin(
         """Test doing request with an unknown kid."""
         self.assertUnauthorized(self.acme(self.url, self.message, kid="unknown"), "Account not found.")
 
+    @override_tmpcadir(CA_ACME_RATE_LIMITS={"account": (1, 60)})
+    def test_rate_limit_account(self) -> None:
+        """Test the rate limit for requests from an account."""
+        with mock.patch("django_ca.acme.ratelimit.time.time", return_value=90.5):
+            self.acme(self.url, self.message, kid=self.kid)
+            resp = self.acme(self.url, self.message, kid=self.kid)
+        message = f"Rate limit exceeded for account {self.main_account.slug}."
+        self.assertRateLimited(resp, message, retry_after=30)
+
     @override_tmpcadir()
     def test_unusable_account(self) -> None:
         """Test doing a request with an unusable account."""
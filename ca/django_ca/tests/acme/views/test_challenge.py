@@ -25,7 +25,7 @@ from django.test import TransactionTestCase
 from freezegun import freeze_time
 
 from django_ca.models import AcmeAuthorization, AcmeChallenge, AcmeOrder
-from django_ca.tasks import acme_validate_challenge
+from django_ca.tasks import acme_validate_challenge, acme_validate_order
 from django_ca.tests.acme.views.base import AcmeWithAccountViewTestCaseMixin
 from django_ca.tests.base.constants import TIMESTAMPS
 from django_ca.tests.base.utils import override_tmpcadir
@@ -58,6 +58,22 @@ class AcmeChallengeViewTestCase(
         """Get default generic url."""
         return self.get_url(serial=self.challenge.serial, slug=self.challenge.slug)
 
+    @override_tmpcadir(CA_ACME_VALIDATE_ORDERS=True)
+    def test_validate_orders(self) -> None:
+        """Test that the whole order is validated if CA_ACME_VALIDATE_ORDERS is set."""
+        with self.patch("django_ca.tasks.run_task") as mockcm:
+            resp = self.acme(self.url, self.message, kid=self.kid)
+        self.assertEqual(resp.status_code, HTTPStatus.OK, resp.content)
+        self.assertEqual(mockcm.call_args_list, [mock.call(acme_validate_order, self.order.pk)])
+
+        # Another challenge of the same order does not schedule a second task while the first is queued.
+        challenge = self.authz.get_challenges()[1]
+        url = self.get_url(serial=challenge.serial, slug=challenge.slug)
+        with self.patch("django_ca.tasks.run_task") as mockcm:
+            resp = self.acme(url, self.message, kid=self.kid)
+        self.assertEqual(resp.status_code, HTTPStatus.OK, resp.content)
+        self.assertEqual(mockcm.call_args_list, [])
+
     @override_tmpcadir()
     def test_basic(self) -> None:
         """Basic test for creating an account via ACME."""
@@ -13,6 +13,7 @@
 
 """Test basic ACMEv2 directory view."""
 
+from datetime import timedelta
 from http import HTTPStatus
 from unittest import mock
 
@@ -201,3 +202,63 @@ class DirectoryTestCase(TestCaseMixin, TestCase):
                 "type": "urn:ietf:params:acme:error:not-found",
             },
         )
+
+    @freeze_time(TIMESTAMPS["everything_valid"])
+    def test_cache(self) -> None:
+        """Test that directories are cached."""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response["Cache-Control"], "public, max-age=300")
+        first = response.json()
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response["Cache-Control"], "public, max-age=300")
+        second = response.json()
+
+        # Only the random entry differs
+        self.assertEqual(len(first), 6)
+        self.assertEqual(len(first.keys() & second.keys()), 5)
+        self.assertEqual(
+            {k: first[k] for k in first.keys() & second.keys()},
+            {k: second[k] for k in second.keys() & first.keys()},
+        )
+
+        # URLs depend on the hostname of the request, so the directory is cached per hostname
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, SERVER_NAME="example.com")
+        self.assertEqual(
+            response.json()["newNonce"],
+            f"http://example.com/django_ca/acme/{self.ca.serial}/new-nonce/",
+        )
+
+        # Saving the CA with unrelated fields does not invalidate the cache
+        self.ca.save(update_fields=["crl_number"])
+        with self.assertNumQueries(0):
+            self.client.get(self.url)
+
+        # Changing the CA invalidates the cache for both the default CA and the named CA
+        named_url = reverse("django_ca:acme-directory", kwargs={"serial": self.ca.serial})
+        self.client.get(named_url)
+        self.ca.website = "http://ca.example.com"
+        self.ca.save()
+        self.assertEqual(self.client.get(self.url).json()["meta"], {"website": "http://ca.example.com"})
+        self.assertEqual(self.client.get(named_url).json()["meta"], {"website": "http://ca.example.com"})
+
+    def test_cache_with_expiring_ca(self) -> None:
+        """Test that the directory is not cached for longer than the CA is valid."""
+        with freeze_time(self.ca.expires - timedelta(seconds=10)) as frozen_time:
+            self.assertEqual(self.client.get(self.url).status_code, HTTPStatus.OK)
+            frozen_time.tick(timedelta(seconds=11))
+            self.assertEqual(self.client.get(self.url).status_code, HTTPStatus.NOT_FOUND)
+
+    @freeze_time(TIMESTAMPS["everything_valid"])
+    @override_settings(CA_ACME_DIRECTORY_CACHE_TIMEOUT=0)
+    def test_cache_disabled(self) -> None:
+        """Test disabling the cache."""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertNotIn("Cache-Control", response)
+        with self.assertNumQueries(1):
+            self.client.get(self.url)
@@ -13,12 +13,20 @@
 
 """Test ACME related views."""
 
+from datetime import timedelta
 from http import HTTPStatus
+from unittest import mock
+
+import josepy as jose
 
 from django.test import TestCase
 from django.test.utils import override_settings
 from django.urls import reverse
 
+from freezegun import freeze_time
+
+from django_ca.acme.views import AcmeNewNonceView
+from django_ca.tests.base.constants import TIMESTAMPS
 from django_ca.tests.base.mixins import TestCaseMixin
 
 
@@ -58,3 +66,56 @@ class AcmeNewNonceViewTestCase(TestCaseMixin, TestCase):
         self.assertEqual(response.status_code, HTTPStatus.NO_CONTENT)
         self.assertEqual(len(response["replay-nonce"]), 43)
         self.assertEqual(response["cache-control"], "no-store")
+
+
+class AcmeNonceTestCase(TestCaseMixin, TestCase):
+    """Test generating and validating nonces."""
+
+    load_cas = ("root", "child")
+
+    def get_view(self, serial: str) -> AcmeNewNonceView:
+        """Get a view instance for the given serial."""
+        view = AcmeNewNonceView()
+        view.kwargs = {"serial": serial}
+        return view
+
+    def test_get_nonce_does_not_use_cache(self) -> None:
+        """Test that getting a nonce does not use the cache."""
+        view = self.get_view(self.ca.serial)
+        with mock.patch("django_ca.acme.views.cache") as cache_mock:
+            nonce = view.get_nonce()
+        self.assertEqual(cache_mock.mock_calls, [])
+        self.assertEqual(len(nonce), 43)
+
+    def test_validate_nonce(self) -> None:
+        """Test that a nonce can only be used once."""
+        view = self.get_view(self.ca.serial)
+        nonce = view.get_nonce()
+        self.assertTrue(view.validate_nonce(nonce))
+        self.assertFalse(view.validate_nonce(nonce))
+
+    def test_nonce_for_other_ca(self) -> None:
+        """Test that a nonce is only valid for the CA it was issued for."""
+        nonce = self.get_view(self.cas["root"].serial).get_nonce()
+        self.assertFalse(self.get_view(self.cas["child"].serial).validate_nonce(nonce))
+
+    def test_expired_nonce(self) -> None:
+        """Test that nonces expire."""
+        view = self.get_view(self.ca.serial)
+        with freeze_time(TIMESTAMPS["everything_valid"]) as frozen_time:
+            nonce = view.get_nonce()
+            frozen_time.tick(timedelta(seconds=view.nonce_validity))
+            self.assertFalse(view.validate_nonce(nonce))
+
+            # Nonce from the future
+            frozen_time.tick(timedelta(seconds=-view.nonce_validity - 1))
+            self.assertFalse(view.validate_nonce(nonce))
+
+    def test_invalid_nonce(self) -> None:
+        """Test various malformed or manipulated nonces."""
+        view = self.get_view(self.ca.serial)
+        data = jose.json_util.decode_b64jose(view.get_nonce())
+        tampered = bytes([data[0] ^ 1]) + data[1:]
+
+        for nonce in ("a", "Zm9v", jose.json_util.encode_b64jose(tampered)):
+            self.assertFalse(view.validate_nonce(nonce), nonce)
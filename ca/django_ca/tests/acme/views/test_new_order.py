@@ -16,6 +16,7 @@
 from datetime import timedelta, timezone as tz
 from http import HTTPStatus
 from typing import Any
+from unittest import mock
 
 import acme
 import acme.jws
@@ -152,6 +153,22 @@ class AcmeNewOrderViewTestCase(AcmeWithAccountViewTestCaseMixin[NewOrder], TestC
         """Test the notBefore/notAfter properties, but with timezone support."""
         self.test_not_before_not_after(accept_naive=True)
 
+    @override_tmpcadir()
+    def test_num_queries(self) -> None:
+        """Test that the number of queries does not depend on the number of identifiers."""
+        # CA, account, SAVEPOINT, order, authorizations, RELEASE SAVEPOINT
+        nonce = self.get_nonce()
+        with self.assertNumQueries(6):
+            resp = self.acme(self.url, self.message, kid=self.kid, nonce=nonce)
+        self.assertEqual(resp.status_code, HTTPStatus.CREATED, resp.content)
+
+        identifiers = [{"type": "dns", "value": f"host{i}.example.com"} for i in range(10)]
+        nonce = self.get_nonce()
+        with self.assertNumQueries(6):
+            resp = self.acme(self.url, self.get_message(identifiers=identifiers), kid=self.kid, nonce=nonce)
+        self.assertEqual(resp.status_code, HTTPStatus.CREATED, resp.content)
+        self.assertEqual(len(resp.json()["authorizations"]), 10)
+
     @override_tmpcadir()
     def test_no_identifiers(self) -> None:
         """Test sending no identifiers."""
@@ -185,3 +202,21 @@ class AcmeNewOrderViewTestCase(AcmeWithAccountViewTestCaseMixin[NewOrder], TestC
 
         resp = self.acme(self.url, self.get_message(not_before=not_before, not_after=not_after), kid=self.kid)
         self.assertMalformed(resp, "notBefore must be before notAfter.")
+
+    @override_tmpcadir(CA_ACME_RATE_LIMITS={"domain": (1, 60)})
+    def test_rate_limit_domain(self) -> None:
+        """Test the rate limit for new orders per registered domain."""
+        identifiers = [{"type": "dns", "value": "example.com"}, {"type": "dns", "value": "www.example.com"}]
+        with mock.patch("django_ca.acme.ratelimit.time.time", return_value=90.5):
+            resp = self.acme(self.url, self.get_message(identifiers=identifiers), kid=self.kid)
+            self.assertEqual(resp.status_code, HTTPStatus.CREATED, resp.content)
+
+            # Other domains are not affected
+            identifiers = [{"type": "dns", "value": "example.net"}]
+            resp = self.acme(self.url, self.get_message(identifiers=identifiers), kid=self.kid)
+            self.assertEqual(resp.status_code, HTTPStatus.CREATED, resp.content)
+
+            identifiers = [{"type": "dns", "value": "example.org"}, {"type": "dns", "value": "*.EXAMPLE.com"}]
+            resp = self.acme(self.url, self.get_message(identifiers=identifiers), kid=self.kid)
+        self.assertRateLimited(resp, "Rate limit exceeded for domain example.com.", retry_after=30)
+        self.assertEqual(AcmeOrder.objects.all().count(), 2)
@@ -14,9 +14,11 @@
 """Test viewing an order."""
 
 from http import HTTPStatus
+from unittest import mock
 
 import josepy as jose
 import pyrfc3339
+from acme import messages
 
 from django.test import TestCase, override_settings
 from django.utils import timezone
@@ -24,6 +26,7 @@ from django.utils import timezone
 from freezegun import freeze_time
 
 from django_ca import ca_settings
+from django_ca.acme.cache import account_cache
 from django_ca.acme.errors import AcmeUnauthorized
 from django_ca.models import AcmeAccount, AcmeAuthorization, AcmeCertificate, AcmeOrder
 from django_ca.tests.acme.views.base import AcmeWithAccountViewTestCaseMixin
@@ -150,6 +153,32 @@ class AcmeOrderViewTestCase(AcmeWithAccountViewTestCaseMixin[jose.json_util.JSON
             },
         )
 
+    @override_tmpcadir()
+    def test_num_queries(self) -> None:
+        """Test that the number of queries does not depend on the number of authorizations."""
+        self.order.status = AcmeOrder.STATUS_VALID
+        self.order.save()
+        AcmeCertificate.objects.create(order=self.order, cert=self.cert)
+
+        # CA, account, order (including the certificate) and authorizations
+        nonce = self.get_nonce()
+        with self.assertNumQueries(4):
+            resp = self.acme(self.url, self.message, kid=self.kid, nonce=nonce)
+        self.assertEqual(resp.status_code, HTTPStatus.OK, resp.content)
+
+        identifiers = [
+            messages.Identifier(typ=messages.IDENTIFIER_FQDN, value=f"host{i}.example.com") for i in range(10)
+        ]
+        self.order.add_authorizations(identifiers)
+        AcmeAuthorization.objects.update(status=AcmeAuthorization.STATUS_VALID)
+
+        nonce = self.get_nonce()
+        with self.assertNumQueries(4):
+            resp = self.acme(self.url, self.message, kid=self.kid, nonce=nonce)
+        self.assertEqual(resp.status_code, HTTPStatus.OK, resp.content)
+        self.assertEqual(len(resp.json()["authorizations"]), 11)
+        self.assertIn("certificate", resp.json())
+
     @override_tmpcadir()
     def test_wrong_account(self) -> None:
         """Test viewing for the wrong account."""
@@ -186,3 +215,46 @@ class AcmeOrderViewTestCase(AcmeWithAccountViewTestCaseMixin[jose.json_util.JSON
         ):
             resp = self.acme(self.url, self.message, kid=self.kid)
         self.assertUnauthorized(resp, "foo")
+
+    @override_tmpcadir(CA_ACME_ACCOUNT_CACHE_TIMEOUT=60)
+    def test_account_cache(self) -> None:
+        """Test that the account and its key are loaded only once if the account cache is enabled."""
+        self.addCleanup(account_cache.invalidate)
+        with mock.patch("josepy.jwk.JWK.load", side_effect=jose.jwk.JWK.load) as load_mock:
+            resp = self.acme(self.url, self.message, kid=self.kid)
+            self.assertEqual(resp.status_code, HTTPStatus.OK, resp.content)
+            load_mock.assert_called_once()
+
+            nonce = self.get_nonce()
+            with self.assertNumQueries(2):  # would be 4 without cache
+                resp = self.acme(self.url, self.message, kid=self.kid, nonce=nonce)
+            self.assertEqual(resp.status_code, HTTPStatus.OK, resp.content)
+            load_mock.assert_called_once()
+
+        # Deactivating the account removes it from the cache
+        self.account.status = AcmeAccount.STATUS_DEACTIVATED
+        self.account.save()
+        resp = self.acme(self.url, self.message, kid=self.kid)
+        self.assertUnauthorized(resp, "Account has been deactivated.")
+
+    @override_tmpcadir(CA_ACME_ACCOUNT_CACHE_TIMEOUT=60)
+    def test_account_cache_with_ca_changes(self) -> None:
+        """Test that changes to the CA are honored if the account cache is enabled."""
+        self.addCleanup(account_cache.invalidate)
+        resp = self.acme(self.url, self.message, kid=self.kid)
+        self.assertEqual(resp.status_code, HTTPStatus.OK, resp.content)
+
+        # The CA is no longer usable, although the cached account still references a usable CA
+        with freeze_time(TIMESTAMPS["everything_expired"]):
+            resp = self.acme(self.url, self.message, kid=self.kid)
+        self.assertAcmeProblem(
+            resp, "not-found", status=HTTPStatus.NOT_FOUND, message="The requested CA cannot be found."
+        )
+
+        # Disabling ACME for the CA removes its accounts from the cache
+        self.ca.acme_enabled = False
+        self.ca.save()
+        resp = self.acme(self.url, self.message, kid=self.kid)
+        self.assertAcmeProblem(
+            resp, "not-found", status=HTTPStatus.NOT_FOUND, message="The requested CA cannot be found."
+        )
@@ -13,6 +13,7 @@
 
 """Test AcmeOrderFinalizeView."""
 
+from datetime import timedelta
 from http import HTTPStatus
 from unittest import mock
 
@@ -27,12 +28,13 @@ from OpenSSL.crypto import X509Req
 
 from django.test import TransactionTestCase, override_settings
 from django.urls import reverse, reverse_lazy
+from django.utils import timezone
 
 from freezegun import freeze_time
 
 from django_ca.acme.messages import CertificateRequest
-from django_ca.models import AcmeAccount, AcmeAuthorization, AcmeOrder
-from django_ca.tasks import acme_issue_certificate
+from django_ca.models import AcmeAccount, AcmeAuthorization, AcmeCertificate, AcmeOrder
+from django_ca.tasks import acme_issue_certificate, acme_issue_queued_certificates
 from django_ca.tests.acme.views.base import AcmeWithAccountViewTestCaseMixin
 from django_ca.tests.base.constants import CERT_DATA, FIXTURES_DIR, TIMESTAMPS
 from django_ca.tests.base.typehints import HttpResponse
@@ -116,6 +118,51 @@ class AcmeOrderFinalizeViewTestCase(
         """Basic test without timezone support."""
         self.test_basic(True)
 
+    @override_tmpcadir(CA_ACME_ISSUANCE_QUEUE=True)
+    def test_issuance_queue(self) -> None:
+        """Test that certificates are only queued if the issuance queue is enabled."""
+        with self.patch("django_ca.acme.views.run_task") as mockcm:
+            resp = self.acme(self.url, self.message, kid=self.kid)
+        self.assertEqual(resp.status_code, HTTPStatus.OK, resp.content)
+        mockcm.assert_not_called()
+
+        cert = AcmeOrder.objects.get(pk=self.order.pk).acmecertificate
+        self.assertEqual(cert.priority, AcmeCertificate.PRIORITY_DEFAULT)
+        self.assertEqual(list(AcmeCertificate.objects.queued()), [cert])
+
+    @override_tmpcadir(CA_ACME_ISSUANCE_QUEUE=True, CA_USE_CELERY=True)
+    def test_issuance_queue_with_celery(self) -> None:
+        """Test that the queue is processed by Celery, if used."""
+        with self.patch("django_ca.acme.views.run_task") as mockcm:
+            resp = self.acme(self.url, self.message, kid=self.kid)
+        self.assertEqual(resp.status_code, HTTPStatus.OK, resp.content)
+        self.assertEqual(mockcm.call_args_list, [mock.call(acme_issue_queued_certificates, reschedule=True)])
+
+    @override_tmpcadir(CA_ACME_ISSUANCE_QUEUE=True)
+    def test_issuance_queue_renewal(self) -> None:
+        """Test that renewals of certificates that are about to expire are prioritized."""
+        previous = AcmeOrder.objects.create(account=self.account, status=AcmeOrder.STATUS_VALID)
+        AcmeAuthorization.objects.create(order=previous, value=self.hostname)
+        AcmeCertificate.objects.create(order=previous, cert=self.cert)
+
+        # Certificate does not expire soon enough
+        with self.patch("django_ca.acme.views.run_task"):
+            resp = self.acme(self.url, self.message, kid=self.kid)
+        self.assertEqual(resp.status_code, HTTPStatus.OK, resp.content)
+        cert = AcmeOrder.objects.get(pk=self.order.pk).acmecertificate
+        self.assertEqual(cert.priority, AcmeCertificate.PRIORITY_DEFAULT)
+
+        # Finalize the order again, this time with a window large enough for the certificate
+        cert.delete()
+        AcmeOrder.objects.filter(pk=self.order.pk).update(status=AcmeOrder.STATUS_READY)
+        window = self.cert.expires - timezone.now() + timedelta(days=1)
+        with self.settings(CA_ACME_ISSUANCE_RENEWAL_WINDOW=window):
+            with self.patch("django_ca.acme.views.run_task"):
+                resp = self.acme(self.url, self.message, kid=self.kid)
+        self.assertEqual(resp.status_code, HTTPStatus.OK, resp.content)
+        cert = AcmeOrder.objects.get(pk=self.order.pk).acmecertificate
+        self.assertEqual(cert.priority, AcmeCertificate.PRIORITY_RENEWAL)
+
     @override_tmpcadir()
     def test_not_found(self) -> None:
         """Test an order that does not exist."""
@@ -165,6 +212,35 @@ class AcmeOrderFinalizeViewTestCase(
             resp, "orderNotReady", status=HTTPStatus.FORBIDDEN, message="This order is not yet ready."
         )
 
+    @override_tmpcadir()
+    def test_num_queries(self) -> None:
+        """Test that the number of queries does not depend on the number of authorizations."""
+        # CA, account, order, authorizations, certificate and updating the order
+        nonce = self.get_nonce()
+        with self.patch("django_ca.acme.views.run_task"), self.assertNumQueries(6):
+            resp = self.acme(self.url, self.message, kid=self.kid, nonce=nonce)
+        self.assertEqual(resp.status_code, HTTPStatus.OK, resp.content)
+
+        names = [f"host{i}.example.com" for i in range(10)]
+        order = AcmeOrder.objects.create(account=self.account, status=AcmeOrder.STATUS_READY)
+        order.add_authorizations(
+            [acme.messages.Identifier(typ=acme.messages.IDENTIFIER_FQDN, value=name) for name in names]
+        )
+        order.authorizations.update(status=AcmeAuthorization.STATUS_VALID)
+        csr = (
+            x509.CertificateSigningRequestBuilder()
+            .subject_name(x509.Name([]))
+            .add_extension(x509.SubjectAlternativeName([dns(name) for name in names]), critical=False)
+            .sign(CERT_DATA["root-cert"]["key"]["parsed"], hashes.SHA256())
+        )
+        url = reverse("django_ca:acme-order-finalize", kwargs={"serial": self.ca.serial, "slug": order.slug})
+
+        nonce = self.get_nonce()
+        with self.patch("django_ca.acme.views.run_task"), self.assertNumQueries(6):
+            resp = self.acme(url, self.get_message(csr), kid=self.kid, nonce=nonce)
+        self.assertEqual(resp.status_code, HTTPStatus.OK, resp.content)
+        self.assertEqual(len(resp.json()["authorizations"]), 10)
+
     @override_tmpcadir()
     def test_csr_invalid_signature(self) -> None:
         """Test posting a CSR with an invalid signature."""
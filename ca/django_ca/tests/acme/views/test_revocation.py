@@ -246,6 +246,10 @@ class AcmeCertificateRevocationWithJWKViewTestCase(AcmeCertificateRevocationView
     def test_unusable_account(self) -> None:
         """Not applicable: Certificate-signed revocation requests do not require a valid account."""
 
+    @unittest.skip("Not applicable.")
+    def test_rate_limit_account(self) -> None:
+        """Not applicable: Certificate-signed revocation requests do not require a valid account."""
+
     @unittest.skip("Not applicable.")
     def test_jwk_and_kid(self) -> None:
         """Not applicable: Already tested in the immediate base class and does not make sense here.
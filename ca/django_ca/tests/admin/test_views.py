@@ -13,6 +13,7 @@
 
 """Base test cases for admin views and CertificateAdmin tests."""
 
+from django.contrib.admin import site
 from django.contrib.auth.models import User  # pylint: disable=[imported-auth-user]  # needed for typehints
 from django.test.client import Client
 from django.urls import reverse
@@ -21,10 +22,11 @@ import pytest
 from freezegun import freeze_time
 from pytest_django.asserts import assertContains, assertInHTML, assertRedirects
 
+from django_ca.admin import CertificateAdmin
 from django_ca.constants import ReasonFlags
 from django_ca.models import Certificate, Watcher
 from django_ca.tests.admin.assertions import assert_change_response, assert_changelist_response
-from django_ca.tests.base.constants import TIMESTAMPS
+from django_ca.tests.base.constants import CERT_DATA, TIMESTAMPS
 from django_ca.tests.base.typehints import HttpResponse
 
 
@@ -120,6 +122,21 @@ def test_change_view_with_no_subject_alternative_name(
     assertContains(response, text=html, html=True)
 
 
+def test_primary_name(root_cert: Certificate, no_extensions: Certificate) -> None:
+    """Test the primary name displayed in the changelist, with and without stored metadata."""
+    model_admin = CertificateAdmin(Certificate, site)
+    assert root_cert.fingerprint_sha256  # metadata is populated
+    assert model_admin.primary_name(root_cert) == root_cert.subject_alternative_names.split(":", 1)[1]
+    assert no_extensions.fingerprint_sha256  # metadata is populated, but there are no SANs
+    assert no_extensions.subject_alternative_names == ""
+    assert model_admin.primary_name(no_extensions) == no_extensions.cn
+
+    # Clear metadata, so that the certificate is loaded instead
+    root_cert.fingerprint_sha256 = no_extensions.fingerprint_sha256 = ""
+    assert model_admin.primary_name(root_cert) == root_cert.subject_alternative_names.split(":", 1)[1]
+    assert model_admin.primary_name(no_extensions) == no_extensions.cn
+
+
 @freeze_time(TIMESTAMPS["everything_valid"])
 def test_changelist_autogenerated_filter(admin_client: Client, root_cert: Certificate) -> None:
     """Test :py:class:`~django_ca.admin.AutoGeneratedFilter`."""
@@ -142,6 +159,19 @@ def test_changelist_autogenerated_filter(admin_client: Client, root_cert: Certif
     assert_changelist_response(response, root_cert)
 
 
+@freeze_time(TIMESTAMPS["everything_valid"])
+def test_changelist_search(admin_client: Client, root_cert: Certificate, child_cert: Certificate) -> None:
+    """Test searching for certificates by Subject Alternative Name and SHA-256 fingerprint."""
+    response = admin_client.get(Certificate.admin_changelist_url, {"q": root_cert.cn})
+    assert_changelist_response(response, root_cert)
+
+    response = admin_client.get(Certificate.admin_changelist_url, {"q": f"DNS:{child_cert.cn}"})
+    assert_changelist_response(response, child_cert)
+
+    response = admin_client.get(Certificate.admin_changelist_url, {"q": CERT_DATA["child-cert"]["sha256"]})
+    assert_changelist_response(response, child_cert)
+
+
 def test_changelist_status_filter(
     admin_user: User, admin_client: Client, root_cert: Certificate, child_cert: Certificate
 ) -> None:
@@ -0,0 +1,170 @@
+# This file is part of django-ca (https://github.com/mathiasertl/django-ca).
+#
+# django-ca is free software: you can redistribute it and/or modify it under the terms of the GNU General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# django-ca is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the
+# implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License
+# for more details.
+#
+# You should have received a copy of the GNU General Public License along with django-ca. If not, see
+# <http://www.gnu.org/licenses/>.
+
+# pylint: disable=redefined-outer-name  # requested pytest fixtures show up this way.
+
+"""Test the export view for certificates."""
+
+import csv
+import io
+import json
+from http import HTTPStatus
+from typing import Any
+
+from cryptography import x509
+
+from django.db.models import Model
+from django.http import HttpResponseBase, StreamingHttpResponse
+from django.test.client import Client
+from django.urls import reverse, reverse_lazy
+
+import pytest
+
+from django_ca.models import Certificate
+from django_ca.tests.api.conftest import APIPermissionTestBase
+from django_ca.tests.base.constants import CERT_DATA, TIMESTAMPS
+from django_ca.utils import format_general_name
+
+path = reverse_lazy("django_ca:api:export_certificates", kwargs={"serial": CERT_DATA["root"]["serial"]})
+
+
+@pytest.fixture(scope="module")
+def api_permission() -> tuple[type[Model], str]:
+    """Fixture for the permission required by this view."""
+    return Certificate, "view_certificate"
+
+
+@pytest.fixture()
+def expected_row(root_cert: Certificate) -> dict[str, Any]:
+    """Fixture for the exported data of the certificate signed by the root CA."""
+    san = root_cert.pub.loaded.extensions.get_extension_for_class(x509.SubjectAlternativeName).value
+    return {
+        "serial": root_cert.serial,
+        "cn": root_cert.cn,
+        "subject_alternative_names": [format_general_name(name) for name in san],
+        "not_before": root_cert.valid_from.isoformat(),
+        "not_after": root_cert.expires.isoformat(),
+        "status": "valid",
+        "profile": root_cert.profile,
+        "ca": root_cert.ca.serial,
+    }
+
+
+def get_content(response: HttpResponseBase) -> str:
+    """Get the content of a streaming response."""
+    assert response.status_code == HTTPStatus.OK, response
+    assert isinstance(response, StreamingHttpResponse)
+    return b"".join(response.streaming_content).decode("utf-8")  # type: ignore[arg-type]
+
+
+@pytest.mark.freeze_time(TIMESTAMPS["everything_valid"])
+def test_ndjson(api_client: Client, expected_row: dict[str, Any]) -> None:
+    """Test exporting certificates as newline-delimited JSON (the default)."""
+    response = api_client.get(path)
+    content = get_content(response)
+    assert response["Content-Type"] == "application/x-ndjson"
+    assert response["Content-Disposition"] == f'attachment; filename="{CERT_DATA["root"]["serial"]}.ndjson"'
+    assert [json.loads(line) for line in content.splitlines()] == [expected_row]
+
+
+@pytest.mark.freeze_time(TIMESTAMPS["everything_valid"])
+def test_csv(api_client: Client, expected_row: dict[str, Any]) -> None:
+    """Test exporting certificates as CSV."""
+    response = api_client.get(path, {"format": "csv"})
+    content = get_content(response)
+    assert response["Content-Type"] == "text/csv"
+    expected_row["subject_alternative_names"] = ",".join(expected_row["subject_alternative_names"])
+    assert list(csv.DictReader(io.StringIO(content))) == [expected_row]
+
+
+@pytest.mark.freeze_time(TIMESTAMPS["everything_valid"])
+def test_pem(api_client: Client, root_cert: Certificate, expected_row: dict[str, Any]) -> None:
+    """Test including the PEM-encoded certificate."""
+    response = api_client.get(path, {"pem": "1"})
+    content = get_content(response)
+    assert [json.loads(line) for line in content.splitlines()] == [{**expected_row, "pem": root_cert.pub.pem}]
+
+
+@pytest.mark.freeze_time(TIMESTAMPS["everything_valid"])
+def test_filters(api_client: Client, root_cert: Certificate, expected_row: dict[str, Any]) -> None:
+    """Test that revoked certificates are only exported if requested."""
+    root_cert.revoke()
+    assert get_content(api_client.get(path)) == ""
+
+    content = get_content(api_client.get(path, {"revoked": "1"}))
+    assert [json.loads(line) for line in content.splitlines()] == [{**expected_row, "status": "revoked"}]
+
+
+@pytest.mark.usefixtures("root_cert")
+@pytest.mark.freeze_time(TIMESTAMPS["everything_expired"])
+def test_expired(api_client: Client, expected_row: dict[str, Any]) -> None:
+    """Test that expired certificates are only exported if requested."""
+    assert get_content(api_client.get(path)) == ""
+
+    content = get_content(api_client.get(path, {"expired": "1"}))
+    assert [json.loads(line) for line in content.splitlines()] == [{**expected_row, "status": "expired"}]
+
+
+@pytest.mark.usefixtures("root_cert")
+@pytest.mark.freeze_time(TIMESTAMPS["before_everything"])
+def test_not_yet_valid(api_client: Client, expected_row: dict[str, Any]) -> None:
+    """Test that certificates that are not yet valid are exported together with expired certificates."""
+    assert get_content(api_client.get(path)) == ""
+
+    content = get_content(api_client.get(path, {"expired": "1"}))
+    expected_row["status"] = "not yet valid"
+    assert [json.loads(line) for line in content.splitlines()] == [expected_row]
+
+
+@pytest.mark.freeze_time(TIMESTAMPS["everything_valid"])
+def test_without_metadata(api_client: Client, root_cert: Certificate, expected_row: dict[str, Any]) -> None:
+    """Test exporting a certificate where metadata fields are not yet populated."""
+    Certificate.objects.filter(pk=root_cert.pk).update(fingerprint_sha256="", subject_alternative_names="")
+    content = get_content(api_client.get(path))
+    assert [json.loads(line) for line in content.splitlines()] == [expected_row]
+
+
+@pytest.mark.freeze_time(TIMESTAMPS["everything_valid"])
+def test_without_metadata_and_san(api_client: Client, no_extensions: Certificate) -> None:
+    """Test exporting a certificate with neither metadata nor a Subject Alternative Name extension."""
+    Certificate.objects.filter(pk=no_extensions.pk).update(fingerprint_sha256="")
+    no_extensions.ca.api_enabled = True
+    no_extensions.ca.save()
+    ca_path = reverse("django_ca:api:export_certificates", kwargs={"serial": no_extensions.ca.serial})
+    content = get_content(api_client.get(ca_path))
+    rows = [json.loads(line) for line in content.splitlines()]
+    assert [row for row in rows if row["serial"] == no_extensions.serial] == [
+        {
+            "serial": no_extensions.serial,
+            "cn": no_extensions.cn,
+            "subject_alternative_names": [],
+            "not_before": no_extensions.valid_from.isoformat(),
+            "not_after": no_extensions.expires.isoformat(),
+            "status": "valid",
+            "profile": no_extensions.profile,
+            "ca": no_extensions.ca.serial,
+        }
+    ]
+
+
+@pytest.mark.usefixtures("root_cert")
+def test_invalid_format(api_client: Client) -> None:
+    """Test passing an invalid format."""
+    response = api_client.get(path, {"format": "xml"})
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY, response.content
+
+
+class TestPermissions(APIPermissionTestBase):
+    """Test permissions for this view."""
+
+    path = path
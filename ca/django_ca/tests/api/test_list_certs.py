@@ -24,6 +24,7 @@ from django.urls import reverse_lazy
 from django.utils import timezone
 
 import pytest
+from pytest_django.fixtures import SettingsWrapper
 
 from django_ca.models import Certificate
 from django_ca.tests.api.conftest import APIPermissionTestBase, ListResponse
@@ -156,6 +157,73 @@ def test_disabled_ca(api_client: Client, root_cert: Certificate) -> None:
     assert response.json() == {"detail": "Not Found"}, response.json()
 
 
+@pytest.fixture()
+def certs(root_cert: Certificate) -> list[Certificate]:
+    """Fixture for five certificates signed by the root CA."""
+    certs = [root_cert]
+    for i in range(4):
+        cert = Certificate.objects.get(pk=root_cert.pk)
+        cert.pk = None
+        cert.serial = f"{root_cert.serial}{i}"
+        cert.save()
+        certs.append(cert)
+    return certs
+
+
+@pytest.mark.freeze_time(TIMESTAMPS["everything_valid"])
+def test_pagination(api_client: Client, certs: list[Certificate]) -> None:
+    """Test paginating through certificates."""
+    serials = []
+    url = f"{path}?limit=2"
+    while url:
+        response = api_client.get(url)
+        assert response.status_code == HTTPStatus.OK, response.content
+        page = [cert["serial"] for cert in response.json()]
+        assert 0 < len(page) <= 2
+        serials += page
+        url = response.headers.get("Link", "").split(">;", 1)[0].removeprefix("<")
+
+    assert serials == [cert.serial for cert in certs]
+
+
+@pytest.mark.freeze_time(TIMESTAMPS["everything_valid"])
+def test_pagination_link(api_client: Client, certs: list[Certificate]) -> None:
+    """Test that the Link header preserves filters."""
+    response = api_client.get(path, {"limit": "3", "revoked": "1"})
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert [cert["serial"] for cert in response.json()] == [cert.serial for cert in certs[:3]]
+    next_url = f"http://testserver{path}?limit=3&revoked=1&cursor={certs[2].pk}"
+    assert response["Link"] == f'<{next_url}>; rel="next"'
+
+    response = api_client.get(path, {"limit": "3", "revoked": "1", "cursor": str(certs[2].pk)})
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert [cert["serial"] for cert in response.json()] == [cert.serial for cert in certs[3:]]
+    assert "Link" not in response
+
+
+@pytest.mark.freeze_time(TIMESTAMPS["everything_valid"])
+def test_page_size_settings(settings: SettingsWrapper, api_client: Client, certs: list[Certificate]) -> None:
+    """Test the CA_API_PAGE_SIZE and CA_API_MAX_PAGE_SIZE settings."""
+    settings.CA_API_PAGE_SIZE = 2
+    settings.CA_API_MAX_PAGE_SIZE = 4
+
+    response = api_client.get(path)
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert len(response.json()) == 2
+
+    response = api_client.get(path, {"limit": 10})
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert len(response.json()) == 4
+    assert response["Link"] == f'<http://testserver{path}?limit=10&cursor={certs[3].pk}>; rel="next"'
+
+
+@pytest.mark.usefixtures("root_cert")
+def test_invalid_limit(api_client: Client) -> None:
+    """Test passing a limit that is too small."""
+    response = api_client.get(path, {"limit": 0})
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY, response.content
+
+
 class TestPermissions(APIPermissionTestBase):
     """Test permissions for this view."""
 
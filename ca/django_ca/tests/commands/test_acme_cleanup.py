@@ -0,0 +1,67 @@
+# This file is part of django-ca (https://github.com/mathiasertl/django-ca).
+#
+# django-ca is free software: you can redistribute it and/or modify it under the terms of the GNU General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# django-ca is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the
+# implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License
+# for more details.
+#
+# You should have received a copy of the GNU General Public License along with django-ca. If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""Test the acme_cleanup management command."""
+
+from datetime import timedelta
+
+from django.utils import timezone
+
+import pytest
+
+from django_ca.models import AcmeAccount, AcmeAuthorization, AcmeChallenge, AcmeOrder, CertificateAuthority
+from django_ca.tests.base.assertions import assert_command_error
+from django_ca.tests.base.utils import cmd
+
+
+@pytest.fixture(name="orders")
+def fixture_orders(root: CertificateAuthority) -> list[AcmeOrder]:
+    """Fixture for three expired orders (with authorizations and challenges) and one current order."""
+    account = AcmeAccount.objects.create(ca=root, slug="abc", kid="abc", pem="abc", thumbprint="abc")
+    expired = timezone.now() - timedelta(days=2)
+    objs = [
+        AcmeOrder.objects.create(account=account, expires=expired, status=AcmeOrder.STATUS_VALID),
+        AcmeOrder.objects.create(account=account, expires=expired, status=AcmeOrder.STATUS_VALID),
+        AcmeOrder.objects.create(account=account, expires=expired, status=AcmeOrder.STATUS_VALID),
+        AcmeOrder.objects.create(account=account),
+    ]
+    for order in objs:
+        auth = AcmeAuthorization.objects.create(order=order, value="example.com")
+        AcmeChallenge.objects.create(auth=auth, type=AcmeChallenge.TYPE_HTTP_01)
+    return objs
+
+
+def test_acme_cleanup(orders: list[AcmeOrder]) -> None:
+    """Test deleting expired orders in batches."""
+    stdout, stderr = cmd("acme_cleanup", batch_size=2)
+    assert stdout == (
+        "Deleted 2 orders (6 objects) so far...\n"
+        "Deleted 3 orders (9 objects) so far...\n"
+        "Deleted 3 expired orders (9 objects).\n"
+    )
+    assert stderr == ""
+    assert list(AcmeOrder.objects.all()) == [orders[3]]
+    assert AcmeAuthorization.objects.get().order == orders[3]
+    assert AcmeChallenge.objects.get().auth.order == orders[3]
+
+
+def test_quiet(orders: list[AcmeOrder]) -> None:
+    """Test the --quiet option."""
+    assert cmd("acme_cleanup", quiet=True) == ("", "")
+    assert list(AcmeOrder.objects.all()) == [orders[3]]
+
+
+def test_invalid_batch_size() -> None:
+    """Test passing an invalid batch size."""
+    with assert_command_error(r"^--batch-size must be at least 1\.$"):
+        cmd("acme_cleanup", batch_size=0)
@@ -0,0 +1,94 @@
+# This file is part of django-ca (https://github.com/mathiasertl/django-ca).
+#
+# django-ca is free software: you can redistribute it and/or modify it under the terms of the GNU General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# django-ca is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the
+# implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License
+# for more details.
+#
+# You should have received a copy of the GNU General Public License along with django-ca. If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""Test the acme_issuance_worker management command."""
+
+from unittest import mock
+
+from cryptography.hazmat.primitives.serialization import Encoding
+
+import pytest
+from pytest_django.fixtures import SettingsWrapper
+
+from django_ca.models import AcmeAccount, AcmeAuthorization, AcmeCertificate, AcmeOrder, CertificateAuthority
+from django_ca.tests.base.assertions import assert_command_error
+from django_ca.tests.base.constants import CERT_DATA, TIMESTAMPS
+from django_ca.tests.base.utils import cmd
+
+pytestmark = [pytest.mark.freeze_time(TIMESTAMPS["everything_valid"])]
+
+
+class StopWorker(Exception):
+    """Exception used to stop the worker loop in tests."""
+
+
+@pytest.fixture(name="queued")
+def fixture_queued(usable_root: CertificateAuthority) -> list[AcmeCertificate]:
+    """Fixture for three queued certificates."""
+    usable_root.acme_enabled = True
+    usable_root.save()
+    account = AcmeAccount.objects.create(ca=usable_root, slug="abc", kid="abc", pem="abc", thumbprint="abc")
+
+    # NOTE: This is of course not the right CSR for the orders, but all data from the CSR is discarded.
+    csr = CERT_DATA["root-cert"]["csr"]["parsed"].public_bytes(Encoding.PEM).decode("utf-8")
+    certs = []
+    for i in range(3):
+        order = AcmeOrder.objects.create(account=account, status=AcmeOrder.STATUS_PROCESSING)
+        AcmeAuthorization.objects.create(order=order, value=f"host{i}.example.com")
+        certs.append(AcmeCertificate.objects.create(order=order, csr=csr))
+    return certs
+
+
+def test_once(queued: list[AcmeCertificate]) -> None:
+    """Test processing the queue until it is empty."""
+    stdout, stderr = cmd("acme_issuance_worker", once=True, batch_size=2)
+    assert stdout == "Issued 3 certificates.\n"
+    assert stderr == ""
+    assert not AcmeCertificate.objects.queued().exists()
+    assert AcmeCertificate.objects.filter(pk__in=[c.pk for c in queued], cert__isnull=False).count() == 3
+
+
+@pytest.mark.usefixtures("queued")
+def test_quiet() -> None:
+    """Test the --quiet option."""
+    assert cmd("acme_issuance_worker", once=True, quiet=True) == ("", "")
+    assert not AcmeCertificate.objects.queued().exists()
+
+
+@pytest.mark.usefixtures("queued")
+def test_interval() -> None:
+    """Test that the worker waits if the queue is empty."""
+    with mock.patch("time.sleep", autospec=True, side_effect=[None, StopWorker()]) as sleep:
+        with pytest.raises(StopWorker):
+            cmd("acme_issuance_worker", interval=5, quiet=True)
+    assert sleep.call_args_list == [mock.call(5), mock.call(5)]
+    assert not AcmeCertificate.objects.queued().exists()
+
+
+def test_acme_disabled(settings: SettingsWrapper) -> None:
+    """Test running the command when ACME is disabled."""
+    settings.CA_ENABLE_ACME = False
+    with assert_command_error(r"^ACME is not enabled\.$"):
+        cmd("acme_issuance_worker", once=True)
+
+
+def test_invalid_batch_size() -> None:
+    """Test passing an invalid batch size."""
+    with assert_command_error(r"^--batch-size must be at least 1\.$"):
+        cmd("acme_issuance_worker", batch_size=0)
+
+
+def test_invalid_interval() -> None:
+    """Test passing an invalid interval."""
+    with assert_command_error(r"^--interval must not be negative\.$"):
+        cmd("acme_issuance_worker", interval=-1)
@@ -13,9 +13,13 @@
 
 """Test the cache_crls management command."""
 
-from typing import Optional
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Optional
+from unittest import mock
 
+from cryptography import x509
 from cryptography.hazmat.primitives.serialization import Encoding
+from cryptography.x509.oid import ExtensionOID
 
 from django.core.cache import cache
 from django.urls import reverse
@@ -24,7 +28,7 @@ import pytest
 from pytest_django.fixtures import SettingsWrapper
 
 from django_ca.models import Certificate, CertificateAuthority
-from django_ca.tests.base.assertions import assert_crl
+from django_ca.tests.base.assertions import assert_command_error, assert_crl
 from django_ca.tests.base.constants import CERT_DATA, TIMESTAMPS
 from django_ca.tests.base.utils import cmd, get_idp, idp_full_name, uri
 from django_ca.utils import get_crl_cache_key
@@ -33,6 +37,22 @@ from django_ca.utils import get_crl_cache_key
 pytestmark = [pytest.mark.freeze_time(TIMESTAMPS["everything_valid"])]
 
 
+class SynchronousExecutor(Executor):
+    """Executor running submitted callables in the current process.
+
+    Processes spawned by a real process pool would not see the data of the test database transaction.
+    """
+
+    def __init__(self, max_workers: int, initializer: Callable[[], None]) -> None:
+        self.max_workers = max_workers
+        self.initializer = initializer  # not called, as Django is already set up in the current process
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> "Future[Any]":
+        future: "Future[Any]" = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
 def assert_crl_by_ca(ca: CertificateAuthority, expected: Optional[list[Certificate]] = None) -> None:
     """Assert all cached CRLs for the given CA."""
     key = get_crl_cache_key(ca.serial, Encoding.DER, "ca")
@@ -111,3 +131,70 @@ def test_with_serial_with_empty_crl(usable_ca: CertificateAuthority) -> None:
     assert stdout == ""
     assert stderr == ""
     assert_crl_by_ca(usable_ca)
+
+
+def test_delta(settings: SettingsWrapper, usable_root: CertificateAuthority) -> None:
+    """Test generating only delta CRLs."""
+    settings.CA_CRL_PROFILES = {"user": {"expires": 86400, "scope": "user", "delta": True}}
+    delta_key = get_crl_cache_key(usable_root.serial, Encoding.DER, "user", delta=True)
+
+    # Delta CRLs require a complete CRL to be generated first
+    assert cmd("cache_crls", usable_root.serial) == ("", "")
+    cache.clear()
+
+    assert cmd("cache_crls", usable_root.serial, delta=True) == ("", "")
+    assert cache.get(get_crl_cache_key(usable_root.serial, Encoding.DER, "user")) is None
+    delta_indicator = x509.Extension(
+        oid=ExtensionOID.DELTA_CRL_INDICATOR, critical=True, value=x509.DeltaCRLIndicator(0)
+    )
+    idp = get_idp(full_name=idp_full_name(usable_root), only_contains_user_certs=True)
+    assert_crl(
+        cache.get(delta_key),
+        signer=usable_root,
+        algorithm=usable_root.algorithm,
+        encoding=Encoding.DER,
+        idp=idp,
+        crl_number=2,  # first command generated a complete CRL and a delta CRL
+        expires=3600,
+        extensions=[delta_indicator],
+    )
+
+
+def test_workers(usable_root: CertificateAuthority) -> None:
+    """Test generating CRLs locally in a single process."""
+    stdout, stderr = cmd("cache_crls", usable_root.serial, "0A", workers=1)
+    assert stderr == "0A: CertificateAuthority matching query does not exist.\n"
+    lines = stdout.splitlines()
+    assert len(lines) == 2
+    assert lines[0].startswith(f"{usable_root.serial}: ")
+    assert lines[1].startswith("Generated CRLs for 2 CA(s) in ")
+    assert lines[1].endswith("s (1 worker(s)).")
+    assert_crl_by_ca(usable_root)
+
+
+def test_workers_with_process_pool(usable_cas: list[CertificateAuthority]) -> None:
+    """Test generating CRLs with multiple processes."""
+    module = "django_ca.management.commands.cache_crls"
+    with (
+        mock.patch(f"{module}.ProcessPoolExecutor", SynchronousExecutor),
+        mock.patch(f"{module}.connections") as connections_mock,
+    ):
+        stdout, stderr = cmd("cache_crls", workers=2)
+    connections_mock.close_all.assert_called_once_with()
+
+    lines = stdout.splitlines()
+    assert lines[-1].startswith(f"Generated CRLs for {len(usable_cas)} CA(s) in ")
+    assert lines[-1].endswith("s (2 worker(s)).")
+    assert stderr == ""
+    for ca in usable_cas:
+        assert any(line.startswith(f"{ca.serial}: ") for line in lines)
+        if CERT_DATA[ca.name].get("password"):
+            # TODO: not supported yet
+            continue
+        assert_crl_by_ca(ca)
+
+
+def test_workers_with_invalid_value(usable_root: CertificateAuthority) -> None:
+    """Test passing an invalid number of workers."""
+    with assert_command_error(r"^--workers must be at least 1\.$"):
+        cmd("cache_crls", usable_root.serial, workers=0)
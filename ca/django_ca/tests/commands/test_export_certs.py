@@ -0,0 +1,95 @@
+# This file is part of django-ca (https://github.com/mathiasertl/django-ca).
+#
+# django-ca is free software: you can redistribute it and/or modify it under the terms of the GNU General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# django-ca is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the
+# implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License
+# for more details.
+#
+# You should have received a copy of the GNU General Public License along with django-ca. If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""Test the export_certs management command."""
+
+import csv
+import io
+import json
+from typing import Any
+
+from cryptography import x509
+
+import pytest
+
+from django_ca.models import Certificate
+from django_ca.tests.base.assertions import assert_command_error
+from django_ca.tests.base.constants import TIMESTAMPS
+from django_ca.tests.base.utils import cmd
+from django_ca.utils import format_general_name
+
+pytestmark = [pytest.mark.freeze_time(TIMESTAMPS["everything_valid"])]
+
+
+def export(**kwargs: Any) -> list[dict[str, Any]]:
+    """Run the command and parse its (NDJSON) output."""
+    stdout, stderr = cmd("export_certs", **kwargs)
+    assert stderr == ""
+    return [json.loads(line) for line in stdout.splitlines()]
+
+
+def test_ndjson(root_cert: Certificate, child_cert: Certificate) -> None:
+    """Test exporting certificates as newline-delimited JSON."""
+    rows = export()
+    assert [row["serial"] for row in rows] == [root_cert.serial, child_cert.serial]
+    assert rows[0]["cn"] == root_cert.cn
+    assert rows[0]["not_before"] == root_cert.valid_from.isoformat()
+    assert rows[0]["not_after"] == root_cert.expires.isoformat()
+    assert rows[0]["status"] == "valid"
+    assert rows[0]["ca"] == root_cert.ca.serial
+    assert "pem" not in rows[0]
+
+
+def test_csv(root_cert: Certificate) -> None:
+    """Test exporting certificates as CSV."""
+    stdout, stderr = cmd("export_certs", export_format="csv", pem=True)
+    assert stderr == ""
+    rows = list(csv.DictReader(io.StringIO(stdout)))
+    assert len(rows) == 1
+    assert rows[0]["serial"] == root_cert.serial
+    assert rows[0]["pem"] == root_cert.pub.pem
+    san = root_cert.pub.loaded.extensions.get_extension_for_class(x509.SubjectAlternativeName).value
+    assert rows[0]["subject_alternative_names"] == ",".join(format_general_name(name) for name in san)
+
+
+def test_filters(root_cert: Certificate, child_cert: Certificate) -> None:
+    """Test filtering certificates."""
+    root_cert.revoke()
+    child_cert.autogenerated = True
+    child_cert.save()
+
+    assert export() == []
+    assert [row["status"] for row in export(revoked=True)] == ["revoked"]
+    assert [row["serial"] for row in export(autogenerated=True)] == [child_cert.serial]
+    assert [row["serial"] for row in export(ca=child_cert.ca, revoked=True, autogenerated=True)] == [
+        child_cert.serial
+    ]
+
+
+@pytest.mark.freeze_time(TIMESTAMPS["everything_expired"])
+def test_expired(root_cert: Certificate) -> None:
+    """Test exporting expired certificates."""
+    assert export() == []
+    assert [(row["serial"], row["status"]) for row in export(expired=True)] == [(root_cert.serial, "expired")]
+
+
+@pytest.mark.usefixtures("root_cert", "child_cert")
+def test_chunk_size() -> None:
+    """Test that a small chunk size does not change the output."""
+    assert export(chunk_size=1) == export()
+
+
+def test_invalid_chunk_size() -> None:
+    """Test passing an invalid chunk size."""
+    with assert_command_error(r"^--chunk-size must be at least 1\.$"):
+        cmd("export_certs", chunk_size=0)
@@ -14,6 +14,7 @@
 """Test the init_ca management command."""
 
 import io
+import json
 import re
 from datetime import timedelta
 from typing import Any, Optional
@@ -171,7 +172,9 @@ def test_basic(
 ) -> None:
     """Basic tests for the command."""
     ca = init_ca_e2e(ca_name, rfc4514_subject, "--subject-format=rfc4514")
-    assert_ca_properties(ca, ca_name, crl_number='{"scope": {"user": 1, "ca": 1}}')
+    base_crl = {"crl_number": 0, "last_update": TIMESTAMPS["everything_valid"].isoformat()}
+    crl_number = {"scope": {"user": 1, "ca": 1}, "base": {"user": base_crl, "ca": base_crl}}
+    assert_ca_properties(ca, ca_name, crl_number=json.dumps(crl_number))
     assert_certificate(ca, subject)
 
     # test the private key
@@ -0,0 +1,138 @@
+# This file is part of django-ca (https://github.com/mathiasertl/django-ca).
+#
+# django-ca is free software: you can redistribute it and/or modify it under the terms of the GNU General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# django-ca is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the
+# implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License
+# for more details.
+#
+# You should have received a copy of the GNU General Public License along with django-ca. If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""Test the sign_certs management command."""
+
+from pathlib import Path
+
+from cryptography import x509
+from cryptography.hazmat.primitives.serialization import Encoding
+
+import pytest
+
+from django_ca.models import Certificate, CertificateAuthority
+from django_ca.tests.base.assertions import assert_command_error
+from django_ca.tests.base.constants import CERT_DATA, FIXTURES_DIR, TIMESTAMPS
+from django_ca.tests.base.utils import cmd
+
+NAMES = ("root-cert", "child-cert", "ec-cert")
+CSRS: list[x509.CertificateSigningRequest] = [CERT_DATA[name]["csr"]["parsed"] for name in NAMES]
+
+# All tests in this module require a valid time (so that the CA is valid)
+pytestmark = [pytest.mark.freeze_time(TIMESTAMPS["everything_valid"])]
+
+
+def test_stdin(usable_root: CertificateAuthority) -> None:
+    """Test reading multiple PEM-encoded CSRs from stdin."""
+    stdin = b"\n".join(csr.public_bytes(Encoding.PEM) for csr in CSRS)
+    stdout, stderr = cmd("sign_certs", ca=usable_root, stdin=stdin)
+    assert stderr == ""
+
+    certs = Certificate.objects.order_by("cn")
+    assert [cert.cn for cert in certs] == sorted(f"csr.{name}.example.com" for name in NAMES)
+    for cert in certs:
+        assert cert.ca == usable_root
+        assert cert.pub.pem in stdout
+    assert stdout.count("-----BEGIN CERTIFICATE-----") == 3
+
+
+def test_with_password(usable_pwd: CertificateAuthority) -> None:
+    """Test signing certificates with a CA with a password."""
+    stdin = CSRS[0].public_bytes(Encoding.PEM)
+    stdout, stderr = cmd("sign_certs", ca=usable_pwd, password=CERT_DATA["pwd"]["password"], stdin=stdin)
+    assert stderr == ""
+    assert Certificate.objects.get().pub.pem == stdout
+
+
+def test_paths(tmp_path: Path, usable_root: CertificateAuthority) -> None:
+    """Test reading CSRs from files and directories and writing certificates to a directory."""
+    csr_dir = tmp_path / "csrs"
+    csr_dir.mkdir()
+    (csr_dir / "subdir").mkdir()  # directories are ignored
+    (csr_dir / "a.pem").write_bytes(CSRS[0].public_bytes(Encoding.PEM))
+    (csr_dir / "b.der").write_bytes(CSRS[1].public_bytes(Encoding.DER))
+    single_file = tmp_path / "single.pem"
+    single_file.write_bytes(CSRS[2].public_bytes(Encoding.PEM))
+    out_dir = tmp_path / "out"
+
+    stdout, stderr = cmd(
+        "sign_certs", str(csr_dir), str(single_file), ca=usable_root, out_dir=out_dir, workers=2
+    )
+    assert stdout == f"Wrote 3 certificate(s) to {out_dir}.\n"
+    assert stderr == ""
+
+    certs = list(Certificate.objects.all())
+    assert len(certs) == 3
+    assert sorted(path.name for path in out_dir.iterdir()) == sorted(f"{cert.serial}.pem" for cert in certs)
+    for cert in certs:
+        assert (out_dir / f"{cert.serial}.pem").read_text() == cert.pub.pem
+
+
+def test_with_invalid_workers(usable_root: CertificateAuthority) -> None:
+    """Test passing an invalid number of workers."""
+    with assert_command_error(r"^--workers must be at least 1\.$"):
+        cmd("sign_certs", ca=usable_root, workers=0)
+    assert Certificate.objects.exists() is False
+
+
+def test_no_csrs(usable_root: CertificateAuthority) -> None:
+    """Test passing no CSRs."""
+    with assert_command_error(r"^No CSRs found\.$"):
+        cmd("sign_certs", ca=usable_root, stdin=b"")
+
+
+def test_invalid_csr(tmp_path: Path, usable_root: CertificateAuthority) -> None:
+    """Test passing a file that does not contain a CSR."""
+    path = tmp_path / "invalid.der"
+    path.write_bytes(b"foobar")
+    with assert_command_error(rf"^{path}: Could not read CSR: "):
+        cmd("sign_certs", str(path), ca=usable_root)
+    assert Certificate.objects.exists() is False
+
+
+def test_signing_error(usable_root: CertificateAuthority) -> None:
+    """Test that no certificates are stored if one certificate cannot be signed."""
+    path = FIXTURES_DIR / "empty-subject.csr"
+    with assert_command_error(r"^Must name at least a CN or a subjectAlternativeName\.$"):
+        cmd("sign_certs", str(path), ca=usable_root)
+    assert Certificate.objects.exists() is False
+
+
+def test_unusable_ca(usable_pwd: CertificateAuthority) -> None:
+    """Test signing certificates with a CA that cannot be used."""
+    with assert_command_error(r"^Could not decrypt private key - bad password\?$"):
+        cmd("sign_certs", ca=usable_pwd, password=b"wrong", stdin=CSRS[0].public_bytes(Encoding.PEM))
+    assert Certificate.objects.exists() is False
+
+
+@pytest.mark.freeze_time(TIMESTAMPS["everything_expired"])
+def test_expired_ca(usable_root: CertificateAuthority) -> None:
+    """Test signing certificates with an expired CA."""
+    with assert_command_error(r"^Certificate authority has expired\.$"):
+        cmd("sign_certs", ca=usable_root, stdin=CSRS[0].public_bytes(Encoding.PEM))
+
+
+def test_invalid_csr_from_stdin(usable_root: CertificateAuthority) -> None:
+    """Test reading an invalid CSR from stdin."""
+    with assert_command_error(r"^stdin: Could not read CSR: "):
+        cmd(
+            "sign_certs",
+            ca=usable_root,
+            stdin=b"-----BEGIN CERTIFICATE REQUEST-----\nfoo\n-----END CERTIFICATE REQUEST-----",
+        )
+
+
+def test_model_validation_error(usable_root: CertificateAuthority) -> None:
+    """Test model validation is tested properly (see test_sign_cert.py for details)."""
+    with assert_command_error(r"^password: Input should be a valid bytes$"):
+        cmd("sign_certs", ca=usable_root, password=123, stdin=CSRS[0].public_bytes(Encoding.PEM))
@@ -0,0 +1,52 @@
+# This file is part of django-ca (https://github.com/mathiasertl/django-ca).
+#
+# django-ca is free software: you can redistribute it and/or modify it under the terms of the GNU General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# django-ca is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the
+# implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License
+# for more details.
+#
+# You should have received a copy of the GNU General Public License along with django-ca. If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""Test the update_certificate_metadata management command."""
+
+import pytest
+
+from django_ca.models import Certificate, CertificateAuthority
+from django_ca.tests.base.assertions import assert_command_error
+from django_ca.tests.base.utils import cmd
+
+
+@pytest.mark.usefixtures("child_cert")
+def test_update_missing(root_cert: Certificate) -> None:
+    """Test updating only certificates that do not have metadata."""
+    expected = root_cert.fingerprint_sha256
+    Certificate.objects.filter(pk=root_cert.pk).update(fingerprint_sha256="", public_key_type="")
+
+    stdout, stderr = cmd("update_certificate_metadata")
+    assert stdout == "Updated 0 certificate authorities and 1 certificates.\n"
+    assert stderr == ""
+    root_cert.refresh_from_db()
+    assert root_cert.fingerprint_sha256 == expected
+    assert root_cert.public_key_type == "RSA"
+
+
+@pytest.mark.usefixtures("root_cert", "child_cert")
+def test_update_all() -> None:
+    """Test updating all certificates and certificate authorities."""
+    ca_count = CertificateAuthority.objects.count()
+    CertificateAuthority.objects.update(subject_alternative_names="wrong")
+
+    stdout, stderr = cmd("update_certificate_metadata", update_all=True, chunk_size=1)
+    assert stdout == f"Updated {ca_count} certificate authorities and 2 certificates.\n"
+    assert stderr == ""
+    assert not CertificateAuthority.objects.filter(subject_alternative_names="wrong").exists()
+
+
+def test_invalid_chunk_size() -> None:
+    """Test passing an invalid chunk size."""
+    with assert_command_error(r"^--chunk-size must be at least 1\.$"):
+        cmd("update_certificate_metadata", chunk_size=0)
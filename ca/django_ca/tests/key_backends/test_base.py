@@ -204,3 +204,5 @@ def test_key_backend_overwritten_methods(settings: SettingsWrapper, root: Certif
     assert isinstance(
         backend.get_ocsp_key_elliptic_curve(root, DummyModel()), ca_settings.CA_DEFAULT_ELLIPTIC_CURVE
     )
+    with backend.keep_key_loaded(root, DummyModel()):  # does nothing by default
+        pass
@@ -13,15 +13,33 @@
 
 """Test the StoragesBackend backend."""
 
+from collections.abc import Iterator
 from pathlib import Path
+from unittest import mock
+
+from cryptography.hazmat.primitives.serialization import load_der_private_key
 
 import pytest
 from pytest_django.fixtures import SettingsWrapper
 
 from django_ca import ca_settings
-from django_ca.key_backends import key_backends
-from django_ca.key_backends.storages import CreatePrivateKeyOptions, StoragesBackend, UsePrivateKeyOptions
+from django_ca.key_backends import key_backends, storages
+from django_ca.key_backends.storages import (
+    CreatePrivateKeyOptions,
+    StoragesBackend,
+    StorePrivateKeyOptions,
+    UsePrivateKeyOptions,
+)
 from django_ca.models import CertificateAuthority
+from django_ca.tests.base.constants import CERT_DATA
+
+
+@pytest.fixture(name="key_cache_backend")
+def fixture_key_cache_backend() -> Iterator[StoragesBackend]:
+    """Fixture for a backend that caches loaded private keys."""
+    backend = StoragesBackend(ca_settings.CA_DEFAULT_KEY_BACKEND, "django-ca", key_cache_timeout=60)
+    yield backend
+    backend.clear_key_cache()
 
 
 @pytest.mark.parametrize("key_size", (2048, 4096, 8192))
@@ -105,3 +123,112 @@ def test_get_ocsp_key_elliptic_curve_invalid_key_type(usable_root: CertificateAu
         key_backends[ca_settings.CA_DEFAULT_KEY_BACKEND].get_ocsp_key_elliptic_curve(
             usable_root, UsePrivateKeyOptions(password=None)
         )
+
+
+def test_invalid_key_cache_timeout() -> None:
+    """Test configuring a negative key cache timeout."""
+    with pytest.raises(ValueError, match=r"^foo: -1: key_cache_timeout must not be negative\.$"):
+        StoragesBackend("foo", "django-ca", key_cache_timeout=-1)
+
+
+def test_get_key_without_key_cache(usable_root: CertificateAuthority) -> None:
+    """Test that keys are loaded every time if the key cache is disabled (the default)."""
+    backend = StoragesBackend(ca_settings.CA_DEFAULT_KEY_BACKEND, "django-ca")
+    options = UsePrivateKeyOptions(password=None)
+    with mock.patch.object(storages, "load_der_private_key", wraps=load_der_private_key) as load_mock:
+        backend.get_key(usable_root, options)
+        backend.get_key(usable_root, options)
+    assert load_mock.call_count == 2
+    assert not storages._LOADED_KEYS  # pylint: disable=protected-access
+
+
+def test_get_key_with_key_cache(
+    key_cache_backend: StoragesBackend, usable_root: CertificateAuthority
+) -> None:
+    """Test that loaded keys are cached until the timeout expires."""
+    options = UsePrivateKeyOptions(password=None)
+    with (
+        mock.patch.object(storages, "load_der_private_key", wraps=load_der_private_key) as load_mock,
+        mock.patch("django_ca.key_backends.storages.time.monotonic", side_effect=[0, 59, 60, 61]),
+    ):
+        key = key_cache_backend.get_key(usable_root, options)
+        assert key_cache_backend.get_key(usable_root, options) is key  # 59 seconds later: cached
+        assert key_cache_backend.is_usable(usable_root, options) is True  # 60 seconds later: expired
+        assert key_cache_backend.get_key(usable_root, options) is not key  # cached again
+    assert load_mock.call_count == 2
+
+
+def test_get_key_with_key_cache_and_password(
+    key_cache_backend: StoragesBackend, usable_pwd: CertificateAuthority
+) -> None:
+    """Test that keys are cached per password."""
+    options = UsePrivateKeyOptions(password=CERT_DATA["pwd"]["password"])
+    wrong_options = UsePrivateKeyOptions(password=b"wrong")
+
+    key = key_cache_backend.get_key(usable_pwd, options)
+    assert key_cache_backend.get_key(usable_pwd, options) is key
+    for _ in range(0, 2):  # errors are not cached
+        with pytest.raises(ValueError, match=r"^Could not decrypt private key - bad password\?$"):
+            key_cache_backend.get_key(usable_pwd, wrong_options)
+    assert key_cache_backend.is_usable(usable_pwd, UsePrivateKeyOptions(password=None)) is False
+    assert key_cache_backend.get_key(usable_pwd, options) is key
+
+
+def test_get_key_with_key_cache_and_changed_path(
+    key_cache_backend: StoragesBackend, usable_root: CertificateAuthority, usable_child: CertificateAuthority
+) -> None:
+    """Test that a cached key is not used if the path of the private key changes."""
+    options = UsePrivateKeyOptions(password=None)
+    root_key = key_cache_backend.get_key(usable_root, options)
+
+    usable_root.key_backend_options = usable_child.key_backend_options
+    child_key = key_cache_backend.get_key(usable_root, options)
+    assert child_key.public_key() == usable_child.pub.loaded.public_key()
+    assert child_key.public_key() != root_key.public_key()
+
+
+def test_clear_key_cache(
+    key_cache_backend: StoragesBackend, usable_root: CertificateAuthority, usable_child: CertificateAuthority
+) -> None:
+    """Test clearing the key cache."""
+    options = UsePrivateKeyOptions(password=None)
+    root_key = key_cache_backend.get_key(usable_root, options)
+    child_key = key_cache_backend.get_key(usable_child, options)
+
+    key_cache_backend.clear_key_cache(usable_root)
+    assert key_cache_backend.get_key(usable_root, options) is not root_key
+    assert key_cache_backend.get_key(usable_child, options) is child_key
+
+    key_cache_backend.clear_key_cache()
+    assert not storages._LOADED_KEYS  # pylint: disable=protected-access
+
+
+def test_store_private_key_clears_key_cache(
+    key_cache_backend: StoragesBackend, usable_root: CertificateAuthority
+) -> None:
+    """Test that storing a new private key removes the old key from the key cache."""
+    options = UsePrivateKeyOptions(password=None)
+    key = key_cache_backend.get_key(usable_root, options)
+
+    store_options = StorePrivateKeyOptions(path=Path("rotated"), password=None)
+    key_cache_backend.store_private_key(usable_root, key, store_options)
+    assert usable_root.key_backend_options["path"].startswith("rotated/")
+    assert key_cache_backend.get_key(usable_root, options) is not key
+
+
+def test_keep_key_loaded(usable_root: CertificateAuthority, usable_child: CertificateAuthority) -> None:
+    """Test keeping a private key loaded."""
+    backend = StoragesBackend(ca_settings.CA_DEFAULT_KEY_BACKEND, "django-ca")
+    options = UsePrivateKeyOptions(password=None)
+    with backend.keep_key_loaded(usable_root, options):
+        key = backend.get_key(usable_root, options)
+        assert backend.get_key(usable_root, options) is key
+        with backend.keep_key_loaded(usable_root, options):  # nested usage keeps the key loaded
+            assert backend.get_key(usable_root, options) is key
+        assert backend.get_key(usable_root, options) is key
+
+        # Key is not used if the path changes
+        usable_root.key_backend_options = usable_child.key_backend_options
+        assert backend.get_key(usable_root, options) is not key
+
+    assert not backend._kept_keys  # pylint: disable=protected-access
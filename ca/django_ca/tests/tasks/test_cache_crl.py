@@ -13,11 +13,18 @@
 
 """Test the cache_crl task."""
 
+from cryptography import x509
+from cryptography.hazmat.primitives.serialization import Encoding
+
+from django.core.cache import cache
+
 import pytest
+from pytest_django.fixtures import SettingsWrapper
 
 from django_ca.models import CertificateAuthority
 from django_ca.tasks import cache_crl
 from django_ca.tests.tasks.conftest import assert_crls
+from django_ca.utils import get_crl_cache_key
 
 pytestmark = [pytest.mark.usefixtures("clear_cache")]
 
@@ -26,3 +33,20 @@ def test_basic(usable_root: CertificateAuthority) -> None:
     """Test the most basic invocation."""
     cache_crl(usable_root.serial)
     assert_crls(usable_root)
+
+
+def test_delta(settings: SettingsWrapper, usable_root: CertificateAuthority) -> None:
+    """Test caching only delta CRLs."""
+    settings.CA_CRL_PROFILES = {"user": {"expires": 86400, "scope": "user", "delta": True}}
+    key = get_crl_cache_key(usable_root.serial, Encoding.DER, "user")
+    delta_key = get_crl_cache_key(usable_root.serial, Encoding.DER, "user", delta=True)
+
+    cache_crl(usable_root.serial)
+    assert cache.get(key) is not None
+    assert cache.get(delta_key) is not None
+
+    cache.clear()
+    cache_crl(usable_root.serial, delta=True)
+    assert cache.get(key) is None
+    crl = x509.load_der_x509_crl(cache.get(delta_key))
+    assert crl.extensions.get_extension_for_class(x509.DeltaCRLIndicator).value.crl_number == 0
@@ -13,24 +13,36 @@
 
 """Test some common ACME functionality."""
 
+import asyncio
+import io
+import threading
+import time
 import typing
 from collections.abc import Iterable, Iterator
 from contextlib import contextmanager
+from http import HTTPStatus
 from importlib import reload
 from typing import Any, Optional
 from unittest import mock
 
 import acme
+import dns.asyncresolver
 import dns.exception
+import dns.message
 import dns.name
+import dns.rcode
+import dns.rrset
 from dns import resolver
 from dns.rdtypes.txtbase import TXTBase
+from requests.packages.urllib3.response import HTTPResponse
 
 from django.test import TestCase, override_settings
 from django.urls import include, path, reverse
 from django.urls.exceptions import NoReverseMatch
 from django.utils.crypto import get_random_string
 
+import requests_mock
+
 from django_ca import urls
 from django_ca.acme import validation
 from django_ca.acme.constants import IdentifierType, Status
@@ -236,3 +248,179 @@ class Dns01ValidationTestCase(TestCaseMixin, TestCase):
             validation.validate_dns_01(AcmeChallenge(type=AcmeChallenge.TYPE_HTTP_01))
         with self.assertRaisesRegex(ValueError, r"^This function can only validate DNS-01 challenges$"):
             validation.validate_dns_01(AcmeChallenge(type=AcmeChallenge.TYPE_TLS_ALPN_01))
+
+
+class StubDnsServer(asyncio.DatagramProtocol):
+    """Minimal DNS server answering TXT queries for the given records (and NXDOMAIN otherwise)."""
+
+    def __init__(self, records: dict[str, list[bytes]]) -> None:
+        self.records = records
+        self.queries: list[str] = []
+        self.transport: Optional[asyncio.DatagramTransport] = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = typing.cast(asyncio.DatagramTransport, transport)
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        query = dns.message.from_wire(data)
+        response = dns.message.make_response(query)
+        question = query.question[0]
+        name = question.name.to_text(omit_final_dot=True)
+        self.queries.append(name)
+
+        if name in self.records:
+            values = [f'"{value.decode("ascii")}"' for value in self.records[name]]
+            response.answer.append(dns.rrset.from_text(question.name, 60, "IN", "TXT", *values))
+        else:
+            response.set_rcode(dns.rcode.NXDOMAIN)
+        assert self.transport is not None
+        self.transport.sendto(response.to_wire(), addr)
+
+
+class AsyncValidationTestCase(TestCaseMixin, TestCase):
+    """Test concurrent challenge validation."""
+
+    load_cas = ("root",)
+
+    def setUp(self) -> None:
+        super().setUp()
+        account = AcmeAccount.objects.create(thumbprint=get_random_string(length=12), ca=self.ca, pem="none")
+        self.order = AcmeOrder.objects.create(account=account)
+
+    def create_challenges(self, typ: str, *domains: str) -> list[AcmeChallenge]:
+        """Create challenges for the given domains and load them like the task does."""
+        for domain in domains:
+            auth = AcmeAuthorization.objects.create(value=domain, order=self.order)
+            AcmeChallenge.objects.create(type=typ, auth=auth)
+        return list(AcmeChallenge.objects.url().filter(type=typ).order_by("pk"))
+
+    async def validate_with_stub_server(
+        self, challenges: list[AcmeChallenge], records: dict[str, list[bytes]]
+    ) -> tuple[dict[int, bool], StubDnsServer]:
+        """Validate challenges with a local stub DNS server."""
+        loop = asyncio.get_running_loop()
+        transport, server = await loop.create_datagram_endpoint(
+            lambda: StubDnsServer(records), local_addr=("127.0.0.1", 0)
+        )
+        stub_resolver = dns.asyncresolver.Resolver(configure=False)
+        stub_resolver.nameservers = ["127.0.0.1"]
+        stub_resolver.port = transport.get_extra_info("sockname")[1]
+
+        try:
+            with mock.patch("dns.asyncresolver.default_resolver", stub_resolver):
+                results = await validation.validate_challenges(challenges)
+        finally:
+            transport.close()
+        return results, server
+
+    def test_dns_01(self) -> None:
+        """Test DNS-01 validation with a stub DNS server."""
+        valid, wrong, missing = self.create_challenges(
+            AcmeChallenge.TYPE_DNS_01, "valid.example.com", "wrong.example.com", "missing.example.com"
+        )
+        records = {
+            "_acme_challenge.valid.example.com": [b"foo", valid.expected],
+            "_acme_challenge.wrong.example.com": [b"foo"],
+        }
+
+        results, server = asyncio.run(self.validate_with_stub_server([valid, wrong, missing], records))
+        self.assertEqual(results, {valid.pk: True, wrong.pk: False, missing.pk: False})
+        self.assertCountEqual(
+            server.queries,
+            [
+                "_acme_challenge.valid.example.com",
+                "_acme_challenge.wrong.example.com",
+                "_acme_challenge.missing.example.com",
+            ],
+        )
+
+    def test_validate_dns_01_async(self) -> None:
+        """Test validating a single DNS-01 challenge."""
+        challenges = self.create_challenges(AcmeChallenge.TYPE_DNS_01, "example.com")
+        txt = TXTBase(dns.rdataclass.RdataClass.IN, dns.rdatatype.RdataType.TXT, [challenges[0].expected])
+        with mock.patch("dns.asyncresolver.resolve", return_value=[txt]) as resolve:
+            self.assertTrue(asyncio.run(validation.validate_dns_01_async(challenges[0], timeout=3)))
+        resolve.assert_awaited_once_with("_acme_challenge.example.com", "TXT", lifetime=3, search=False)
+
+    def test_shared_dns_lookups(self) -> None:
+        """Test that challenges for the same name (e.g. from different orders) share the DNS query."""
+        first, second = self.create_challenges(AcmeChallenge.TYPE_DNS_01, "example.com", "example.net")
+        second.auth.value = (
+            "example.com"  # so that the challenges need the same name (but not the same value)
+        )
+        records = {"_acme_challenge.example.com": [first.expected]}
+
+        results, server = asyncio.run(self.validate_with_stub_server([first, second], records))
+        self.assertEqual(results, {first.pk: True, second.pk: False})
+        self.assertEqual(server.queries, ["_acme_challenge.example.com"])
+
+    def test_dns_exception(self) -> None:
+        """Test DNS-01 validation where the resolver raises an exception."""
+        challenges = self.create_challenges(AcmeChallenge.TYPE_DNS_01, "example.com")
+        with (
+            mock.patch("dns.asyncresolver.resolve", side_effect=dns.exception.Timeout) as resolve,
+            self.assertLogs("django_ca.acme.validation") as logcm,
+        ):
+            self.assertEqual(
+                asyncio.run(validation.validate_challenges(challenges)), {challenges[0].pk: False}
+            )
+        resolve.assert_called_once_with("_acme_challenge.example.com", "TXT", lifetime=1, search=False)
+        self.assertIn("dns.exception.Timeout", logcm.output[1])
+
+    def test_http_01(self) -> None:
+        """Test HTTP-01 validation."""
+        valid, wrong = self.create_challenges(
+            AcmeChallenge.TYPE_HTTP_01, "valid.example.com", "wrong.example.com"
+        )
+        with requests_mock.Mocker() as req_mock:
+            for challenge, content in ((valid, valid.expected), (wrong, b"wrong")):
+                token = challenge.encoded_token.decode()
+                body = io.BytesIO(content)
+                raw = HTTPResponse(body=body, status=HTTPStatus.OK, preload_content=False)
+                req_mock.get(f"http://{challenge.auth.value}/.well-known/acme-challenge/{token}", raw=raw)
+            results = asyncio.run(validation.validate_challenges([valid, wrong], timeout=3))
+
+        self.assertEqual(results, {valid.pk: True, wrong.pk: False})
+        history = req_mock.request_history  # type: ignore[attr-defined]  # not in type hints
+        self.assertEqual([request.timeout for request in history], [3, 3])
+
+    def test_unsupported_challenge(self) -> None:
+        """Test validating an unsupported challenge type."""
+        challenges = self.create_challenges(AcmeChallenge.TYPE_TLS_ALPN_01, "example.com")
+        with self.assertLogs("django_ca.acme.validation") as logcm:
+            self.assertEqual(
+                asyncio.run(validation.validate_challenges(challenges)), {challenges[0].pk: False}
+            )
+        self.assertEqual(
+            logcm.output,
+            [f"ERROR:django_ca.acme.validation:{challenges[0]}: Challenge type is not supported."],
+        )
+
+    def test_concurrency(self) -> None:
+        """Test that no more than the given number of challenges are validated at the same time."""
+        challenges = self.create_challenges(
+            AcmeChallenge.TYPE_HTTP_01, *[f"{i}.example.com" for i in range(6)]
+        )
+        lock = threading.Lock()
+        active: list[int] = []
+        maximum = 0
+
+        def validate_http_01(challenge: AcmeChallenge, _timeout: int) -> bool:
+            nonlocal maximum
+            with lock:
+                active.append(challenge.pk)
+                maximum = max(maximum, len(active))
+            time.sleep(0.05)
+            with lock:
+                active.remove(challenge.pk)
+            return True
+
+        with mock.patch("django_ca.acme.validation.validate_http_01", side_effect=validate_http_01):
+            results = asyncio.run(validation.validate_challenges(challenges, concurrency=2))
+        self.assertEqual(results, {challenge.pk: True for challenge in challenges})
+        self.assertEqual(maximum, 2)
+
+    def test_wrong_acme_challenge(self) -> None:
+        """Test passing an ACME challenge of the wrong type."""
+        with self.assertRaisesRegex(ValueError, r"^This function can only validate HTTP-01 challenges$"):
+            validation.validate_http_01(AcmeChallenge(type=AcmeChallenge.TYPE_DNS_01))
@@ -13,13 +13,16 @@
 
 """TestCases for various model managers."""
 
+from datetime import timedelta
 from pathlib import Path
 from typing import Optional
+from unittest import mock
 
 from cryptography import x509
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.asymmetric import dsa, rsa
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+from cryptography.hazmat.primitives.serialization import load_der_private_key
 from cryptography.x509.oid import ExtensionOID, NameOID
 
 from django.test import override_settings
@@ -30,10 +33,12 @@ from pytest_django.fixtures import SettingsWrapper
 
 from django_ca import ca_settings
 from django_ca.constants import ExtendedKeyUsageOID
+from django_ca.key_backends import storages
 from django_ca.key_backends.storages import CreatePrivateKeyOptions, StoragesBackend, UsePrivateKeyOptions
 from django_ca.models import Certificate, CertificateAuthority
 from django_ca.profiles import profiles
 from django_ca.querysets import CertificateAuthorityQuerySet, CertificateQuerySet
+from django_ca.signals import post_issue_cert, post_issue_certs, pre_sign_cert
 from django_ca.tests.base.assertions import (
     assert_ca_properties,
     assert_certificate,
@@ -42,7 +47,8 @@ from django_ca.tests.base.assertions import (
     assert_extensions,
     assert_improperly_configured,
 )
-from django_ca.tests.base.constants import CERT_DATA, TIMESTAMPS
+from django_ca.tests.base.constants import CERT_DATA, FIXTURES_DIR, TIMESTAMPS
+from django_ca.tests.base.mocks import mock_signal
 from django_ca.tests.base.utils import (
     authority_information_access,
     basic_constraints,
@@ -576,6 +582,91 @@ def test_create_cert_with_wrong_profile_type(root: CertificateAuthority, subject
     assert Certificate.objects.exists() is False
 
 
+@pytest.mark.freeze_time(TIMESTAMPS["everything_valid"])
+@pytest.mark.parametrize("workers", (1, 2))
+def test_create_certs(usable_root: CertificateAuthority, workers: int) -> None:
+    """Test creating certificates in bulk."""
+    names = ("root-cert", "child-cert", "ec-cert")
+    csrs = [CERT_DATA[name]["csr"]["parsed"] for name in names]
+    options = UsePrivateKeyOptions(password=None)
+    with (
+        mock_signal(pre_sign_cert) as pre,
+        mock_signal(post_issue_cert) as post,
+        mock_signal(post_issue_certs) as post_bulk,
+        mock.patch.object(storages, "load_der_private_key", wraps=load_der_private_key) as load,
+    ):
+        certs = Certificate.objects.create_certs(
+            usable_root, options, csrs, expires=timedelta(days=3), workers=workers
+        )
+
+    assert load.call_count == 1  # private key is loaded only once
+    assert pre.call_count == 3
+    assert post.called is False
+    post_bulk.assert_called_once_with(signal=post_issue_certs, sender=Certificate, certs=certs)
+
+    # Certificates are returned in order and are stored in the database
+    assert [cert.cn for cert in certs] == [f"csr.{name}.example.com" for name in names]
+    assert sorted(Certificate.objects.values_list("serial", flat=True)) == sorted(c.serial for c in certs)
+    for cert, csr in zip(certs, csrs):
+        assert cert.ca == usable_root
+        assert cert.pub.loaded.public_key() == csr.public_key()
+        assert cert.expires == TIMESTAMPS["everything_valid"] + timedelta(days=3)
+        assert cert.profile == ca_settings.CA_DEFAULT_PROFILE
+        assert cert.autogenerated is False
+
+
+@pytest.mark.freeze_time(TIMESTAMPS["everything_valid"])
+def test_create_certs_with_profile(usable_root: CertificateAuthority) -> None:
+    """Test creating certificates in bulk with a specific profile."""
+    csrs = [CERT_DATA["root-cert"]["csr"]["parsed"]]
+    profile = profiles["client"]
+    certs = Certificate.objects.create_certs(
+        usable_root,
+        UsePrivateKeyOptions(password=None),
+        csrs,
+        profile=profile,
+        autogenerated=True,
+        extensions=[ocsp_no_check()],
+    )
+    assert certs[0].profile == "client"
+    assert certs[0].autogenerated is True
+    assert certs[0].extensions[ExtensionOID.OCSP_NO_CHECK] == ocsp_no_check()
+    assert (
+        certs[0].extensions[ExtensionOID.EXTENDED_KEY_USAGE]
+        == profile.extensions[ExtensionOID.EXTENDED_KEY_USAGE]
+    )
+
+
+@pytest.mark.freeze_time(TIMESTAMPS["everything_valid"])
+def test_create_certs_with_error(usable_root: CertificateAuthority) -> None:
+    """Test that no certificate is stored if signing any certificate fails."""
+    empty_subject_csr = x509.load_der_x509_csr((FIXTURES_DIR / "empty-subject.csr").read_bytes())
+    csrs = [CERT_DATA["root-cert"]["csr"]["parsed"], empty_subject_csr]
+    msg = r"^Must name at least a CN or a subjectAlternativeName\.$"
+    with mock_signal(post_issue_certs) as post_bulk, pytest.raises(ValueError, match=msg):
+        Certificate.objects.create_certs(usable_root, UsePrivateKeyOptions(password=None), csrs)
+    assert post_bulk.called is False
+    assert Certificate.objects.exists() is False
+
+
+def test_create_certs_with_wrong_profile_type(root: CertificateAuthority) -> None:
+    """Test passing a profile with an unsupported type."""
+    msg = r"^profile must be of type django_ca\.profiles\.Profile\.$"
+    with pytest.raises(TypeError, match=msg):
+        Certificate.objects.create_certs(
+            root,
+            UsePrivateKeyOptions(password=None),
+            [],
+            profile=False,  # type: ignore[arg-type] # what we're testing
+        )
+
+
+def test_create_certs_with_invalid_workers(root: CertificateAuthority) -> None:
+    """Test passing an invalid number of workers."""
+    with pytest.raises(ValueError, match=r"^workers must be at least 1\.$"):
+        Certificate.objects.create_certs(root, UsePrivateKeyOptions(password=None), [], workers=0)
+
+
 class TypingExamples:
     """Test case to create some code that would show an error in type checkers if type hinting is wrong.
 
@@ -20,9 +20,10 @@ from cryptography.x509.oid import AuthorityInformationAccessOID, ExtensionOID, N
 
 import pytest
 
-from django_ca.migration_helpers import Migration0040Helper
-from django_ca.models import CertificateAuthority
+from django_ca.migration_helpers import Migration0040Helper, update_certificate_metadata
+from django_ca.models import Certificate, CertificateAuthority
 from django_ca.tests.base.utils import distribution_point, dns, rdn, uri
+from django_ca.utils import get_certificate_metadata
 
 
 @pytest.mark.parametrize(
@@ -302,3 +303,20 @@ def test_0040_empty_backwards_migration_for_0040(root: CertificateAuthority) ->
     assert root.ocsp_url == ""  # type: ignore[attr-defined]  # what we're testing
     assert root.issuer_url == ""  # type: ignore[attr-defined]  # what we're testing
     assert root.issuer_alt_name == ""  # type: ignore[attr-defined]  # what we're testing
+
+
+def test_update_certificate_metadata(root_cert: Certificate, child_cert: Certificate) -> None:
+    """Test populating certificate metadata fields in chunks."""
+    Certificate.objects.update(fingerprint_sha256="", subject_alternative_names="", public_key_size=None)
+
+    assert update_certificate_metadata(Certificate.objects.all(), chunk_size=1) == 2
+    for cert in (root_cert, child_cert):
+        cert.refresh_from_db()
+        metadata = get_certificate_metadata(cert.pub.loaded)
+        assert {field: getattr(cert, field) for field in metadata} == metadata
+
+
+@pytest.mark.usefixtures("root_cert")
+def test_update_certificate_metadata_with_empty_queryset() -> None:
+    """Test populating certificate metadata fields for no certificates."""
+    assert update_certificate_metadata(Certificate.objects.none()) == 0
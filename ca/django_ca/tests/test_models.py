@@ -33,7 +33,7 @@ from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.asymmetric import ec, rsa
 from cryptography.hazmat.primitives.asymmetric.types import CertificateIssuerPrivateKeyTypes
 from cryptography.hazmat.primitives.serialization import Encoding, load_der_private_key
-from cryptography.x509.oid import CertificatePoliciesOID, ExtensionOID, NameOID
+from cryptography.x509.oid import CertificatePoliciesOID, CRLEntryExtensionOID, ExtensionOID, NameOID
 
 from django.conf import settings
 from django.core.cache import cache
@@ -51,7 +51,7 @@ from django_ca import ca_settings
 from django_ca.constants import ReasonFlags
 from django_ca.deprecation import not_valid_after, not_valid_before
 from django_ca.key_backends.storages import UsePrivateKeyOptions
-from django_ca.modelfields import LazyCertificate, LazyCertificateSigningRequest
+from django_ca.modelfields import LazyCertificate, LazyCertificateSigningRequest, LazyField
 from django_ca.models import (
     AcmeAccount,
     AcmeAuthorization,
@@ -64,6 +64,7 @@ from django_ca.models import (
     X509CertMixin,
 )
 from django_ca.pydantic.extensions import CertificatePoliciesModel
+from django_ca.tests.base.assertions import assert_removed_in_200
 from django_ca.tests.base.constants import CERT_DATA, CERT_PEM_REGEX, TIMESTAMPS
 from django_ca.tests.base.mixins import AcmeValuesMixin, TestCaseMixin, TestCaseProtocol
 from django_ca.tests.base.utils import (
@@ -80,7 +81,7 @@ from django_ca.tests.base.utils import (
     uri,
 )
 from django_ca.typehints import PolicyQualifier
-from django_ca.utils import get_crl_cache_key, get_storage
+from django_ca.utils import get_crl_cache_key, get_storage, read_file
 
 ChallengeTypeVar = typing.TypeVar("ChallengeTypeVar", bound=challenges.KeyAuthorizationChallenge)
 key_backend_options = UsePrivateKeyOptions(password=None)
@@ -859,6 +860,293 @@ def test_sign_certificate_policies_with_invalid_serialized_data(root: Certificat
         root.full_clean()
 
 
+class CertificateAuthorityCRLTests(TestCaseMixin, TestCase):
+    """Test generating and caching CRLs with :py:class:`django_ca.models.CertificateAuthority`."""
+
+    load_cas = "__all__"
+    load_certs = ("root-cert", "child-cert")
+
+    @override_tmpcadir()
+    def test_delta_crl(self) -> None:
+        """Test generating a delta CRL."""
+        ca = self.cas["root"]
+        cert = self.certs["root-cert"]
+        idp = None  # root CA has no CRL Distribution Points, so no IssuingDistributionPoint is added
+
+        with freeze_time(TIMESTAMPS["everything_valid"]) as frozen_time:
+            self.certs["child-cert"].revoke()  # not part of the CRL of the root CA
+            cert.revoke()
+            crl = ca.get_crl(key_backend_options).public_bytes(Encoding.PEM)
+            self.assertCRL(crl, expected=[cert], idp=idp, signer=ca, algorithm=ca.algorithm)
+
+            frozen_time.tick(timedelta(hours=1))
+            child = self.cas["child"]
+            child.revoke()
+
+            # The delta CRL only contains the CA revoked after the complete CRL
+            delta_indicator = x509.Extension(
+                oid=ExtensionOID.DELTA_CRL_INDICATOR, critical=True, value=x509.DeltaCRLIndicator(0)
+            )
+            crl = ca.get_crl(key_backend_options, delta=True).public_bytes(Encoding.PEM)
+            self.assertCRL(
+                crl,
+                expected=[child],
+                idp=idp,
+                crl_number=1,
+                signer=ca,
+                algorithm=ca.algorithm,
+                extensions=[delta_indicator],
+            )
+
+            # Delta CRLs do not update the base CRL
+            crl = ca.get_crl(key_backend_options, delta=True).public_bytes(Encoding.PEM)
+            self.assertCRL(
+                crl,
+                expected=[child],
+                idp=idp,
+                crl_number=2,
+                signer=ca,
+                algorithm=ca.algorithm,
+                extensions=[delta_indicator],
+            )
+
+            # A new complete CRL references a new base CRL
+            frozen_time.tick(timedelta(hours=1))
+            ca.refresh_from_db()
+            complete_crl = ca.get_crl(key_backend_options)
+            self.assertEqual(len(complete_crl), 2)
+            crl_number = complete_crl.extensions.get_extension_for_class(x509.CRLNumber).value.crl_number
+            self.assertEqual(crl_number, 3)
+            crl = ca.get_crl(key_backend_options, delta=True).public_bytes(Encoding.PEM)
+            delta_indicator = x509.Extension(
+                oid=ExtensionOID.DELTA_CRL_INDICATOR, critical=True, value=x509.DeltaCRLIndicator(3)
+            )
+            self.assertCRL(
+                crl, idp=idp, crl_number=4, signer=ca, algorithm=ca.algorithm, extensions=[delta_indicator]
+            )
+
+    @override_settings(USE_TZ=False)
+    def test_delta_crl_without_timezone_support(self) -> None:
+        """Test delta CRLs but with timezone support disabled."""
+        # otherwise we get TZ warnings for preloaded objects
+        for obj in [self.cas["root"], self.cas["child"], self.certs["root-cert"], self.certs["child-cert"]]:
+            obj.refresh_from_db()
+
+        self.test_delta_crl()
+
+    @override_tmpcadir()
+    @freeze_time(TIMESTAMPS["everything_valid"])
+    def test_delta_crl_without_complete_crl(self) -> None:
+        """Test that generating a delta CRL without generating a complete CRL first is an error."""
+        msg = r"^user: Cannot generate a delta CRL before a complete CRL was generated\.$"
+        self.assertFalse(self.ca.has_base_crl(scope="user"))
+        with self.assertRaisesRegex(ValueError, msg):
+            self.ca.get_crl(key_backend_options, scope="user", delta=True)
+
+        # A complete CRL for a different scope does not help either
+        self.ca.get_crl(key_backend_options, scope="ca")
+        self.assertTrue(self.ca.has_base_crl(scope="ca"))
+        self.assertFalse(self.ca.has_base_crl(scope="user"))
+        with self.assertRaisesRegex(ValueError, msg):
+            self.ca.get_crl(key_backend_options, scope="user", delta=True)
+
+        # Passing a counter overrides the scope
+        self.assertFalse(self.ca.has_base_crl(scope="ca", counter="example"))
+        self.ca.get_crl(key_backend_options, counter="example")
+        self.assertTrue(self.ca.has_base_crl(counter="example"))
+
+    @freeze_time(TIMESTAMPS["everything_valid"])
+    def test_get_crl_entries(self) -> None:
+        """Test getting CRL entries directly from the database."""
+
+        def entry(revoked: x509.RevokedCertificate) -> tuple[int, datetime, list[x509.Extension[Any]]]:
+            return revoked.serial_number, revoked.revocation_date_utc, list(revoked.extensions)
+
+        ca = self.cas["root"]
+        child = self.cas["child"]
+        cert = self.certs["root-cert"]
+        now = timezone.now()
+        self.assertEqual(list(ca.get_crl_entries(None, now)), [])
+
+        cert.revoke(ReasonFlags.key_compromise, compromised=now - timedelta(days=1))
+        child.revoke(ReasonFlags.superseded)
+        self.certs["child-cert"].revoke()  # not part of the CRL of the root CA
+
+        # Entries are fetched with only one query per type of certificate
+        with self.assertNumQueries(2):
+            entries = [entry(revoked) for revoked in ca.get_crl_entries(None, now)]
+        self.assertEqual(entries, [entry(child.get_revocation()), entry(cert.get_revocation())])
+        self.assertEqual(
+            entries[1][2],
+            [
+                x509.Extension(
+                    oid=CRLEntryExtensionOID.CRL_REASON,
+                    critical=False,
+                    value=x509.CRLReason(x509.ReasonFlags.key_compromise),
+                ),
+                x509.Extension(
+                    oid=CRLEntryExtensionOID.INVALIDITY_DATE,
+                    critical=False,
+                    value=x509.InvalidityDate(TIMESTAMPS["everything_valid_naive"] - timedelta(days=1)),
+                ),
+            ],
+        )
+
+        with self.assertNumQueries(1):
+            entries = [entry(revoked) for revoked in ca.get_crl_entries("ca", now)]
+            self.assertEqual(entries, [entry(child.get_revocation())])
+        with self.assertNumQueries(1):
+            entries = [entry(revoked) for revoked in ca.get_crl_entries("user", now)]
+            self.assertEqual(entries, [entry(cert.get_revocation())])
+        with self.assertNumQueries(0):
+            self.assertEqual(list(ca.get_crl_entries("attribute", now)), [])
+
+    @freeze_time(TIMESTAMPS["everything_valid"])
+    def test_get_crl_certs(self) -> None:
+        """Test the deprecated get_crl_certs() function."""
+        ca = self.cas["root"]
+        child = self.cas["child"]
+        cert = self.certs["root-cert"]
+        now = timezone.now()
+        cert.revoke()
+        child.revoke()
+
+        msg = r"^CertificateAuthority\.get_crl_certs\(\) is deprecated and will be removed in django-ca"
+        with assert_removed_in_200(msg):
+            self.assertEqual(list(ca.get_crl_certs(None, now)), [child, cert])
+        with assert_removed_in_200(msg):
+            self.assertEqual(list(ca.get_crl_certs("user", now)), [cert])
+        with assert_removed_in_200(msg):
+            self.assertEqual(list(ca.get_crl_certs("ca", now, revoked_since=now)), [])
+
+    @override_tmpcadir()
+    @freeze_time(TIMESTAMPS["everything_valid"])
+    def test_cache_crls_stores_crls(self) -> None:
+        """Test that cached CRLs are also written to the file storage."""
+        crl_profiles = self.crl_profiles
+        crl_profiles["user"]["encodings"] = ["DER", "PEM"]
+        crl_profiles["user"]["delta"] = True
+        ca = self.cas["root"]
+        storage = get_storage()
+        paths = {
+            get_crl_cache_key(ca.serial, Encoding.DER, "user"): f"crl/{ca.serial}/user.der",
+            get_crl_cache_key(ca.serial, Encoding.PEM, "user"): f"crl/{ca.serial}/user.pem",
+            get_crl_cache_key(ca.serial, Encoding.DER, "user", delta=True): f"crl/{ca.serial}/user-delta.der",
+            get_crl_cache_key(ca.serial, Encoding.PEM, "user", delta=True): f"crl/{ca.serial}/user-delta.pem",
+            get_crl_cache_key(ca.serial, Encoding.DER, "ca"): f"crl/{ca.serial}/ca.der",
+            get_crl_cache_key(ca.serial, Encoding.PEM, "ca"): f"crl/{ca.serial}/ca.pem",
+        }
+
+        with self.settings(CA_CRL_PROFILES=crl_profiles):
+            ca.cache_crls(key_backend_options)
+        for cache_key, path in paths.items():
+            self.assertEqual(read_file(path), cache.get(cache_key))
+
+        # Cache CRLs again, stored CRLs are overwritten
+        with self.settings(CA_CRL_PROFILES=crl_profiles):
+            ca.cache_crls(key_backend_options)
+        for cache_key, path in paths.items():
+            self.assertEqual(read_file(path), cache.get(cache_key))
+        self.assertEqual(
+            sorted(storage.listdir(f"crl/{ca.serial}")[1]), sorted(p.split("/")[-1] for p in paths.values())
+        )
+
+    @override_tmpcadir(CA_ENABLE_CRL_STORAGE=False)
+    def test_cache_crls_with_storage_disabled(self) -> None:
+        """Test that CRLs are not written to the file storage if disabled."""
+        ca = self.cas["root"]
+        ca.cache_crls(key_backend_options)
+        self.assertIsNotNone(cache.get(get_crl_cache_key(ca.serial, Encoding.DER, "user")))
+        self.assertFalse(get_storage().exists(f"crl/{ca.serial}/user.der"))
+
+    @override_tmpcadir()
+    @freeze_time(TIMESTAMPS["everything_valid"])
+    def test_cache_crls_with_delta_crls(self) -> None:
+        """Test caching delta CRLs."""
+        crl_profiles = self.crl_profiles
+        crl_profiles["user"]["delta"] = True
+        ca = self.cas["root"]
+        user_key = get_crl_cache_key(ca.serial, Encoding.DER, "user")
+        ca_key = get_crl_cache_key(ca.serial, Encoding.DER, "ca")
+        delta_user_key = get_crl_cache_key(ca.serial, Encoding.DER, "user", delta=True)
+        delta_ca_key = get_crl_cache_key(ca.serial, Encoding.DER, "ca", delta=True)
+        user_idp = get_idp(full_name=idp_full_name(ca), only_contains_user_certs=True)
+        delta_indicator = x509.Extension(
+            oid=ExtensionOID.DELTA_CRL_INDICATOR, critical=True, value=x509.DeltaCRLIndicator(0)
+        )
+
+        # Cache complete CRLs and delta CRLs for profiles that enable them
+        with self.settings(CA_CRL_PROFILES=crl_profiles):
+            ca.cache_crls(key_backend_options)
+        self.assertCRL(
+            cache.get(user_key), idp=user_idp, signer=ca, algorithm=ca.algorithm, encoding=Encoding.DER
+        )
+        self.assertCRL(
+            cache.get(delta_user_key),
+            idp=user_idp,
+            crl_number=1,
+            signer=ca,
+            algorithm=ca.algorithm,
+            expires=3600,
+            encoding=Encoding.DER,
+            extensions=[delta_indicator],
+        )
+        self.assertIsNotNone(cache.get(ca_key))
+        self.assertIsNone(cache.get(delta_ca_key))
+
+        # Cache only delta CRLs
+        cache.clear()
+        with self.settings(CA_CRL_PROFILES=crl_profiles):
+            ca.cache_crls(key_backend_options, delta=True)
+        self.assertIsNone(cache.get(user_key))
+        self.assertIsNone(cache.get(ca_key))
+        self.assertIsNone(cache.get(delta_ca_key))
+        self.assertCRL(
+            cache.get(delta_user_key),
+            idp=user_idp,
+            crl_number=2,
+            signer=ca,
+            algorithm=ca.algorithm,
+            expires=3600,
+            encoding=Encoding.DER,
+            extensions=[delta_indicator],
+        )
+
+    @override_tmpcadir()
+    @freeze_time(TIMESTAMPS["everything_valid"])
+    def test_cache_crls_shares_crl_entries(self) -> None:
+        """Test that revoked certificates are only loaded once for all CRL profiles."""
+        ca = self.cas["root"]
+        self.cas["child"].revoke()
+        self.certs["root-cert"].revoke()
+        crl_profiles = {
+            "user": {"expires": 86400, "scope": "user"},
+            "ca": {"expires": 86400, "scope": "ca"},
+            "all": {"expires": 86400, "scope": None},
+        }
+
+        with (
+            self.settings(CA_CRL_PROFILES=crl_profiles),
+            mock.patch.object(
+                X509CertMixin, "build_revocation", wraps=X509CertMixin.build_revocation
+            ) as build_mock,
+        ):
+            ca.cache_crls(key_backend_options)
+        self.assertEqual(build_mock.call_count, 2)  # one CA and one end-entity certificate
+        self.assertIsNone(ca._shared_crl_entries)  # pylint: disable=protected-access
+
+        # CRLs for all scopes contain the correct entries
+        child_serial = int(self.cas["child"].serial, 16)
+        cert_serial = int(self.certs["root-cert"].serial, 16)
+        for scope, expected in (
+            ("user", [cert_serial]),
+            ("ca", [child_serial]),
+            (None, sorted([child_serial, cert_serial])),
+        ):
+            crl = x509.load_der_x509_crl(cache.get(get_crl_cache_key(ca.serial, Encoding.DER, scope)))
+            self.assertEqual(sorted(entry.serial_number for entry in crl), expected)
+
+
 class CertificateAuthoritySignTests(TestCaseMixin, X509CertMixinTestCaseMixin, TestCase):
     """Test signing a certificiate."""
 
@@ -998,6 +1286,24 @@ class CertificateTests(TestCaseMixin, X509CertMixinTestCaseMixin, TestCase):
         with self.assertRaises(ValueError):
             cert.get_revocation()
 
+    def test_build_revocation_with_naive_timestamps(self) -> None:
+        """Test building a revocation from naive timestamps (as returned if timezone support is disabled)."""
+        revoked_date = TIMESTAMPS["everything_valid_naive"]
+        compromised = revoked_date - timedelta(days=1)
+        revoked = Certificate.build_revocation("ABC", revoked_date, "unspecified", compromised)
+        self.assertEqual(revoked.serial_number, 0xABC)
+        self.assertEqual(revoked.revocation_date_utc, TIMESTAMPS["everything_valid"])
+        self.assertEqual(
+            list(revoked.extensions),
+            [
+                x509.Extension(
+                    oid=CRLEntryExtensionOID.INVALIDITY_DATE,
+                    critical=False,
+                    value=x509.InvalidityDate(compromised),
+                )
+            ],
+        )
+
     def test_root(self) -> None:
         """Test the root property."""
         self.assertEqual(self.certs["root-cert"].root, self.cas["root"])
@@ -1270,6 +1576,29 @@ class ModelfieldsTests(TestCaseMixin, TestCase):
         self.assertEqual(repr(cert.pub), f"<LazyCertificate: {subject}>")
         self.assertEqual(repr(cert.csr), "<LazyCertificateSigningRequest: CN=csr.root-cert.example.com>")
 
+    def test_encode_without_loading(self) -> None:
+        """Test that PEM and DER encodings are computed without loading the value."""
+        pub = LazyCertificate(self.pub["der"])
+        csr = LazyCertificateSigningRequest(self.csr["parsed"].public_bytes(Encoding.DER))
+        values: list[tuple[LazyField[Any, Any], bytes]] = [
+            (pub, self.pub["pem"].encode()),
+            (csr, self.csr["parsed"].public_bytes(Encoding.PEM)),
+        ]
+        for value, expected_pem in values:
+            with mock.patch("cryptography.x509.load_der_x509_certificate", side_effect=AssertionError):
+                with mock.patch("cryptography.x509.load_der_x509_csr", side_effect=AssertionError):
+                    self.assertEqual(value.pem, expected_pem.decode())
+                    self.assertEqual(value.encode(Encoding.PEM), expected_pem)
+                    self.assertEqual(value.encode(Encoding.DER), value.der)
+            self.assertIsNone(value._loaded)  # pylint: disable=protected-access
+            self.assertFalse(hasattr(value, "__dict__"))  # class uses __slots__
+
+    def test_encode_with_unsupported_encoding(self) -> None:
+        """Test encoding with an encoding that is not supported by certificates or CSRs."""
+        pub = LazyCertificate(self.pub["der"])
+        with self.assertRaisesRegex(ValueError, r"Only Encoding\.DER and Encoding\.PEM are supported\.$"):
+            pub.encode(Encoding.OpenSSH)
+
     def test_none_value(self) -> None:
         """Test that nullable fields work."""
         cert = Certificate.objects.create(
@@ -1603,6 +1932,32 @@ class AcmeAuthorizationTestCase(TestCaseMixin, AcmeValuesMixin, TestCase):
         self.assertEqual(self.auth1.get_challenges(), chall_qs)
         self.assertEqual(AcmeChallenge.objects.all().count(), 2)
 
+    def test_get_challenges_num_queries(self) -> None:
+        """Test the number of queries of the get_challenges() method."""
+        self.auth1.get_challenges()  # creates challenges
+
+        with self.assertNumQueries(1):
+            challenges = self.auth1.get_challenges()
+        self.assertEqual(
+            [c.type for c in challenges], [AcmeChallenge.TYPE_HTTP_01, AcmeChallenge.TYPE_DNS_01]
+        )
+
+        auth = AcmeAuthorization.objects.prefetch_related("challenges").get(pk=self.auth1.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(auth.get_challenges(), challenges)
+
+    def test_get_challenges_created_concurrently(self) -> None:
+        """Test get_challenges() when another request created the challenges in the meantime."""
+        auth = AcmeAuthorization.objects.prefetch_related("challenges").get(pk=self.auth1.pk)
+        created = [
+            AcmeChallenge.objects.create(auth=self.auth1, type=AcmeChallenge.TYPE_HTTP_01),
+            AcmeChallenge.objects.create(auth=self.auth1, type=AcmeChallenge.TYPE_DNS_01),
+        ]
+
+        # No challenges were prefetched, so get_challenges() tries to create them
+        self.assertEqual(auth.get_challenges(), created)
+        self.assertEqual(AcmeChallenge.objects.all().count(), 2)
+
 
 class AcmeChallengeTestCase(TestCaseMixin, AcmeValuesMixin, TestCase):
     """Test :py:class:`django_ca.models.AcmeChallenge`."""
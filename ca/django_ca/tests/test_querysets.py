@@ -15,10 +15,12 @@
 
 from collections.abc import Iterator
 from contextlib import contextmanager
+from datetime import timedelta
 from typing import Any
 
 from django.db import models
 from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
 
 from freezegun import freeze_time
 
@@ -143,6 +145,25 @@ class CertificateQuerysetTestCase(QuerySetTestCaseMixin, TestCase):
             self.assertQuerySet(Certificate.objects.not_yet_valid())
             self.assertQuerySet(Certificate.objects.valid(), *valid)
 
+    def test_listed(self) -> None:
+        """Test the listed() filter."""
+        revoked = self.certs["root-cert"]
+        revoked.revoke()
+        autogenerated = self.certs["child-cert"]
+        autogenerated.autogenerated = True
+        autogenerated.save()
+        default = [c for c in self.certs.values() if c not in (revoked, autogenerated)]
+
+        with freeze_time(TIMESTAMPS["everything_valid"]):
+            self.assertQuerySet(Certificate.objects.listed(), *default)
+            self.assertQuerySet(Certificate.objects.listed(revoked=True), *default, revoked)
+            self.assertQuerySet(Certificate.objects.listed(autogenerated=True), *default, autogenerated)
+
+        for timestamp in ("everything_expired", "before_everything"):
+            with freeze_time(TIMESTAMPS[timestamp]):
+                self.assertQuerySet(Certificate.objects.listed())
+                self.assertQuerySet(Certificate.objects.listed(expired=True), *default)
+
 
 class AcmeQuerySetTestCase(QuerySetTestCaseMixin, AcmeValuesMixin, TransactionTestCase):
     """Base class for ACME querysets (creates different instances)."""
@@ -302,3 +323,54 @@ class AcmeCertificateQuerysetTestCase(AcmeQuerySetTestCase):
 
         with self.attr(self.order.account, "status", AcmeAccount.STATUS_REVOKED):
             self.assertQuerySet(AcmeCertificate.objects.viewable())
+
+    @freeze_time(TIMESTAMPS["everything_valid"])
+    def test_queued(self) -> None:
+        """Test the queued() method."""
+        self.assertQuerySet(AcmeCertificate.objects.queued())  # order is not yet processing
+
+        with self.attr(self.order, "status", AcmeOrder.STATUS_PROCESSING):
+            self.assertQuerySet(AcmeCertificate.objects.queued(), self.acme_cert)
+
+            with self.attr(self.order, "expires", timezone.now()):
+                self.assertQuerySet(AcmeCertificate.objects.queued())
+
+    def _queue(
+        self, account: AcmeAccount, priority: int = AcmeCertificate.PRIORITY_DEFAULT
+    ) -> AcmeCertificate:
+        """Create a queued certificate for a new order of `account`."""
+        order = AcmeOrder.objects.create(account=account, status=AcmeOrder.STATUS_PROCESSING)
+        return AcmeCertificate.objects.create(order=order, priority=priority)
+
+    @freeze_time(TIMESTAMPS["everything_valid"])
+    def test_claim(self) -> None:
+        """Test the claim() method."""
+        account3 = AcmeAccount.objects.create(
+            ca=self.ca, pem="account3-pem", thumbprint="account3-thumbprint", slug="abc", kid="abc"
+        )
+        first = [self._queue(self.account) for _ in range(3)]
+        second = self._queue(account3)
+        renewal = self._queue(account3, priority=AcmeCertificate.PRIORITY_RENEWAL)
+        self._queue(self.account2)  # different CA
+
+        claimed = AcmeCertificate.objects.claim(self.ca, 3)
+        self.assertEqual(claimed, [renewal, first[0], second])
+        self.assertEqual([c.started for c in claimed], [timezone.now()] * 3)
+        self.assertQuerySet(AcmeCertificate.objects.filter(started__isnull=False), renewal, first[0], second)
+
+        # Concurrency limit is already reached (it limits batches, not certificates).
+        self.assertEqual(AcmeCertificate.objects.claim(self.ca, 10), [])
+
+        # A second batch may be claimed if the concurrency limit allows it.
+        with self.settings(CA_ACME_ISSUANCE_CONCURRENCY=2):
+            with self.freeze_time(timezone.now() + timedelta(seconds=1)):
+                self.assertEqual(AcmeCertificate.objects.claim(self.ca, 1), [first[1]])
+            with self.freeze_time(timezone.now() + timedelta(seconds=2)):
+                self.assertEqual(AcmeCertificate.objects.claim(self.ca, 10), [])
+
+        # Claims time out.
+        with self.freeze_time(timezone.now() + timedelta(minutes=11)):
+            self.assertEqual(
+                AcmeCertificate.objects.claim(self.ca, 2, timeout=timedelta(minutes=10)),
+                [renewal, first[0]],
+            )
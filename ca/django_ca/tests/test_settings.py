@@ -313,6 +313,24 @@ def test_ca_passwords_with_invalid_type(settings: SettingsWrapper) -> None:
         settings.CA_PASSWORDS = {"AA:BB:CC": None}
 
 
+def test_acme_rate_limits_with_unknown_limit(settings: SettingsWrapper) -> None:
+    """Test configuring an unknown rate limit."""
+    with assert_improperly_configured(r"^CA_ACME_RATE_LIMITS: foo: Unknown rate limit\.$"):
+        settings.CA_ACME_RATE_LIMITS = {"foo": (1, 60)}
+
+
+def test_acme_issuance_concurrency_with_invalid_value(settings: SettingsWrapper) -> None:
+    """Test configuring an ACME issuance concurrency below one."""
+    with assert_improperly_configured(r"^CA_ACME_ISSUANCE_CONCURRENCY: 0: Must be at least 1\.$"):
+        settings.CA_ACME_ISSUANCE_CONCURRENCY = 0
+
+
+def test_acme_issuance_renewal_window_as_int(settings: SettingsWrapper) -> None:
+    """Test configuring the ACME renewal window as int."""
+    settings.CA_ACME_ISSUANCE_RENEWAL_WINDOW = 3
+    assert ca_settings.ACME_ISSUANCE_RENEWAL_WINDOW == timedelta(days=3)
+
+
 class SettingsTestCase(TestCase):
     """Test some standard settings."""
 
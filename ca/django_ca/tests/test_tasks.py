@@ -16,11 +16,11 @@
 import importlib
 import io
 import types
-from collections.abc import Iterator
+from collections.abc import Coroutine, Iterator
 from contextlib import contextmanager
 from datetime import timedelta
 from http import HTTPStatus
-from typing import Optional, Union
+from typing import Any, Optional, Union
 from unittest import mock
 
 import dns.resolver
@@ -32,6 +32,7 @@ from cryptography import x509
 from cryptography.hazmat.primitives.serialization import Encoding
 from cryptography.x509.oid import ExtensionOID
 
+from django.core.cache import cache
 from django.test import TestCase, override_settings
 from django.utils import timezone
 
@@ -357,6 +358,209 @@ class AcmeValidateDns01ChallengeTestCase(AcmeValidateChallengeTestCaseMixin, Tes
         )
 
 
+class AcmeValidateManyChallengesTestCaseMixin(TestCaseMixin, AcmeValuesMixin):
+    """Mixin for tasks validating many challenges at once."""
+
+    load_cas = ("root",)
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.account = AcmeAccount.objects.create(
+            ca=self.cas["root"],
+            contact="mailto:user@example.com",
+            terms_of_service_agreed=True,
+            status=AcmeAccount.STATUS_VALID,
+            pem=self.ACME_PEM_1,
+            thumbprint=self.ACME_THUMBPRINT_1,
+        )
+        self.order = AcmeOrder.objects.create(account=self.account)
+        self.http_auth = AcmeAuthorization.objects.create(order=self.order, value="http.example.com")
+        self.dns_auth = AcmeAuthorization.objects.create(order=self.order, value="dns.example.com")
+        self.http_chall = AcmeChallenge.objects.create(
+            auth=self.http_auth, type=AcmeChallenge.TYPE_HTTP_01, status=AcmeChallenge.STATUS_PROCESSING
+        )
+        self.dns_chall = AcmeChallenge.objects.create(
+            auth=self.dns_auth, type=AcmeChallenge.TYPE_DNS_01, status=AcmeChallenge.STATUS_PROCESSING
+        )
+
+    @contextmanager
+    def mock_challenges(
+        self, http_content: Optional[bytes] = None, dns_content: Optional[bytes] = None
+    ) -> Iterator[mock.AsyncMock]:
+        """Mock the client fulfilling both challenges."""
+        if http_content is None:
+            http_content = self.http_chall.expected
+        if dns_content is None:
+            dns_content = self.dns_chall.expected
+        token = self.http_chall.encoded_token.decode("utf-8")
+        url = f"http://{self.http_auth.value}/.well-known/acme-challenge/{token}"
+        txt = TXTBase(dns.rdataclass.RdataClass.IN, dns.rdatatype.RdataType.TXT, [dns_content])
+
+        with (
+            requests_mock.Mocker() as req_mock,
+            mock.patch("dns.asyncresolver.resolve", return_value=[txt]) as resolve_mock,
+        ):
+            raw = HTTPResponse(body=io.BytesIO(http_content), status=HTTPStatus.OK, preload_content=False)
+            req_mock.get(url, raw=raw)
+            yield resolve_mock
+
+        resolve_mock.assert_awaited_once_with(
+            "_acme_challenge.dns.example.com", "TXT", lifetime=1, search=False
+        )
+
+    def assertStatus(  # pylint: disable=invalid-name; unittest standard
+        self, http_status: str, dns_status: str, order_status: str
+    ) -> None:
+        """Assert the status of both challenges (and their authorizations) and the order."""
+        for chall in (self.http_chall, self.dns_chall):
+            chall.refresh_from_db()
+            chall.auth.refresh_from_db()
+        self.order.refresh_from_db()
+        self.assertEqual(self.http_chall.status, http_status)
+        self.assertEqual(self.http_chall.auth.status, http_status)
+        self.assertEqual(self.dns_chall.status, dns_status)
+        self.assertEqual(self.dns_chall.auth.status, dns_status)
+        self.assertEqual(self.order.status, order_status)
+
+
+@freeze_time(TIMESTAMPS["everything_valid"])
+class AcmeValidateChallengesTestCase(AcmeValidateManyChallengesTestCaseMixin, TestCase):
+    """Test :py:func:`~django_ca.tasks.acme_validate_challenges`."""
+
+    def test_basic(self) -> None:
+        """Test validating both challenges."""
+        with self.mock_challenges():
+            tasks.acme_validate_challenges([self.http_chall.pk, self.dns_chall.pk])
+        self.assertStatus(AcmeChallenge.STATUS_VALID, AcmeChallenge.STATUS_VALID, AcmeOrder.STATUS_READY)
+        self.assertIsNotNone(self.http_chall.validated)
+        self.assertIsNotNone(self.dns_chall.validated)
+
+    def test_invalid_challenge(self) -> None:
+        """Test that a valid challenge does not reset the state of the order if another is invalid."""
+        with self.mock_challenges(http_content=b"wrong"):
+            tasks.acme_validate_challenges([self.http_chall.pk, self.dns_chall.pk])
+        self.assertStatus(AcmeChallenge.STATUS_INVALID, AcmeChallenge.STATUS_VALID, AcmeOrder.STATUS_INVALID)
+
+    @override_settings(CA_ACME_VALIDATION_TIMEOUT=5)
+    def test_timeout(self) -> None:
+        """Test a custom timeout."""
+        with mock.patch("django_ca.acme.validation.validate_http_01", return_value=True) as validate_mock:
+            tasks.acme_validate_challenges([self.http_chall.pk])
+        validate_mock.assert_called_once_with(self.http_chall, 5)
+        self.http_chall.refresh_from_db()
+        self.assertEqual(self.http_chall.status, AcmeChallenge.STATUS_VALID)
+
+    def test_acme_disabled(self) -> None:
+        """Test invoking task when ACME support is not enabled."""
+        with self.settings(CA_ENABLE_ACME=False), self.assertLogs() as logcm:
+            tasks.acme_validate_challenges([self.http_chall.pk])
+        self.assertEqual(logcm.output, ["ERROR:django_ca.tasks:ACME is not enabled."])
+
+    def test_unusable_challenges(self) -> None:
+        """Test invoking the task with challenges that cannot be validated."""
+        self.http_chall.status = AcmeChallenge.STATUS_PENDING
+        self.http_chall.save()
+        self.dns_auth.status = AcmeAuthorization.STATUS_VALID
+        self.dns_auth.save()
+
+        with self.assertLogs() as logcm:
+            tasks.acme_validate_challenges([self.http_chall.pk, self.dns_chall.pk, 0])
+        self.assertEqual(
+            logcm.output,
+            [
+                f"ERROR:django_ca.tasks:{self.http_chall}: pending: Invalid state (must be processing)",
+                f"ERROR:django_ca.tasks:{self.dns_chall}: Authentication is not usable",
+                "ERROR:django_ca.tasks:Challenge with id=0 not found",
+            ],
+        )
+
+
+@freeze_time(TIMESTAMPS["everything_valid"])
+class AcmeValidateOrderTestCase(AcmeValidateManyChallengesTestCaseMixin, TestCase):
+    """Test :py:func:`~django_ca.tasks.acme_validate_order`."""
+
+    def test_basic(self) -> None:
+        """Test validating both challenges of an order."""
+        with self.mock_challenges(), self.assertNumQueries(9):
+            tasks.acme_validate_order(self.order.pk)
+        self.assertStatus(AcmeChallenge.STATUS_VALID, AcmeChallenge.STATUS_VALID, AcmeOrder.STATUS_READY)
+        self.assertEqual(self.http_chall.validated, timezone.now())
+        self.assertEqual(self.dns_chall.validated, timezone.now())
+
+    def test_invalid_challenge(self) -> None:
+        """Test validating an order where one challenge is invalid."""
+        with self.mock_challenges(dns_content=b"wrong"):
+            tasks.acme_validate_order(self.order.pk)
+        self.assertStatus(AcmeChallenge.STATUS_VALID, AcmeChallenge.STATUS_INVALID, AcmeOrder.STATUS_INVALID)
+        self.assertIsNone(self.dns_chall.validated)
+
+    def test_pending_authorization(self) -> None:
+        """Test validating an order where another authorization is still pending."""
+        AcmeAuthorization.objects.create(order=self.order, value="other.example.com")
+        with self.mock_challenges():
+            tasks.acme_validate_order(self.order.pk)
+        self.assertStatus(AcmeChallenge.STATUS_VALID, AcmeChallenge.STATUS_VALID, AcmeOrder.STATUS_PENDING)
+
+    def test_concurrently_validated(self) -> None:
+        """Test that challenges validated by another task in the meantime are not updated again."""
+
+        async def results() -> dict[int, bool]:
+            return {self.http_chall.pk: False, self.dns_chall.pk: True}
+
+        # NOTE: Not an async function, as database queries are not allowed in an async context.
+        def validate(*args: Any, **kwargs: Any) -> Coroutine[Any, Any, dict[int, bool]]:
+            AcmeChallenge.objects.filter(pk=self.http_chall.pk).update(status=AcmeChallenge.STATUS_VALID)
+            AcmeChallenge.objects.filter(pk=self.dns_chall.pk).update(status=AcmeChallenge.STATUS_INVALID)
+            return results()
+
+        with mock.patch("django_ca.tasks.validate_challenges", validate):
+            tasks.acme_validate_order(self.order.pk)
+
+        self.http_chall.refresh_from_db()
+        self.dns_chall.refresh_from_db()
+        self.order.refresh_from_db()
+        self.assertEqual(self.http_chall.status, AcmeChallenge.STATUS_VALID)
+        self.assertEqual(self.dns_chall.status, AcmeChallenge.STATUS_INVALID)
+        self.assertEqual(self.order.status, AcmeOrder.STATUS_PENDING)
+
+    def test_schedule(self) -> None:
+        """Test that only one task per order is scheduled until the task starts."""
+        with mock.patch("django_ca.tasks.run_task", autospec=True) as run_task:
+            tasks.schedule_acme_order_validation(self.order.pk)
+            tasks.schedule_acme_order_validation(self.order.pk)
+        run_task.assert_called_once_with(tasks.acme_validate_order, self.order.pk)
+
+        # Once the task started, validating the order can be scheduled again.
+        with self.mock_challenges():
+            tasks.acme_validate_order(self.order.pk)
+        with mock.patch("django_ca.tasks.run_task", autospec=True) as run_task:
+            tasks.schedule_acme_order_validation(self.order.pk)
+        run_task.assert_called_once_with(tasks.acme_validate_order, self.order.pk)
+
+    def test_acme_disabled(self) -> None:
+        """Test invoking task when ACME support is not enabled."""
+        with self.settings(CA_ENABLE_ACME=False), self.assertLogs() as logcm:
+            tasks.acme_validate_order(self.order.pk)
+        self.assertEqual(logcm.output, ["ERROR:django_ca.tasks:ACME is not enabled."])
+
+    def test_no_challenges(self) -> None:
+        """Test invoking the task for an order with no challenges that can be validated."""
+        self.http_chall.status = AcmeChallenge.STATUS_VALID
+        self.http_chall.save()
+        self.dns_auth.status = AcmeAuthorization.STATUS_VALID
+        self.dns_auth.save()
+
+        with self.assertLogs() as logcm:
+            tasks.acme_validate_order(self.order.pk)
+        self.assertEqual(
+            logcm.output,
+            [
+                f"ERROR:django_ca.tasks:{self.dns_chall}: Authentication is not usable",
+                f"INFO:django_ca.tasks:Order with id={self.order.pk} has no challenges to validate.",
+            ],
+        )
+
+
 @freeze_time(TIMESTAMPS["everything_valid"])
 class AcmeIssueCertificateTestCase(TestCaseMixin, AcmeValuesMixin, TestCase):
     """Test :py:func:`~django_ca.tasks.acme_issue_certificate`."""
@@ -509,6 +713,135 @@ class AcmeIssueCertificateTestCase(TestCaseMixin, AcmeValuesMixin, TestCase):
         self.assertEqual(self.acme_cert.cert.profile, "client")
 
 
+@freeze_time(TIMESTAMPS["everything_valid"])
+class AcmeIssueQueuedCertificatesTestCase(TestCaseMixin, AcmeValuesMixin, TestCase):
+    """Test :py:func:`~django_ca.tasks.acme_issue_queued_certificates`."""
+
+    load_cas = ("root",)
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ca.acme_enabled = True
+        self.ca.save()
+        self.account = AcmeAccount.objects.create(
+            ca=self.ca,
+            contact="mailto:user@example.com",
+            terms_of_service_agreed=True,
+            pem=self.ACME_PEM_1,
+            thumbprint=self.ACME_THUMBPRINT_1,
+        )
+        self.acme_certs = [self.queue(f"host{i}.example.com") for i in range(3)]
+
+    def queue(self, hostname: str) -> AcmeCertificate:
+        """Queue a certificate for `hostname`."""
+        order = AcmeOrder.objects.create(account=self.account, status=AcmeOrder.STATUS_PROCESSING)
+        AcmeAuthorization.objects.create(order=order, value=hostname)
+
+        # NOTE: This is of course not the right CSR for the order, but all data from the CSR is discarded.
+        csr = CERT_DATA["root-cert"]["csr"]["parsed"].public_bytes(Encoding.PEM).decode("utf-8")
+        return AcmeCertificate.objects.create(order=order, csr=csr)
+
+    def test_acme_disabled(self) -> None:
+        """Test invoking task when ACME support is not enabled."""
+        with self.settings(CA_ENABLE_ACME=False), self.assertLogs() as logcm:
+            self.assertEqual(tasks.acme_issue_queued_certificates(), 0)
+        self.assertEqual(logcm.output, ["ERROR:django_ca.tasks:ACME is not enabled."])
+        self.assertFalse(AcmeCertificate.objects.filter(cert__isnull=False).exists())
+
+    @override_tmpcadir()
+    def test_basic(self) -> None:
+        """Test issuing queued certificates."""
+        with mock.patch.object(
+            type(self.ca.key_backend), "keep_key_loaded", wraps=self.ca.key_backend.keep_key_loaded
+        ) as keep_key_loaded:
+            self.assertEqual(tasks.acme_issue_queued_certificates(), 3)
+        keep_key_loaded.assert_called_once()
+
+        for acme_cert in self.acme_certs:
+            acme_cert.refresh_from_db()
+            assert acme_cert.cert is not None, "Check to make mypy happy"
+            self.assertEqual(acme_cert.order.status, AcmeOrder.STATUS_VALID)
+            self.assertEqual(acme_cert.cert.cn, acme_cert.order.authorizations.get().value)
+        self.assertFalse(AcmeCertificate.objects.queued().exists())
+
+        self.assertEqual(tasks.acme_issue_queued_certificates(), 0)
+
+    @override_tmpcadir()
+    def test_batch_size(self) -> None:
+        """Test that certificates are claimed in batches until the queue is empty."""
+        with mock.patch.object(
+            AcmeCertificate.objects, "claim", wraps=AcmeCertificate.objects.claim
+        ) as claim:
+            self.assertEqual(tasks.acme_issue_queued_certificates(batch_size=2), 3)
+        self.assertEqual(claim.call_args_list, [mock.call(self.ca, 2)] * 3)
+        self.assertFalse(AcmeCertificate.objects.queued().exists())
+
+    @override_tmpcadir(CA_USE_CELERY=True)
+    def test_blocked_task(self) -> None:
+        """Test that a task blocked by the concurrency limit leaves certificates to the running task."""
+        self.acme_certs[2].order.delete()  # only two queued orders
+        issue_certificate = tasks._acme_issue_certificate  # pylint: disable=protected-access
+        blocked: list[int] = []
+
+        def issue_and_run_second_task(*args: Any) -> None:
+            # The second task is started while the first task issues its first certificate.
+            if not blocked:
+                blocked.append(tasks.acme_issue_queued_certificates(batch_size=1, reschedule=True))
+            issue_certificate(*args)
+
+        # The blocked task schedules a retry, the first task does not, as the queue is empty once it returns.
+        retry = (((), {"batch_size": 1, "reschedule": True}), {"countdown": tasks.ACME_ISSUANCE_RETRY_DELAY})
+        with self.patch("django_ca.tasks._acme_issue_certificate", side_effect=issue_and_run_second_task):
+            with self.mute_celery(retry):
+                self.assertEqual(tasks.acme_issue_queued_certificates(batch_size=1, reschedule=True), 2)
+        self.assertEqual(blocked, [0])
+        self.assertFalse(AcmeCertificate.objects.queued().exists())
+
+    @override_tmpcadir(CA_USE_CELERY=True)
+    def test_reschedule(self) -> None:
+        """Test that the task schedules itself again if it is blocked by another worker."""
+        # Another worker claimed a certificate (and crashed)
+        self.assertEqual(AcmeCertificate.objects.claim(self.ca, 1), [self.acme_certs[0]])
+
+        # A retry is scheduled only once
+        retry = ((), {"batch_size": 10, "reschedule": True})
+        with self.mute_celery((retry, {"countdown": tasks.ACME_ISSUANCE_RETRY_DELAY})):
+            self.assertEqual(tasks.acme_issue_queued_certificates(reschedule=True), 0)
+            self.assertEqual(tasks.acme_issue_queued_certificates(reschedule=True), 0)
+
+        # Tasks that are not rescheduled (e.g. manage.py acme_issuance_worker) do not schedule a retry
+        cache.delete(tasks.ACME_ISSUANCE_RETRY_CACHE_KEY)
+        with self.mute_celery():
+            self.assertEqual(tasks.acme_issue_queued_certificates(), 0)
+
+        # The claim of the crashed worker times out, so the retry issues all certificates.
+        with self.freeze_time(timezone.now() + timedelta(minutes=11)), self.mute_celery():
+            self.assertEqual(tasks.acme_issue_queued_certificates(reschedule=True), 3)
+
+    @override_tmpcadir()
+    def test_error(self) -> None:
+        """Test that an error while issuing a certificate invalidates the order."""
+        with self.patch("django_ca.managers.CertificateManager.create_cert", side_effect=ValueError("foo")):
+            with self.assertLogs() as logcm:
+                self.assertEqual(tasks.acme_issue_queued_certificates(batch_size=1), 0)
+
+        self.assertEqual(len(logcm.output), 6)
+        for i, acme_cert in enumerate(self.acme_certs):
+            order = acme_cert.order
+            self.assertEqual(
+                logcm.output[i * 2],
+                f"INFO:django_ca.tasks:{order}: Issuing certificate for dns:host{i}.example.com",
+            )
+            self.assertTrue(
+                logcm.output[i * 2 + 1].startswith(
+                    f"ERROR:django_ca.tasks:{order}: Could not issue certificate."
+                )
+            )
+            order.refresh_from_db()
+            self.assertEqual(order.status, AcmeOrder.STATUS_INVALID)
+        self.assertFalse(AcmeCertificate.objects.queued().exists())
+
+
 @freeze_time(TIMESTAMPS["everything_valid"])
 class AcmeCleanupTestCase(TestCaseMixin, AcmeValuesMixin, TestCase):
     """Test :py:func:`~django_ca.tasks.acme_cleanup`."""
@@ -552,6 +885,45 @@ class AcmeCleanupTestCase(TestCaseMixin, AcmeValuesMixin, TestCase):
         self.assertEqual(AcmeChallenge.objects.all().count(), 0)
         self.assertEqual(AcmeCertificate.objects.all().count(), 0)
 
+    def test_batches(self) -> None:
+        """Test deleting orders in multiple batches."""
+        for i in range(4):
+            order = AcmeOrder.objects.create(account=self.account, status=AcmeOrder.STATUS_VALID)
+            auth = AcmeAuthorization.objects.create(order=order, value=f"host{i}.example.com")
+            AcmeChallenge.objects.create(auth=auth, type=AcmeChallenge.TYPE_HTTP_01)
+
+        with self.freeze_time(timezone.now() + timedelta(days=3)):
+            with self.assertLogs("django_ca.tasks", "DEBUG") as logcm:
+                tasks.acme_cleanup(batch_size=2)
+        self.assertEqual(
+            logcm.output,
+            [
+                "DEBUG:django_ca.tasks:Deleted 2 expired ACME orders (7 objects) so far.",
+                "DEBUG:django_ca.tasks:Deleted 4 expired ACME orders (13 objects) so far.",
+                "DEBUG:django_ca.tasks:Deleted 5 expired ACME orders (16 objects) so far.",
+                "INFO:django_ca.tasks:Deleted 5 expired ACME orders (16 objects).",
+            ],
+        )
+
+        self.assertEqual(AcmeOrder.objects.all().count(), 0)
+        self.assertEqual(AcmeAuthorization.objects.all().count(), 0)
+        self.assertEqual(AcmeChallenge.objects.all().count(), 0)
+        self.assertEqual(AcmeCertificate.objects.all().count(), 0)
+        self.assertEqual(self.account, AcmeAccount.objects.get(pk=self.account.pk))
+
+    def test_unused_orders(self) -> None:
+        """Test that pending and invalid orders are deleted as soon as they expire."""
+        pending = AcmeOrder.objects.create(account=self.account)
+        AcmeAuthorization.objects.create(order=pending, value=self.hostname)
+        invalid = AcmeOrder.objects.create(account=self.account, status=AcmeOrder.STATUS_INVALID)
+
+        with self.freeze_time(self.order.expires + timedelta(hours=1)):
+            tasks.acme_cleanup()
+
+        self.assertEqual(list(AcmeOrder.objects.all()), [self.order])
+        self.assertEqual(list(AcmeAuthorization.objects.all()), [self.auth])
+        self.assertFalse(AcmeOrder.objects.filter(pk__in=(pending.pk, invalid.pk)).exists())
+
     def test_acme_disabled(self) -> None:
         """Test task when ACME is disabled."""
         with self.settings(CA_ENABLE_ACME=False), self.assertLogs() as logcm:
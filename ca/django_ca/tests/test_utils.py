@@ -21,10 +21,11 @@ import unittest
 from collections.abc import Iterable
 from datetime import datetime, timedelta, timezone as tz
 from pathlib import Path
+from unittest import mock
 
 from cryptography import x509
 from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.asymmetric import dsa, ec, ed448
+from cryptography.hazmat.primitives.asymmetric import dsa, ec, ed448, ed25519, x448, x25519
 from cryptography.hazmat.primitives.serialization import Encoding
 from cryptography.x509.name import _ASN1Type
 from cryptography.x509.oid import NameOID, ObjectIdentifier
@@ -37,15 +38,18 @@ from pytest_django.fixtures import SettingsWrapper
 
 from django_ca import ca_settings, constants, utils
 from django_ca.tests.base.assertions import assert_removed_in_200
-from django_ca.tests.base.constants import CRYPTOGRAPHY_VERSION
+from django_ca.tests.base.constants import CERT_DATA, CRYPTOGRAPHY_VERSION
 from django_ca.tests.base.utils import dns, doctest_module, uri
 from django_ca.typehints import SerializedObjectIdentifier
 from django_ca.utils import (
     bytes_to_hex,
+    clear_cached_files,
     format_general_name,
     generate_private_key,
     get_cert_builder,
+    get_certificate_metadata,
     get_storage,
+    load_cached_file,
     merge_x509_names,
     parse_encoding,
     parse_expires,
@@ -83,6 +87,57 @@ def test_read_file(tmpcadir: Path) -> None:
     assert read_file(path) == data
 
 
+def test_load_cached_file(tmpcadir: Path) -> None:
+    """Test :py:func:`django_ca.utils.load_cached_file`."""
+    name = "test-cached-data"
+    path = os.path.join(tmpcadir, name)
+    with open(path, "wb") as stream:
+        stream.write(b"first")
+    loader = mock.Mock(side_effect=lambda data: data.upper())
+
+    assert load_cached_file(name, loader) == b"FIRST"
+    assert load_cached_file(name, loader) == b"FIRST"
+    loader.assert_called_once_with(b"first")
+
+    # Update the file, value is loaded again after the modification time changed
+    with open(path, "wb") as stream:
+        stream.write(b"second")
+    os.utime(path, (0, 12345))
+    assert load_cached_file(name, loader) == b"SECOND"
+    assert loader.call_count == 2
+
+    # Clearing the cache also loads the file again
+    clear_cached_files(name)
+    assert load_cached_file(name, loader) == b"SECOND"
+    assert loader.call_count == 3
+
+
+def test_load_cached_file_with_read(tmpcadir: Path) -> None:
+    """Test :py:func:`django_ca.utils.load_cached_file` with a custom function to read the file."""
+    name = "test-cached-data"
+    with open(os.path.join(tmpcadir, name), "wb") as stream:
+        stream.write(b"data")
+    read = mock.Mock(return_value=b"custom")
+
+    assert load_cached_file(name, bytes.upper, read=read) == b"CUSTOM"
+    assert load_cached_file(name, bytes.upper, read=read) == b"CUSTOM"
+    read.assert_called_once_with()
+
+
+def test_load_cached_file_without_modified_time(tmpcadir: Path) -> None:
+    """Test :py:func:`django_ca.utils.load_cached_file` with a storage that has no modification times."""
+    name = "test-cached-data"
+    with open(os.path.join(tmpcadir, name), "wb") as stream:
+        stream.write(b"data")
+    loader = mock.Mock(side_effect=lambda data: data.upper())
+
+    storage = get_storage()
+    with mock.patch.object(type(storage), "get_modified_time", side_effect=NotImplementedError):
+        assert load_cached_file(name, loader) == b"DATA"
+        assert load_cached_file(name, loader) == b"DATA"
+    assert loader.call_count == 2
+
+
 def test_deprecated_storage_configuration(settings: SettingsWrapper) -> None:
     """Test that using a deprecated storage configuration emits a warning."""
     settings.STORAGES = {
@@ -544,6 +599,62 @@ def test_format_general_name(general_name: x509.GeneralName, expected: str) -> N
     assert format_general_name(general_name) == expected
 
 
+@pytest.mark.parametrize(
+    "name,key_size,signature_algorithm",
+    (
+        ("root-cert", 2048, "sha256WithRSAEncryption"),
+        ("dsa-cert", 2048, "dsa-with-sha256"),
+        ("ec-cert", 256, "ecdsa-with-SHA256"),
+        ("ed25519-cert", None, "ed25519"),
+        ("ed448-cert", None, "ed448"),
+        ("no-extensions", 2048, "sha256WithRSAEncryption"),
+    ),
+)
+def test_get_certificate_metadata(
+    name: str, key_size: typing.Optional[int], signature_algorithm: str
+) -> None:
+    """Test :py:func:`django_ca.utils.get_certificate_metadata`."""
+    certificate: x509.Certificate = CERT_DATA[name]["pub"]["parsed"]
+    issuer_hash = hashes.Hash(hashes.SHA256())
+    issuer_hash.update(certificate.issuer.public_bytes())
+    try:
+        san = certificate.extensions.get_extension_for_class(x509.SubjectAlternativeName).value
+        names = [format_general_name(name) for name in san]
+    except x509.ExtensionNotFound:
+        names = []
+
+    metadata = get_certificate_metadata(certificate)
+    assert metadata == {
+        "public_key_type": CERT_DATA[name]["key_type"],
+        "public_key_size": key_size,
+        "signature_algorithm": signature_algorithm,
+        "fingerprint_sha256": CERT_DATA[name]["sha256"].replace(":", ""),
+        "issuer_hash": issuer_hash.finalize().hex().upper(),
+        "subject_alternative_names": "\n".join(names),
+    }
+    if name == "no-extensions":
+        assert metadata["subject_alternative_names"] == ""
+    else:
+        assert metadata["subject_alternative_names"] != ""
+
+
+@pytest.mark.parametrize("private_key_type", (x25519.X25519PrivateKey, x448.X448PrivateKey))
+def test_get_certificate_metadata_with_key_agreement_key(
+    private_key_type: typing.Union[type[x25519.X25519PrivateKey], type[x448.X448PrivateKey]],
+) -> None:
+    """Test :py:func:`django_ca.utils.get_certificate_metadata` with X25519/X448 keys (no key type)."""
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "example.com")])
+    builder = get_cert_builder(datetime.now(tz=tz.utc) + timedelta(days=1))
+    builder = builder.subject_name(name).issuer_name(name)
+    builder = builder.public_key(private_key_type.generate().public_key())
+    certificate = builder.sign(ed25519.Ed25519PrivateKey.generate(), None)
+
+    metadata = get_certificate_metadata(certificate)
+    assert metadata["public_key_type"] == ""
+    assert metadata["public_key_size"] is None
+    assert metadata["signature_algorithm"] == "ed25519"
+
+
 class SerializeName(TestCase):
     """Test the serialize_name function."""
 
@@ -14,25 +14,37 @@
 """Test basic views."""
 
 import copy
+import hashlib
+from datetime import datetime, timedelta, timezone as tz
 from http import HTTPStatus
+from unittest import mock
 
+from cryptography import x509
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.serialization import Encoding
+from cryptography.x509.oid import ExtensionOID
 
 from django.core.cache import cache
+from django.core.files.base import ContentFile
 from django.test import TestCase
 from django.test.utils import override_settings
 from django.urls import include, path, re_path, reverse
+from django.utils.http import http_date
 
 import pytest
 from freezegun import freeze_time
 
 from django_ca import ca_settings
-from django_ca.tests.base.constants import CERT_DATA
+from django_ca.key_backends.storages import UsePrivateKeyOptions
+from django_ca.models import CertificateAuthority
+from django_ca.tests.base.constants import CERT_DATA, TIMESTAMPS
 from django_ca.tests.base.mixins import TestCaseMixin
 from django_ca.tests.base.utils import get_idp, idp_full_name, override_tmpcadir, uri
+from django_ca.utils import get_crl_cache_key, get_storage, read_file
 from django_ca.views import CertificateRevocationListView
 
+KEY_BACKEND_OPTIONS = UsePrivateKeyOptions(password=None)
+
 app_name = "django_ca"
 urlpatterns = [
     path("django_ca/", include("django_ca.urls")),
@@ -126,6 +138,169 @@ class GenericCRLViewTestsMixin(TestCaseMixin):
             algorithm=self.ca.algorithm,
         )
 
+    @override_tmpcadir()
+    def test_delta_crl(self) -> None:
+        """Test getting a delta CRL."""
+        idp = get_idp(full_name=idp_full_name(self.ca), only_contains_user_certs=True)
+        delta_indicator = x509.Extension(
+            oid=ExtensionOID.DELTA_CRL_INDICATOR, critical=True, value=x509.DeltaCRLIndicator(0)
+        )
+
+        # A delta CRL cannot be retrieved before a complete CRL was generated
+        response = self.client.get(reverse("django_ca:crl-delta", kwargs={"serial": self.ca.serial}))
+        assert response.status_code == HTTPStatus.NOT_FOUND
+        assert response.content == b"No delta CRL available before a complete CRL was generated."
+
+        # Revoke a certificate, it will show up in the complete CRL
+        self.cert.revoke()
+        response = self.client.get(reverse("django_ca:crl", kwargs={"serial": self.ca.serial}))
+        assert response.status_code == HTTPStatus.OK
+        self.assertCRL(
+            response.content,
+            expected=[self.cert],
+            encoding=Encoding.DER,
+            expires=600,
+            idp=idp,
+            algorithm=self.ca.algorithm,
+        )
+
+        # The delta CRL does not include the certificate, as it is already part of the base CRL
+        response = self.client.get(reverse("django_ca:crl-delta", kwargs={"serial": self.ca.serial}))
+        assert response.status_code == HTTPStatus.OK
+        assert response["Content-Type"] == "application/pkix-crl"
+        self.assertCRL(
+            response.content,
+            encoding=Encoding.DER,
+            expires=600,
+            idp=idp,
+            crl_number=1,
+            algorithm=self.ca.algorithm,
+            extensions=[delta_indicator],
+        )
+
+    @override_tmpcadir()
+    def test_delta_crl_with_error(self) -> None:
+        """Test that errors when generating a delta CRL are not hidden behind a "404 Not Found" response."""
+        self.ca.get_crl(KEY_BACKEND_OPTIONS, scope="user")  # generate a base CRL
+        url = reverse("django_ca:crl-delta", kwargs={"serial": self.ca.serial})
+        with mock.patch(
+            "django_ca.models.CertificateAuthority.get_crl", autospec=True, side_effect=ValueError("error")
+        ):
+            with pytest.raises(ValueError, match=r"^error$"):
+                self.client.get(url)
+
+    @override_tmpcadir()
+    def test_stored_crl(self) -> None:
+        """Test that CRLs stored by cache_crls() are served if they are not in the cache."""
+        idp = get_idp(full_name=idp_full_name(self.ca), only_contains_user_certs=True)
+        self.ca.cache_crls(KEY_BACKEND_OPTIONS)
+        self.cert.revoke()
+        cache.clear()
+
+        # Stored CRL is served (and cached again), although the certificate is now revoked
+        with mock.patch.object(CertificateAuthority, "get_crl", autospec=True) as get_crl_mock:
+            response = self.client.get(reverse("default", kwargs={"serial": self.ca.serial}))
+            assert response.status_code == HTTPStatus.OK
+            self.assertCRL(response.content, encoding=Encoding.DER, idp=idp, algorithm=self.ca.algorithm)
+            assert cache.get(get_crl_cache_key(self.ca.serial, Encoding.DER, "user")) == response.content
+        get_crl_mock.assert_not_called()
+
+        # Stored PEM CRL is also served
+        cache.clear()
+        response = self.client.get(reverse("ca_crl", kwargs={"serial": self.ca.serial}))
+        assert response.status_code == HTTPStatus.OK
+        assert response.content == read_file(f"crl/{self.ca.serial}/ca.pem")
+
+        # Once the stored CRL is expired, a new CRL is generated
+        cache.clear()
+        with freeze_time("2019-04-15 13:00:00"):
+            response = self.client.get(reverse("default", kwargs={"serial": self.ca.serial}))
+        assert response.status_code == HTTPStatus.OK
+        crl = x509.load_der_x509_crl(response.content)
+        assert [entry.serial_number for entry in crl] == [self.cert.pub.loaded.serial_number]
+        assert crl.extensions.get_extension_for_class(x509.CRLNumber).value.crl_number == 1
+
+    @override_tmpcadir(CA_ENABLE_CRL_STORAGE=False)
+    def test_stored_crl_with_storage_disabled(self) -> None:
+        """Test that stored CRLs are not served if storage of CRLs is disabled."""
+        self.ca.cache_crls(KEY_BACKEND_OPTIONS)
+        self.cert.revoke()
+        cache.clear()
+
+        # Write a stored CRL anyway, to make sure it is not used
+        get_storage().save(f"crl/{self.ca.serial}/user.der", ContentFile(b"invalid"))
+
+        response = self.client.get(reverse("default", kwargs={"serial": self.ca.serial}))
+        assert response.status_code == HTTPStatus.OK
+        self.assertCRL(
+            response.content,
+            expected=[self.cert],
+            encoding=Encoding.DER,
+            expires=600,
+            idp=get_idp(full_name=idp_full_name(self.ca), only_contains_user_certs=True),
+            crl_number=1,
+            algorithm=self.ca.algorithm,
+        )
+
+    @override_tmpcadir()
+    def test_caching_headers(self) -> None:
+        """Test HTTP caching headers and conditional requests."""
+        now = datetime.now(tz=tz.utc)
+        url = reverse("default", kwargs={"serial": self.ca.serial})
+        response = self.client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        etag = f'"{hashlib.sha1(response.content).hexdigest().upper()}"'
+        assert response["ETag"] == etag
+        assert response["Last-Modified"] == http_date(now.timestamp())
+        assert response["Expires"] == http_date((now + timedelta(seconds=600)).timestamp())
+        assert response["Cache-Control"] == "max-age=600, public, no-transform, must-revalidate"
+
+        # Conditional requests receive a "304 Not Modified" response
+        response = self.client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+        assert response.content == b""
+        assert response["ETag"] == etag
+        response = self.client.get(url, headers={"If-Modified-Since": http_date(now.timestamp())})
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+        # The CRL is returned if the client has an outdated copy
+        response = self.client.get(url, headers={"If-None-Match": '"ABC"'})
+        assert response.status_code == HTTPStatus.OK
+        assert response["ETag"] == etag
+
+        # Test headers for PEM encoded CRLs
+        response = self.client.get(reverse("ca_crl", kwargs={"serial": self.ca.serial}))
+        assert response.status_code == HTTPStatus.OK
+        assert response.content.startswith(b"-----BEGIN X509 CRL-----")
+        assert response["Last-Modified"] == http_date(now.timestamp())
+        assert response["ETag"] == f'"{hashlib.sha1(response.content).hexdigest().upper()}"'
+
+    @override_tmpcadir()
+    def test_caching_headers_with_cached_crl(self) -> None:
+        """Test that a cached CRL is not parsed again to get caching headers."""
+        now = datetime.now(tz=tz.utc)
+        url = reverse("default", kwargs={"serial": self.ca.serial})
+        response = self.client.get(url)
+        assert response.status_code == HTTPStatus.OK
+
+        with mock.patch("django_ca.views._load_crl", autospec=True) as load_crl:
+            response = self.client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        assert response["Last-Modified"] == http_date(now.timestamp())
+        assert response["Expires"] == http_date((now + timedelta(seconds=600)).timestamp())
+        load_crl.assert_not_called()
+
+    @override_tmpcadir()
+    def test_caching_headers_without_next_update(self) -> None:
+        """Test caching headers for a CRL without a nextUpdate field (the configured expiry is used)."""
+        now = datetime.now(tz=tz.utc)
+        url = reverse("default", kwargs={"serial": self.ca.serial})
+        with mock.patch("django_ca.views.crl_next_update", autospec=True, return_value=None):
+            response = self.client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        assert response["Last-Modified"] == http_date(now.timestamp())
+        assert response["Expires"] == http_date((now + timedelta(seconds=600)).timestamp())
+
     @override_tmpcadir()
     def test_full_scope(self) -> None:
         """Test getting CRL with full scope."""
@@ -308,3 +483,19 @@ class GenericCAIssuersViewTests(TestCaseMixin, TestCase):
             resp = self.client.get(url)
             assert resp["Content-Type"] == "application/pkix-cert"
             assert resp.content == ca.root.pub.der
+
+    @freeze_time(TIMESTAMPS["everything_valid"])
+    def test_caching_headers(self) -> None:
+        """Test HTTP caching headers and conditional requests."""
+        url = reverse("django_ca:issuer", kwargs={"serial": self.ca.serial})
+        response = self.client.get(url)
+        etag = f'"{hashlib.sha1(self.ca.pub.der).hexdigest().upper()}"'
+        expires = TIMESTAMPS["everything_valid"] + timedelta(days=1)
+        assert response["ETag"] == etag
+        assert response["Last-Modified"] == http_date(self.ca.valid_from.timestamp())
+        assert response["Expires"] == http_date(expires.timestamp())
+        assert response["Cache-Control"] == "max-age=86400, public, no-transform, must-revalidate"
+
+        response = self.client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+        assert response.content == b""
@@ -14,12 +14,14 @@
 """Test OCSP related views."""
 
 import base64
+import hashlib
 import typing
 from datetime import datetime, timedelta
 from http import HTTPStatus
 from typing import Optional, Union
 from unittest import mock
 
+import asn1crypto.ocsp
 from cryptography import x509
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import dsa, ec, ed448, ed25519, padding, rsa
@@ -31,9 +33,11 @@ from cryptography.hazmat.primitives.serialization import Encoding, PrivateFormat
 from cryptography.x509 import ocsp
 from cryptography.x509.oid import OCSPExtensionOID, SignatureAlgorithmOID
 
+from django.core.cache import cache
 from django.core.files.storage import storages
 from django.test import TestCase, override_settings
 from django.urls import path, re_path, reverse
+from django.utils.http import http_date
 
 from freezegun import freeze_time
 
@@ -41,12 +45,13 @@ from django_ca.constants import ReasonFlags
 from django_ca.key_backends.storages import UsePrivateKeyOptions
 from django_ca.modelfields import LazyCertificate
 from django_ca.models import Certificate, CertificateAuthority
+from django_ca.signals import post_issue_certs
 from django_ca.tests.base.constants import CERT_DATA, FIXTURES_DATA, FIXTURES_DIR, TIMESTAMPS
 from django_ca.tests.base.mixins import TestCaseMixin
 from django_ca.tests.base.typehints import HttpResponse
 from django_ca.tests.base.utils import override_tmpcadir
-from django_ca.utils import get_storage, hex_to_bytes
-from django_ca.views import OCSPView
+from django_ca.utils import get_storage, hex_to_bytes, read_file
+from django_ca.views import GenericOCSPView, OCSPView
 
 
 # openssl ocsp -issuer django_ca/tests/fixtures/root.pem -serial <serial> \
@@ -66,6 +71,7 @@ req1 = _load_req(FIXTURES_DATA["ocsp"]["nonce"]["filename"])
 req1_nonce = hex_to_bytes(FIXTURES_DATA["ocsp"]["nonce"]["nonce"])
 req_no_nonce = _load_req(FIXTURES_DATA["ocsp"]["no-nonce"]["filename"])
 unknown_req = _load_req("unknown-serial")
+UNKNOWN_CERT_MESSAGE = "OCSP request for unknown cert received."
 multiple_req = _load_req("multiple-serial")
 
 urlpatterns = [
@@ -306,6 +312,8 @@ class OCSPViewTestMixin(TestCaseMixin):
         certificate: Certificate,
         nonce: Optional[bytes] = None,
         hash_algorithm: type[hashes.HashAlgorithm] = hashes.SHA256,
+        headers: Optional[dict[str, str]] = None,
+        status: HTTPStatus = HTTPStatus.OK,
     ) -> "HttpResponse":
         """Make an OCSP get request."""
         builder = ocsp.OCSPRequestBuilder()
@@ -323,10 +331,90 @@ class OCSPViewTestMixin(TestCaseMixin):
                 "data": base64.b64encode(request.public_bytes(Encoding.DER)).decode("utf-8"),
             },
         )
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, HTTPStatus.OK)
+        response = self.client.get(url, headers=headers)
+        self.assertEqual(response.status_code, status)
         return response
 
+    def ocsp_batch_request(
+        self,
+        cert: Union[Certificate, CertificateAuthority],
+        issuer: CertificateAuthority,
+        serials: list[int],
+        nonce: Optional[bytes] = None,
+        critical_extension: bool = False,
+    ) -> bytes:
+        """Build an OCSP request for multiple serials issued by `issuer`.
+
+        cryptography does not support requests for multiple certificates, so a request for `cert` is created
+        with cryptography and request entries for all `serials` are added using asn1crypto.
+        """
+        builder = ocsp.OCSPRequestBuilder()
+        builder = builder.add_certificate(cert.pub.loaded, issuer.pub.loaded, hashes.SHA256())
+        if nonce is not None:  # Add Nonce if requested
+            builder = builder.add_extension(x509.OCSPNonce(nonce), critical_extension)
+        request = asn1crypto.ocsp.OCSPRequest.load(builder.build().public_bytes(Encoding.DER))
+
+        request_list = []
+        for serial in serials:
+            cert_id = request["tbs_request"]["request_list"][0]["req_cert"].copy()
+            cert_id["serial_number"] = serial
+            request_list.append({"req_cert": cert_id})
+        request["tbs_request"]["request_list"] = request_list
+        data: bytes = request.dump(force=True)
+        return data
+
+    def assertOCSPBatchResponse(  # pylint: disable=invalid-name
+        self,
+        http_response: "HttpResponse",
+        requested_certificates: list[Union[Certificate, CertificateAuthority, int]],
+        responder_certificate: Certificate,
+        nonce: Optional[bytes] = None,
+        signature_hash_algorithm: Optional[type[hashes.HashAlgorithm]] = hashes.SHA256,
+        signature_algorithm_oid: x509.ObjectIdentifier = SignatureAlgorithmOID.RSA_WITH_SHA256,
+    ) -> None:
+        """Assert an OCSP response for multiple certificates.
+
+        Integers in `requested_certificates` are serials of unknown certificates.
+        """
+        self.assertEqual(http_response["Content-Type"], "application/ocsp-response")
+        response = ocsp.load_der_ocsp_response(http_response.content)
+
+        self.assertEqual(response.response_status, ocsp.OCSPResponseStatus.SUCCESSFUL)
+        if signature_hash_algorithm is None:
+            self.assertIsNone(response.signature_hash_algorithm)
+        else:
+            self.assertIsInstance(response.signature_hash_algorithm, signature_hash_algorithm)
+        self.assertEqual(response.signature_algorithm_oid, signature_algorithm_oid)
+        self.assertEqual(response.certificates, [responder_certificate.pub.loaded])
+        self.assertIsNone(response.responder_name)
+        self.assertEqual(
+            response.responder_key_hash,
+            x509.SubjectKeyIdentifier.from_public_key(responder_certificate.pub.loaded.public_key()).digest,
+        )
+
+        if nonce is None:
+            self.assertEqual(len(response.extensions), 0)
+        else:
+            nonce_extension = response.extensions.get_extension_for_class(x509.OCSPNonce)
+            self.assertIs(nonce_extension.critical, False)
+            self.assertEqual(nonce_extension.value.nonce, nonce)
+
+        single_responses = list(response.responses)
+        self.assertEqual(len(single_responses), len(requested_certificates))
+        for certificate, single_response in zip(requested_certificates, single_responses):
+            if isinstance(certificate, int):
+                self.assertEqual(single_response.serial_number, certificate)
+                self.assertEqual(single_response.certificate_status, ocsp.OCSPCertStatus.UNKNOWN)
+            else:
+                self.assertOCSPSingleResponse(certificate, single_response)
+            self.assertEqual(single_response.this_update, datetime.now())
+            self.assertEqual(single_response.next_update, datetime.now() + timedelta(seconds=86400))
+
+        public_key = typing.cast(
+            CertificateIssuerPublicKeyTypes, responder_certificate.pub.loaded.public_key()
+        )
+        self.assertOCSPSignature(public_key, response)
+
 
 class OCSPManualViewTestCaseMixin(OCSPViewTestMixin):
     """Mixin defining test cases for OCSPView.
@@ -421,6 +509,21 @@ class OCSPManualViewTestCaseMixin(OCSPViewTestMixin):
             single_response_hash_algorithm=hashes.SHA1,
         )
 
+    @override_tmpcadir(CA_ENABLE_OCSP_RESPONSE_CACHE=True)
+    def test_post_without_nonce(self) -> None:
+        """Test a request without a nonce, which is never cached by manually configured views."""
+        for _ in range(0, 2):
+            response = self.client.post(
+                reverse("post"), req_no_nonce, content_type="application/ocsp-request"
+            )
+            self.assertEqual(response.status_code, HTTPStatus.OK)
+            self.assertOCSPResponse(
+                response,
+                requested_certificate=self.cert,
+                expires=1200,
+                single_response_hash_algorithm=hashes.SHA1,
+            )
+
     @override_tmpcadir()
     def test_loaded_cryptography_cert(self) -> None:
         """Test view with loaded cryptography cert."""
@@ -576,16 +679,30 @@ class OCSPManualViewTestCaseMixin(OCSPViewTestMixin):
         self.assertEqual(len(logcm.output), 1)
         self.assertIn("ValueError: error parsing asn1 value", logcm.output[0], logcm.output[0])
 
+    @override_tmpcadir()
     def test_multiple(self) -> None:
-        """Try making multiple OCSP requests (not currently supported)."""
+        """Make an OCSP request for multiple (unknown) certificates."""
         data = base64.b64encode(multiple_req).decode("utf-8")
         with self.assertLogs() as logcm:
             response = self.client.get(reverse("get", kwargs={"data": data}))
         self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(
+            logcm.output,
+            [
+                "WARNING:django_ca.views:7B: OCSP request for unknown cert received.",
+                "WARNING:django_ca.views:159: OCSP request for unknown cert received.",
+            ],
+        )
         ocsp_response = ocsp.load_der_ocsp_response(response.content)
-        self.assertEqual(ocsp_response.response_status, ocsp.OCSPResponseStatus.MALFORMED_REQUEST)
-        self.assertEqual(len(logcm.output), 1)
-        self.assertIn("OCSP request contains more than one request", logcm.output[0])
+        self.assertEqual(ocsp_response.response_status, ocsp.OCSPResponseStatus.SUCCESSFUL)
+        single_responses = list(ocsp_response.responses)
+        self.assertEqual([resp.serial_number for resp in single_responses], [123, 345])
+        self.assertEqual(
+            [resp.certificate_status for resp in single_responses],
+            [ocsp.OCSPCertStatus.UNKNOWN, ocsp.OCSPCertStatus.UNKNOWN],
+        )
+        this_update = single_responses[0].this_update
+        self.assertEqual(single_responses[0].next_update, this_update + timedelta(seconds=600))
 
     @override_tmpcadir()
     def test_bad_ca_cert(self) -> None:
@@ -668,6 +785,38 @@ class GenericOCSPViewTestCase(OCSPViewTestMixin, TestCase):
             response, requested_certificate=self.cert, nonce=b"foo", responder_certificate=ocsp_cert
         )
 
+        # Responses with a nonce cannot be cached
+        self.assertNotIn("ETag", response)
+        self.assertNotIn("Cache-Control", response)
+
+    @override_tmpcadir()
+    def test_ocsp_get_caching_headers(self) -> None:
+        """Test HTTP caching headers and conditional requests for OCSP GET requests."""
+        private_key, ocsp_cert = self.generate_ocsp_key(self.ca)
+        now = TIMESTAMPS["everything_valid"]
+
+        response = self.ocsp_get(self.cert)
+        etag = f'"{hashlib.sha1(response.content).hexdigest().upper()}"'
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response["Last-Modified"], http_date(now.timestamp()))
+        self.assertEqual(response["Expires"], http_date((now + timedelta(seconds=86400)).timestamp()))
+        self.assertEqual(response["Cache-Control"], "max-age=86400, public, no-transform, must-revalidate")
+
+        # Conditional requests receive a "304 Not Modified" response
+        response = self.ocsp_get(self.cert, headers={"If-None-Match": etag}, status=HTTPStatus.NOT_MODIFIED)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["ETag"], etag)
+        response = self.ocsp_get(
+            self.cert,
+            headers={"If-Modified-Since": http_date(now.timestamp())},
+            status=HTTPStatus.NOT_MODIFIED,
+        )
+        self.assertEqual(response.content, b"")
+
+        # Response is returned if the client has an outdated copy
+        response = self.ocsp_get(self.cert, headers={"If-None-Match": '"ABC"'})
+        self.assertOCSPResponse(response, requested_certificate=self.cert, responder_certificate=ocsp_cert)
+
     @override_tmpcadir()
     def test_ocsp_response_validity(self) -> None:
         """Test a custom OCSP response validity."""
@@ -821,3 +970,230 @@ class GenericOCSPViewTestCase(OCSPViewTestMixin, TestCase):
         url = reverse("django_ca:ocsp-cert-get", kwargs={"serial": "00AA", "data": "irrelevant"})
         response = self.client.post(url, req1, content_type="application/ocsp-request")
         self.assertEqual(response.status_code, 405)
+
+    @override_tmpcadir()
+    def test_unknown_certificate_authority(self) -> None:
+        """Test requesting a certificate from a certificate authority that does not exist."""
+        url = reverse(
+            "django_ca:ocsp-cert-post",
+            kwargs={"serial": "00AA"},  # serial does not exist in database
+        )
+        with self.assertLogs() as logcm:
+            response = self.client.post(url, req1, content_type="application/ocsp-request")
+        self.assertEqual(logcm.output, ["ERROR:django_ca.views:: Certificate Authority could not be found."])
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        ocsp_response = ocsp.load_der_ocsp_response(response.content)
+        self.assertEqual(ocsp_response.response_status, ocsp.OCSPResponseStatus.INTERNAL_ERROR)
+
+    @override_tmpcadir(CA_ENABLE_OCSP_RESPONSE_CACHE=True)
+    def test_response_cache(self) -> None:
+        """Test serving pre-signed responses from the cache."""
+        private_key, ocsp_cert = self.generate_ocsp_key(self.ca)
+
+        response = self.ocsp_get(self.cert)
+        self.assertOCSPResponse(response, requested_certificate=self.cert, responder_certificate=ocsp_cert)
+
+        # Second request is served from the cache without any database queries
+        with self.assertNumQueries(0):
+            cached_response = self.ocsp_get(self.cert)
+        self.assertEqual(cached_response.content, response.content)
+
+        # Requests with a different hash algorithm are not served from the cache
+        response = self.ocsp_get(self.cert, hash_algorithm=hashes.SHA512)
+        self.assertOCSPResponse(
+            response,
+            requested_certificate=self.cert,
+            responder_certificate=ocsp_cert,
+            single_response_hash_algorithm=hashes.SHA512,
+        )
+        with self.assertNumQueries(0):
+            cached_response = self.ocsp_get(self.cert, hash_algorithm=hashes.SHA512)
+        self.assertEqual(cached_response.content, response.content)
+
+        # Requests with a nonce are never served from the cache
+        response = self.ocsp_get(self.cert, nonce=b"foo")
+        self.assertOCSPResponse(
+            response, requested_certificate=self.cert, nonce=b"foo", responder_certificate=ocsp_cert
+        )
+
+        # Revoke the certificate, the cached response is invalidated
+        self.cert.revoke()
+        response = self.ocsp_get(self.cert)
+        self.assertOCSPResponse(response, requested_certificate=self.cert, responder_certificate=ocsp_cert)
+
+    @override_tmpcadir(CA_ENABLE_OCSP_RESPONSE_CACHE=True)
+    def test_response_cache_expires(self) -> None:
+        """Test that cached responses expire after half of their validity."""
+        private_key, ocsp_cert = self.generate_ocsp_key(self.ca)
+
+        with mock.patch("django_ca.views.cache.set", autospec=True) as cache_set:
+            self.ocsp_get(self.cert)
+        cache_set.assert_called_once_with(
+            f"ocsp_{self.ca.serial}_{self.cert.serial}_cert", mock.ANY, self.ca.ocsp_response_validity // 2
+        )
+
+    @override_tmpcadir(CA_ENABLE_OCSP_RESPONSE_CACHE=True)
+    def test_response_cache_revoke_ca(self) -> None:
+        """Test that revoking a certificate authority invalidates cached responses."""
+        cache_key = f"ocsp_{self.cas['root'].serial}_{self.ca.serial}_ca"
+        cache.set(cache_key, {"sha256": b"foo"})
+
+        # Revoking a root CA does not touch the cache
+        self.cas["root"].revoke()
+        self.assertEqual(cache.get(cache_key), {"sha256": b"foo"})
+
+        self.ca.revoke()
+        self.assertIsNone(cache.get(cache_key))
+
+    @override_tmpcadir(CA_ENABLE_OCSP_RESPONSE_CACHE=True)
+    def test_response_cache_issue_certs(self) -> None:
+        """Test that issuing certificates in bulk invalidates cached responses."""
+        cache_key = f"ocsp_{self.ca.serial}_{self.cert.serial}_cert"
+        cache.set(cache_key, {"sha256": b"foo"})
+
+        post_issue_certs.send(sender=Certificate, certs=[self.cert])
+        self.assertIsNone(cache.get(cache_key))
+
+    @override_tmpcadir()
+    def test_responder_key_is_cached(self) -> None:
+        """Test that the responder key and certificate are loaded only once per process."""
+        private_key, ocsp_cert = self.generate_ocsp_key(self.ca)
+
+        read_file_mock = mock.Mock(side_effect=read_file)
+        with mock.patch("django_ca.utils.read_file", new=read_file_mock):
+            with mock.patch("django_ca.views.read_file", new=read_file_mock):
+                self.ocsp_get(self.cert)
+                self.assertEqual(read_file_mock.call_count, 2)  # key and certificate
+
+                response = self.ocsp_get(self.cert)
+                self.assertEqual(read_file_mock.call_count, 2)  # loaded from cache
+        self.assertOCSPResponse(response, requested_certificate=self.cert, responder_certificate=ocsp_cert)
+
+        # Regenerate the key, the new key is used right away
+        key_backend_options = UsePrivateKeyOptions(password=None)
+        _key_path, _cert_path, ocsp_cert = self.ca.generate_ocsp_key(  # type: ignore[misc]
+            key_backend_options, force=True
+        )
+        response = self.ocsp_get(self.cert)
+        self.assertOCSPResponse(response, requested_certificate=self.cert, responder_certificate=ocsp_cert)
+
+    @override_tmpcadir()
+    def test_responder_key_data_is_used(self) -> None:
+        """Test that an overwritten get_responder_key_data() is used when loading the responder key."""
+        private_key, ocsp_cert = self.generate_ocsp_key(self.ca)
+        serial = self.ca.serial.replace(":", "")
+        key_data = read_file(f"ocsp/{serial}.key")
+
+        with mock.patch.object(
+            GenericOCSPView, "get_responder_key_data", autospec=True, return_value=key_data
+        ) as get_key_data:
+            response = self.ocsp_get(self.cert)
+        get_key_data.assert_called_once()
+        self.assertOCSPResponse(response, requested_certificate=self.cert, responder_certificate=ocsp_cert)
+
+    @override_tmpcadir()
+    def test_batch_request(self) -> None:
+        """Test an OCSP request for multiple certificates."""
+        private_key, ocsp_cert = self.generate_ocsp_key(self.ca)
+        revoked = self.load_named_cert("profile-webserver")
+        revoked.revoke(ReasonFlags.key_compromise)
+        serials = [self.cert.pub.loaded.serial_number, revoked.pub.loaded.serial_number, 123]
+        data = self.ocsp_batch_request(self.cert, self.ca, serials, nonce=b"foo")
+
+        url = reverse("django_ca:ocsp-cert-post", kwargs={"serial": self.ca.serial})
+        with self.assertNumQueries(2), self.assertLogs() as logcm:  # one for the CA, one for certificates
+            response = self.client.post(url, data, content_type="application/ocsp-request")
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(logcm.output, [f"WARNING:django_ca.views:7B: {UNKNOWN_CERT_MESSAGE}"])
+        self.assertOCSPBatchResponse(
+            response, [self.cert, revoked, 123], responder_certificate=ocsp_cert, nonce=b"foo"
+        )
+
+    @override_tmpcadir()
+    def test_batch_request_ca_ocsp(self) -> None:
+        """Test an OCSP request for multiple certificate authorities."""
+        private_key, ocsp_cert = self.generate_ocsp_key(self.cas["root"])
+        serials = [self.ca.pub.loaded.serial_number, 123]
+        data = self.ocsp_batch_request(self.ca, self.cas["root"], serials)
+
+        url = reverse("django_ca:ocsp-ca-post", kwargs={"serial": self.cas["root"].serial})
+        with self.assertLogs() as logcm:
+            response = self.client.post(url, data, content_type="application/ocsp-request")
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(logcm.output, [f"WARNING:django_ca.views:7B: {UNKNOWN_CERT_MESSAGE}"])
+        self.assertOCSPBatchResponse(response, [self.ca, 123], responder_certificate=ocsp_cert)
+
+    @override_tmpcadir()
+    def test_batch_request_key_types(self) -> None:
+        """Test OCSP requests for multiple certificates with different private key types."""
+        key_types = (
+            ("dsa", hashes.SHA256, SignatureAlgorithmOID.DSA_WITH_SHA256),
+            ("ec", hashes.SHA256, SignatureAlgorithmOID.ECDSA_WITH_SHA256),
+            ("ed448", None, SignatureAlgorithmOID.ED448),
+            ("ed25519", None, SignatureAlgorithmOID.ED25519),
+        )
+        for name, signature_hash_algorithm, signature_algorithm_oid in key_types:
+            with self.subTest(name=name):
+                ca = self.load_ca(name)
+                private_key, ocsp_cert = self.generate_ocsp_key(ca)
+                cert = self.load_named_cert(f"{name}-cert")
+                data = self.ocsp_batch_request(cert, ca, [cert.pub.loaded.serial_number] * 2)
+
+                url = reverse("django_ca:ocsp-cert-post", kwargs={"serial": ca.serial})
+                response = self.client.post(url, data, content_type="application/ocsp-request")
+                self.assertEqual(response.status_code, HTTPStatus.OK)
+                self.assertOCSPBatchResponse(
+                    response,
+                    [cert, cert],
+                    responder_certificate=ocsp_cert,
+                    signature_hash_algorithm=signature_hash_algorithm,
+                    signature_algorithm_oid=signature_algorithm_oid,
+                )
+
+    @override_tmpcadir()
+    def test_batch_request_with_critical_extension(self) -> None:
+        """Test an OCSP request for multiple certificates with an unknown critical extension."""
+        data = asn1crypto.ocsp.OCSPRequest.load(self.ocsp_batch_request(self.cert, self.ca, [1, 2]))
+        data["tbs_request"]["request_extensions"] = [
+            {"extn_id": "acceptable_responses", "critical": True, "extn_value": ["basic_ocsp_response"]}
+        ]
+        url = reverse("django_ca:ocsp-cert-post", kwargs={"serial": self.ca.serial})
+        response = self.client.post(url, data.dump(force=True), content_type="application/ocsp-request")
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        ocsp_response = ocsp.load_der_ocsp_response(response.content)
+        self.assertEqual(ocsp_response.response_status, ocsp.OCSPResponseStatus.MALFORMED_REQUEST)
+
+    @override_tmpcadir()
+    def test_batch_request_with_bad_request(self) -> None:
+        """Test an OCSP request for multiple certificates that cannot be parsed by asn1crypto."""
+        url = reverse("django_ca:ocsp-cert-post", kwargs={"serial": self.ca.serial})
+        with (
+            self.assertLogs() as logcm,
+            mock.patch("asn1crypto.ocsp.OCSPRequest.load", autospec=True, side_effect=ValueError("foo")),
+        ):
+            response = self.client.post(url, multiple_req, content_type="application/ocsp-request")
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(len(logcm.output), 1)
+        self.assertIn("ValueError: foo", logcm.output[0])
+        ocsp_response = ocsp.load_der_ocsp_response(response.content)
+        self.assertEqual(ocsp_response.response_status, ocsp.OCSPResponseStatus.MALFORMED_REQUEST)
+
+    @override_tmpcadir()
+    def test_batch_request_with_unknown_ca(self) -> None:
+        """Test an OCSP request for multiple certificates for an unknown certificate authority."""
+        url = reverse("django_ca:ocsp-cert-post", kwargs={"serial": "00AA"})
+        with self.assertLogs() as logcm:
+            response = self.client.post(url, multiple_req, content_type="application/ocsp-request")
+        self.assertEqual(logcm.output, ["ERROR:django_ca.views:: Certificate Authority could not be found."])
+        ocsp_response = ocsp.load_der_ocsp_response(response.content)
+        self.assertEqual(ocsp_response.response_status, ocsp.OCSPResponseStatus.INTERNAL_ERROR)
+
+    @override_tmpcadir()
+    def test_batch_request_without_responder_key(self) -> None:
+        """Test an OCSP request for multiple certificates when no responder key was generated."""
+        url = reverse("django_ca:ocsp-cert-post", kwargs={"serial": self.ca.serial})
+        with self.assertLogs() as logcm:
+            response = self.client.post(url, multiple_req, content_type="application/ocsp-request")
+        self.assertEqual(logcm.output, ["ERROR:django_ca.views:Could not read responder key/cert."])
+        ocsp_response = ocsp.load_der_ocsp_response(response.content)
+        self.assertEqual(ocsp_response.response_status, ocsp.OCSPResponseStatus.INTERNAL_ERROR)
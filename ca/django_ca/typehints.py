@@ -432,6 +432,17 @@ class ParsablePolicyConstraints(TypedDict, total=False):
     inhibit_policy_mapping: int
 
 
+class CertificateMetadata(TypedDict):
+    """Metadata of a certificate that is stored in separate database columns."""
+
+    public_key_type: str
+    public_key_size: Optional[int]
+    signature_algorithm: str
+    fingerprint_sha256: str
+    issuer_hash: str
+    subject_alternative_names: str
+
+
 ParsableSubjectKeyIdentifier = Union[str, bytes, x509.SubjectKeyIdentifier]
 
 
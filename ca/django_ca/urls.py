@@ -37,6 +37,14 @@ urlpatterns: list[Union[URLResolver, URLPattern]] = [
     ),
     path("crl/<hex:serial>/", views.CertificateRevocationListView.as_view(), name="crl"),
     path("crl/ca/<hex:serial>/", views.CertificateRevocationListView.as_view(scope="ca"), name="ca-crl"),
+    path(
+        "crl/<hex:serial>/delta/", views.CertificateRevocationListView.as_view(delta=True), name="crl-delta"
+    ),
+    path(
+        "crl/ca/<hex:serial>/delta/",
+        views.CertificateRevocationListView.as_view(scope="ca", delta=True),
+        name="ca-crl-delta",
+    ),
 ]
 
 if ca_settings.CA_ENABLE_REST_API is True:
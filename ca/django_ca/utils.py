@@ -14,6 +14,7 @@
 """Reusable utility functions used throughout django-ca."""
 
 import binascii
+import functools
 import re
 import shlex
 import typing
@@ -21,15 +22,19 @@ import warnings
 from collections.abc import Iterator
 from datetime import datetime, timedelta, timezone as tz
 from ipaddress import ip_address, ip_network
-from typing import Optional, Union
+from typing import Any, Callable, Optional, TypeVar, Union
 
 import idna
 
 import asn1crypto.core
 from cryptography import x509
+from cryptography.hazmat._oid import _OID_NAMES as OID_NAMES
 from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.asymmetric import dsa, ec, ed448, ed25519, rsa
-from cryptography.hazmat.primitives.asymmetric.types import CertificateIssuerPrivateKeyTypes
+from cryptography.hazmat.primitives.asymmetric import dsa, ec, ed448, ed25519, rsa, x448, x25519
+from cryptography.hazmat.primitives.asymmetric.types import (
+    CertificateIssuerPrivateKeyTypes,
+    CertificateIssuerPublicKeyTypes,
+)
 from cryptography.hazmat.primitives.serialization import Encoding
 from cryptography.x509.name import _ASN1Type
 from cryptography.x509.oid import NameOID
@@ -48,6 +53,7 @@ from django_ca.pydantic.validators import (
 )
 from django_ca.typehints import (
     AllowedHashTypes,
+    CertificateMetadata,
     Expires,
     ParsableGeneralName,
     ParsableKeyType,
@@ -61,6 +67,11 @@ GENERAL_NAME_RE = re.compile("^(email|URI|IP|DNS|RID|dirName|otherName):(.*)", f
 #: Regular expression matching certificate serials as hex
 SERIAL_RE = re.compile("^([0-9A-F][0-9A-F]:?)+[0-9A-F][0-9A-F]?$")
 
+LoadedFileTypeVar = TypeVar("LoadedFileTypeVar")
+
+# Per-process cache for files loaded with load_cached_file(), mapping paths to modification time and value.
+_LOADED_FILES: dict[str, tuple[datetime, Any]] = {}
+
 UNSAFE_NAME_CHARS = re.compile(r'[\\/\'"]')
 
 SAN_NAME_MAPPINGS = {
@@ -927,6 +938,59 @@ def parse_key_curve(value: str) -> ec.EllipticCurve:
         raise ValueError(f"{value}: Not a known Elliptic Curve") from ex
 
 
+def get_public_key_type(public_key: CertificateIssuerPublicKeyTypes) -> ParsableKeyType:
+    """Get the type of the given public key as a string, e.g. "RSA" or "Ed448"."""
+    if isinstance(public_key, dsa.DSAPublicKey):
+        return "DSA"
+    if isinstance(public_key, rsa.RSAPublicKey):
+        return "RSA"
+    if isinstance(public_key, ec.EllipticCurvePublicKey):
+        return "EC"
+    if isinstance(public_key, ed25519.Ed25519PublicKey):
+        return "Ed25519"
+    if isinstance(public_key, ed448.Ed448PublicKey):
+        return "Ed448"
+    raise ValueError(f"{public_key}: Unknown key type.")  # pragma: no cover
+
+
+def get_certificate_metadata(certificate: x509.Certificate) -> CertificateMetadata:
+    """Get metadata of the given certificate that is stored in separate database columns.
+
+    The SHA-256 fingerprint and the issuer hash (the SHA-256 hash of the DER-encoded issuer) are returned as
+    upper-case hex values without colons. Subject Alternative Names are formatted with
+    :py:func:`~django_ca.utils.format_general_name` and separated by newlines.
+
+    .. versionadded:: 1.29.0
+    """
+    public_key = certificate.public_key()
+    key_type = ""
+    key_size: Optional[int] = None
+    # certificates might also contain e.g. X25519 keys
+    if not isinstance(public_key, (x25519.X25519PublicKey, x448.X448PublicKey)):
+        key_type = get_public_key_type(public_key)
+    if isinstance(public_key, (dsa.DSAPublicKey, rsa.RSAPublicKey, ec.EllipticCurvePublicKey)):
+        key_size = public_key.key_size
+
+    try:
+        san = certificate.extensions.get_extension_for_class(x509.SubjectAlternativeName).value
+        names = "\n".join(format_general_name(name) for name in san)
+    except x509.ExtensionNotFound:
+        names = ""
+
+    issuer_hash = hashes.Hash(hashes.SHA256())
+    issuer_hash.update(certificate.issuer.public_bytes())
+    signature_algorithm_oid = certificate.signature_algorithm_oid
+
+    return {
+        "public_key_type": key_type,
+        "public_key_size": key_size,
+        "signature_algorithm": OID_NAMES.get(signature_algorithm_oid, signature_algorithm_oid.dotted_string),
+        "fingerprint_sha256": certificate.fingerprint(hashes.SHA256()).hex().upper(),
+        "issuer_hash": issuer_hash.finalize().hex().upper(),
+        "subject_alternative_names": names,
+    }
+
+
 def get_cert_builder(expires: datetime, serial: Optional[int] = None) -> x509.CertificateBuilder:
     """Get a basic X.509 certificate builder object.
 
@@ -996,6 +1060,39 @@ def read_file(path: str) -> bytes:
         stream.close()
 
 
+def load_cached_file(
+    path: str, loader: Callable[[bytes], LoadedFileTypeVar], read: Optional[Callable[[], bytes]] = None
+) -> LoadedFileTypeVar:
+    """Read the file from the given path and pass the contents to `loader`.
+
+    The return value of `loader` is cached in the current process until the modification time of the file
+    changes. If the storage does not support retrieving the modification time of files, the file is read and
+    loaded every time. If `read` is passed, it is called to read the contents of the file instead.
+    """
+    if read is None:
+        read = functools.partial(read_file, path)
+
+    storage = get_storage()
+    try:
+        modified_time = storage.get_modified_time(path)
+    except NotImplementedError:
+        return loader(read())
+
+    cached = _LOADED_FILES.get(path)
+    if cached is not None and cached[0] == modified_time:
+        return typing.cast(LoadedFileTypeVar, cached[1])
+
+    value = loader(read())
+    _LOADED_FILES[path] = (modified_time, value)
+    return value
+
+
+def clear_cached_files(*paths: str) -> None:
+    """Remove the given paths from the cache used by :py:func:`~django_ca.utils.load_cached_file`."""
+    for path in paths:
+        _LOADED_FILES.pop(path, None)
+
+
 def split_str(val: str, sep: str) -> Iterator[str]:
     """Split a character on the given set of characters.
 
@@ -1033,6 +1130,47 @@ def split_str(val: str, sep: str) -> Iterator[str]:
     yield from lex
 
 
-def get_crl_cache_key(serial: str, encoding: Encoding = Encoding.DER, scope: Optional[str] = None) -> str:
-    """Get the cache key for a CRL with the given parameters."""
+def get_crl_cache_key(
+    serial: str, encoding: Encoding = Encoding.DER, scope: Optional[str] = None, delta: bool = False
+) -> str:
+    """Get the cache key for a CRL with the given parameters.
+
+    .. versionchanged:: 1.29.0
+
+       The ``delta`` parameter was added.
+    """
+    if delta is True:
+        return f"delta_crl_{serial}_{encoding.name}_{scope}"
     return f"crl_{serial}_{encoding.name}_{scope}"
+
+
+def get_crl_storage_path(
+    serial: str, encoding: Encoding = Encoding.DER, scope: Optional[str] = None, delta: bool = False
+) -> str:
+    """Get the path in the file storage for a CRL with the given parameters.
+
+    .. versionadded:: 1.29.0
+    """
+    name = scope or "all"
+    if delta is True:
+        name += "-delta"
+    extension = "pem" if encoding == Encoding.PEM else "der"
+    return f"crl/{serial}/{name}.{extension}"
+
+
+def get_acme_directory_cache_key(serial: Optional[str] = None) -> str:
+    """Get the cache key for ACME directories of the given CA (or the default CA, if `serial` is ``None``)."""
+    if serial is None:
+        return "acme_directory_default"
+    return f"acme_directory_{serial}"
+
+
+def get_ocsp_response_cache_key(ca_serial: str, serial: str, ca_ocsp: bool = False) -> str:
+    """Get the cache key for pre-signed OCSP responses for the given certificate."""
+    scope = "ca" if ca_ocsp is True else "cert"
+    return f"ocsp_{ca_serial}_{serial}_{scope}"
+
+
+def get_acme_order_validation_cache_key(order_pk: int) -> str:
+    """Get the cache key used to schedule only one validation task per ACME order at a time."""
+    return f"acme_validate_order_{order_pk}"
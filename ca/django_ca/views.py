@@ -21,16 +21,22 @@
 
 import base64
 import binascii
+import hashlib
 import logging
 import typing
+from collections.abc import Iterable
 from datetime import datetime, timedelta, timezone as tz
 from http import HTTPStatus
 from typing import Any, Optional, Union
 
 from pydantic import BaseModel
 
+import asn1crypto.core
+import asn1crypto.ocsp
+import asn1crypto.x509
 from cryptography import x509
-from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed448, ed25519, padding, rsa
 from cryptography.hazmat.primitives.asymmetric.types import CertificateIssuerPrivateKeyTypes
 from cryptography.hazmat.primitives.serialization import Encoding
 from cryptography.x509 import (
@@ -43,15 +49,29 @@ from cryptography.x509 import (
 
 from django.core.cache import cache
 from django.core.exceptions import ImproperlyConfigured
-from django.http import HttpRequest, HttpResponse, HttpResponseServerError
+from django.http import HttpRequest, HttpResponse, HttpResponseNotFound, HttpResponseServerError
+from django.utils.cache import get_conditional_response
 from django.utils.decorators import method_decorator
+from django.utils.functional import cached_property
+from django.utils.http import http_date, quote_etag
 from django.views.decorators.csrf import csrf_exempt
 from django.views.generic.base import View
 from django.views.generic.detail import SingleObjectMixin
 
-from django_ca import constants
+from django_ca import ca_settings, constants
+from django_ca.deprecation import crl_last_update, crl_next_update, not_valid_before
 from django_ca.models import Certificate, CertificateAuthority
-from django_ca.utils import SERIAL_RE, get_crl_cache_key, int_to_hex, parse_encoding, read_file
+from django_ca.utils import (
+    SERIAL_RE,
+    get_crl_cache_key,
+    get_crl_storage_path,
+    get_ocsp_response_cache_key,
+    get_storage,
+    int_to_hex,
+    load_cached_file,
+    parse_encoding,
+    read_file,
+)
 
 log = logging.getLogger(__name__)
 
@@ -63,6 +83,125 @@ else:
     SingleObjectMixinBase = SingleObjectMixin
 
 
+def _load_crl(crl: bytes) -> x509.CertificateRevocationList:
+    """Load a CRL in either PEM or DER format."""
+    if crl.startswith(b"-----BEGIN"):
+        return x509.load_pem_x509_crl(crl)
+    return x509.load_der_x509_crl(crl)
+
+
+def _get_crl_updates(crl: bytes, timeout: int) -> tuple[datetime, Optional[datetime]]:
+    """Get the thisUpdate and nextUpdate fields of a CRL.
+
+    The values are cached by the hash of the CRL, so that the CRL does not have to be parsed on every request.
+    """
+    cache_key = f"crl_updates_{hashlib.sha256(crl).hexdigest()}"
+    updates: Optional[tuple[datetime, Optional[datetime]]] = cache.get(cache_key)
+    if updates is None:
+        parsed_crl = _load_crl(crl)
+        updates = (crl_last_update(parsed_crl), crl_next_update(parsed_crl))
+        cache.set(cache_key, updates, timeout)
+    return updates
+
+
+def _conditional_response(
+    request: HttpRequest, response: HttpResponse, last_modified: datetime, expires: datetime
+) -> HttpResponse:
+    """Add caching headers to the response and return "304 Not Modified" if the client has a fresh copy.
+
+    The headers are chosen as recommended by RFC 5019, section 6.2.
+    """
+    max_age = max(int((expires - datetime.now(tz=tz.utc)).total_seconds()), 0)
+
+    # RFC 5019 recommends the SHA-1 hash of the response as ETag
+    etag = quote_etag(hashlib.sha1(response.content).hexdigest().upper())
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified.timestamp())
+    response["Expires"] = http_date(expires.timestamp())
+    response["Cache-Control"] = f"max-age={max_age}, public, no-transform, must-revalidate"
+
+    return typing.cast(
+        HttpResponse,
+        get_conditional_response(
+            request, etag=etag, last_modified=int(last_modified.timestamp()), response=response
+        ),
+    )
+
+
+def _sign_ocsp_response(
+    key: CertificateIssuerPrivateKeyTypes, algorithm: Optional[hashes.HashAlgorithm], data: bytes
+) -> tuple[dict[str, Any], bytes]:
+    """Sign OCSP response data, return the signature algorithm (as used by asn1crypto) and the signature."""
+    if isinstance(key, ed25519.Ed25519PrivateKey):
+        return {"algorithm": "ed25519"}, key.sign(data)
+    if isinstance(key, ed448.Ed448PrivateKey):
+        return {"algorithm": "ed448"}, key.sign(data)
+
+    # All other key types require a hash algorithm
+    algorithm = typing.cast(hashes.HashAlgorithm, algorithm)
+    if isinstance(key, rsa.RSAPrivateKey):
+        signature = key.sign(data, padding.PKCS1v15(), algorithm)
+        return {"algorithm": f"{algorithm.name}_rsa", "parameters": asn1crypto.core.Null()}, signature
+    if isinstance(key, ec.EllipticCurvePrivateKey):
+        return {"algorithm": f"{algorithm.name}_ecdsa"}, key.sign(data, ec.ECDSA(algorithm))
+    return {"algorithm": f"{algorithm.name}_dsa"}, key.sign(data, algorithm)  # only DSA keys are left
+
+
+def _get_asn1_cert_status(
+    cert: Optional[Union[Certificate, CertificateAuthority]],
+) -> "asn1crypto.ocsp.CertStatus":
+    """Get the asn1crypto status of a certificate for an OCSP response (``None`` for unknown certificates)."""
+    if cert is None:
+        return asn1crypto.ocsp.CertStatus(name="unknown", value=asn1crypto.core.Null())
+    if cert.revoked:
+        revocation_time = typing.cast(datetime, cert.get_revocation_time())
+        revocation_reason = typing.cast(x509.ReasonFlags, cert.get_revocation_reason())
+        revoked_info = {
+            "revocation_time": revocation_time.replace(tzinfo=tz.utc),
+            "revocation_reason": revocation_reason.name,
+        }
+        return asn1crypto.ocsp.CertStatus(name="revoked", value=revoked_info)
+    return asn1crypto.ocsp.CertStatus(name="good", value=asn1crypto.core.Null())
+
+
+def _build_asn1_ocsp_response(
+    responder_key: CertificateIssuerPrivateKeyTypes,
+    responder_cert: x509.Certificate,
+    responses: list[dict[str, Any]],
+    produced_at: datetime,
+    nonce: Optional[bytes],
+) -> bytes:
+    """Build and sign a DER-encoded OCSP response with the given single responses using asn1crypto."""
+    asn1_responder_cert = asn1crypto.x509.Certificate.load(responder_cert.public_bytes(Encoding.DER))
+    response_data: dict[str, Any] = {
+        "responder_id": asn1crypto.ocsp.ResponderId(name="by_key", value=asn1_responder_cert.public_key.sha1),
+        "produced_at": produced_at,
+        "responses": responses,
+    }
+    if nonce is not None:
+        response_data["response_extensions"] = [{"extn_id": "nonce", "extn_value": nonce}]
+    tbs_response_data = asn1crypto.ocsp.ResponseData(response_data)
+
+    signature_algorithm, signature = _sign_ocsp_response(
+        responder_key, responder_cert.signature_hash_algorithm, tbs_response_data.dump()
+    )
+    basic_response = asn1crypto.ocsp.BasicOCSPResponse(
+        {
+            "tbs_response_data": tbs_response_data,
+            "signature_algorithm": signature_algorithm,
+            "signature": signature,
+            "certs": [asn1_responder_cert],
+        }
+    )
+    response = asn1crypto.ocsp.OCSPResponse(
+        {
+            "response_status": "successful",
+            "response_bytes": {"response_type": "basic_ocsp_response", "response": basic_response},
+        }
+    )
+    return typing.cast(bytes, response.dump())
+
+
 class CertificateRevocationListView(View, SingleObjectMixinBase):
     """Generic view that provides Certificate Revocation Lists (CRLs)."""
 
@@ -92,6 +231,12 @@ class CertificateRevocationListView(View, SingleObjectMixinBase):
     include_issuing_distribution_point: Optional[bool] = None
     """Boolean flag to force inclusion/exclusion of IssuingDistributionPoint extension."""
 
+    delta = False
+    """Set to ``True`` to provide a delta CRL instead of a complete CRL.
+
+    Note that a delta CRL can only be generated after a complete CRL with the same scope was generated.
+    """
+
     def get_key_backend_options(self, ca: CertificateAuthority) -> BaseModel:
         """Method to get the key backend options to access the private key.
 
@@ -100,15 +245,37 @@ class CertificateRevocationListView(View, SingleObjectMixinBase):
         """
         return ca.key_backend.get_use_private_key_options(ca, {"password": self.password})
 
+    def get_stored_crl(self, serial: str, encoding: Encoding, cache_key: str) -> Optional[bytes]:
+        """Get a CRL stored by :py:func:`~django_ca.models.CertificateAuthority.cache_crls`.
+
+        Returns ``None`` if no CRL is stored or if the stored CRL has already expired. Otherwise, the CRL is
+        added to the cache again until it expires.
+        """
+        path = get_crl_storage_path(serial, encoding=encoding, scope=self.scope, delta=self.delta)
+        if get_storage().exists(path) is False:
+            return None
+
+        crl = read_file(path)
+        next_update = _get_crl_updates(crl, self.expires)[1]
+        now = datetime.now(tz=tz.utc)
+        if next_update is None or next_update <= now:
+            return None
+
+        cache.set(cache_key, crl, min(int((next_update - now).total_seconds()), self.expires))
+        return crl
+
     def get(self, request: HttpRequest, serial: str) -> HttpResponse:
         # pylint: disable=missing-function-docstring; standard Django view function
         encoding = parse_encoding(request.GET.get("encoding", self.type))
 
         ca = self.get_object()
 
-        cache_key = get_crl_cache_key(serial, encoding=encoding, scope=self.scope)
+        cache_key = get_crl_cache_key(serial, encoding=encoding, scope=self.scope, delta=self.delta)
 
         crl = cache.get(cache_key)
+        if crl is None and ca_settings.CA_ENABLE_CRL_STORAGE is True:
+            crl = self.get_stored_crl(serial, encoding, cache_key)
+
         if crl is None:
             # Catch this case early so that we can give a better error message
             if self.include_issuing_distribution_point is True and ca.parent is None and self.scope is None:
@@ -116,6 +283,11 @@ class CertificateRevocationListView(View, SingleObjectMixinBase):
                     "Cannot add IssuingDistributionPoint extension to CRLs with no scope for root CAs."
                 )
 
+            # A delta CRL can only be generated once a complete CRL (the "base CRL") exists.
+            if self.delta is True and not ca.has_base_crl(scope=self.scope):
+                msg = "No delta CRL available before a complete CRL was generated."
+                return HttpResponseNotFound(msg, content_type="text/plain")
+
             encoding = parse_encoding(self.type)
             key_backend_options = self.get_key_backend_options(ca)
             crl = ca.get_crl(
@@ -123,6 +295,7 @@ class CertificateRevocationListView(View, SingleObjectMixinBase):
                 expires=self.expires,
                 scope=self.scope,
                 include_issuing_distribution_point=self.include_issuing_distribution_point,
+                delta=self.delta,
             )
             crl = crl.public_bytes(encoding)
             cache.set(cache_key, crl, self.expires)
@@ -137,7 +310,12 @@ class CertificateRevocationListView(View, SingleObjectMixinBase):
                 # DER/PEM are all known encoding types, so this shouldn't happen
                 return HttpResponseServerError()
 
-        return HttpResponse(crl, content_type=content_type)
+        # Add caching headers based on the thisUpdate and nextUpdate fields of the CRL
+        last_update, next_update = _get_crl_updates(crl, self.expires)
+        if next_update is None:
+            next_update = last_update + timedelta(seconds=self.expires)
+        response = HttpResponse(crl, content_type=content_type)
+        return _conditional_response(request, response, last_update, next_update)
 
 
 @method_decorator(csrf_exempt, name="dispatch")
@@ -176,11 +354,13 @@ class OCSPView(View):
             return self.malformed_request()
 
         try:
-            return self.process_ocsp_request(decoded_data)
+            response = self.process_ocsp_request(decoded_data)
         except Exception as e:  # pylint: disable=broad-except; we really need to catch everything here
             log.exception(e)
             return self.fail()
 
+        return self.conditional_response(request, response)
+
     def post(self, request: HttpRequest) -> HttpResponse:
         # pylint: disable=missing-function-docstring; standard Django view function
         try:
@@ -189,16 +369,49 @@ class OCSPView(View):
             log.exception(e)
             return self.fail()
 
+    def conditional_response(self, request: HttpRequest, response: HttpResponse) -> HttpResponse:
+        """Add caching headers to a response for an OCSP request received via HTTP GET.
+
+        Headers are only added to successful responses that do not include a nonce. They are based on the
+        thisUpdate and nextUpdate fields of the response (see RFC 5019, section 6.2).
+        """
+        ocsp_response = asn1crypto.ocsp.OCSPResponse.load(response.content)
+        if ocsp_response["response_status"].native != "successful" or ocsp_response.nonce_value is not None:
+            return response
+
+        single_responses = ocsp_response.basic_ocsp_response["tbs_response_data"]["responses"]
+        this_update = max(single_response["this_update"].native for single_response in single_responses)
+        next_update = min(single_response["next_update"].native for single_response in single_responses)
+        return _conditional_response(request, response, this_update, next_update)
+
     def fail(self, status: ocsp.OCSPResponseStatus = ocsp.OCSPResponseStatus.INTERNAL_ERROR) -> HttpResponse:
         """Generic method to return a failure response."""
         return self.http_response(
             ocsp.OCSPResponseBuilder.build_unsuccessful(status).public_bytes(Encoding.DER)
         )
 
+    def get_cached_response(self, ocsp_req: ocsp.OCSPRequest) -> Optional[bytes]:
+        """Get a pre-signed response for the given request.
+
+        This function is only called for requests that do not include a nonce. The default implementation
+        never returns a cached response.
+        """
+        # pylint: disable=unused-argument; hook for subclasses
+        return None
+
+    def set_cached_response(self, ocsp_req: ocsp.OCSPRequest, response: bytes) -> None:
+        """Store a signed response so that it can be served again for later requests.
+
+        This function is only called for requests that do not include a nonce. The default implementation
+        does not cache anything.
+        """
+
     def get_responder_key(self) -> CertificateIssuerPrivateKeyTypes:
         """Get the private key used to sign OCSP responses."""
-        key = self.get_responder_key_data()
+        return self.load_responder_key(self.get_responder_key_data())
 
+    def load_responder_key(self, key: bytes) -> CertificateIssuerPrivateKeyTypes:
+        """Load the private key used to sign OCSP responses from the given data."""
         try:
             loaded_key = serialization.load_der_private_key(key, None)
         except ValueError:
@@ -248,6 +461,22 @@ class OCSPView(View):
 
         return Certificate.objects.filter(ca=ca).get(serial=serial)
 
+    def get_certs(
+        self, ca: CertificateAuthority, serials: Iterable[str]
+    ) -> dict[str, Union[Certificate, CertificateAuthority]]:
+        """Get all certificates requested in an OCSP request for multiple certificates.
+
+        Unlike :py:func:`~django_ca.views.OCSPView.get_cert`, this function retrieves all certificates in a
+        single query and does not raise an exception for unknown certificates.
+        """
+        fields = ("serial", "revoked", "revoked_date", "revoked_reason", "compromised")
+        certs: Iterable[Union[Certificate, CertificateAuthority]]
+        if self.ca_ocsp is True:
+            certs = CertificateAuthority.objects.filter(parent=ca, serial__in=serials).only(*fields)
+        else:
+            certs = Certificate.objects.filter(ca=ca, serial__in=serials).only(*fields)
+        return {cert.serial: cert for cert in certs}
+
     def get_expires(self, now: datetime) -> datetime:
         """Get the timestamp when the OCSP response expires."""
         return now + timedelta(seconds=self.expires)
@@ -260,10 +489,66 @@ class OCSPView(View):
         """Get a response for a malformed request."""
         return self.fail(ocsp.OCSPResponseStatus.MALFORMED_REQUEST)
 
-    def process_ocsp_request(self, data: bytes) -> HttpResponse:
+    def process_ocsp_batch_request(self, data: bytes) -> HttpResponse:
+        """Process OCSP request data containing requests for multiple certificates.
+
+        cryptography only supports OCSP requests (and responses) for a single certificate, so the request is
+        parsed and the response is built using asn1crypto instead. All certificates are loaded in a single
+        database query and the response is signed only once.
+        """
+        try:
+            ocsp_req = asn1crypto.ocsp.OCSPRequest.load(data)
+            cert_ids = [request["req_cert"] for request in ocsp_req["tbs_request"]["request_list"]]
+            serials = [int_to_hex(cert_id["serial_number"].native) for cert_id in cert_ids]
+            critical_extensions = ocsp_req.critical_extensions
+            nonce = ocsp_req.nonce_value
+        except Exception as e:  # pylint: disable=broad-except; we really need to catch everything here
+            log.exception(e)
+            return self.malformed_request()
+
+        # Fail if there are any critical extensions that we do not understand
+        if critical_extensions - {"nonce"}:
+            return self.malformed_request()
+
+        try:
+            ca = self.get_ca()
+        except CertificateAuthority.DoesNotExist:
+            log.error("%s: Certificate Authority could not be found.", self.ca)
+            return self.fail()
+
+        certs = self.get_certs(ca, serials)
+
+        # get key/cert for OCSP responder
+        try:
+            responder_key = self.get_responder_key()
+            responder_cert = self.get_responder_cert()
+        except Exception:  # pylint: disable=broad-except; we really need to catch everything here
+            log.error("Could not read responder key/cert.")
+            return self.fail()
+
+        now = datetime.now(tz=tz.utc).replace(microsecond=0)
+        expires = self.get_expires(now)
+        responses = []
+        for cert_id, serial in zip(cert_ids, serials):
+            cert = certs.get(serial)
+            if cert is None:
+                log.warning("%s: OCSP request for unknown cert received.", serial)
+            cert_status = _get_asn1_cert_status(cert)
+            responses.append(
+                {"cert_id": cert_id, "cert_status": cert_status, "this_update": now, "next_update": expires}
+            )
+
+        return self.http_response(
+            _build_asn1_ocsp_response(responder_key, responder_cert, responses, now, nonce)
+        )
+
+    def process_ocsp_request(self, data: bytes) -> HttpResponse:  # noqa: PLR0911
         """Process OCSP request data."""
         try:
             ocsp_req = ocsp.load_der_ocsp_request(data)
+        except NotImplementedError:
+            # cryptography raises NotImplementedError for requests for multiple certificates
+            return self.process_ocsp_batch_request(data)
         except Exception as e:  # pylint: disable=broad-except; we really need to catch everything here
             log.exception(e)
             return self.malformed_request()
@@ -274,6 +559,16 @@ class OCSPView(View):
                 # It seems impossible to get cryptography to create such a request, so it's not tested
                 return self.malformed_request()
 
+        # Requests without a nonce can be served from pre-signed responses
+        nonce: Optional[x509.Extension[OCSPNonce]] = None
+        try:
+            nonce = ocsp_req.extensions.get_extension_for_class(OCSPNonce)
+        except ExtensionNotFound:
+            # pylint: disable-next=assignment-from-none  # only the base implementation always returns None
+            cached_response = self.get_cached_response(ocsp_req)
+            if cached_response is not None:
+                return self.http_response(cached_response)
+
         # Get CA and certificate
         try:
             ca = self.get_ca()
@@ -328,19 +623,20 @@ class OCSPView(View):
         builder = builder.certificates([responder_cert])
 
         # Add OCSP nonce if present
-        try:
-            nonce = ocsp_req.extensions.get_extension_for_class(OCSPNonce)
+        if nonce is not None:
             builder = builder.add_extension(nonce.value, critical=nonce.critical)
-        except ExtensionNotFound:
-            pass
 
         # The hash algorithm may be different from the signature hash algorithm of the responder certificate,
         # but must be None for Ed448/Ed25519 certificates. Since delegate certificates are ephemeral anyway,
         # configuring the hash algorithm is not supported, instead the user is expected to generate new keys
         # with a different private key type or hash algorithm if desired.
         response = builder.sign(responder_key, responder_cert.signature_hash_algorithm)
+        response_bytes = response.public_bytes(Encoding.DER)
+
+        if nonce is None:
+            self.set_cached_response(ocsp_req, response_bytes)
 
-        return self.http_response(response.public_bytes(Encoding.DER))
+        return self.http_response(response_bytes)
 
 
 @method_decorator(csrf_exempt, name="dispatch")
@@ -350,9 +646,12 @@ class GenericOCSPView(OCSPView):
     This view assumes that ``ocsp/$ca_serial.(key|pem)`` point to the private/public key of a responder
     certificate as created by :py:class:`~django_ca.tasks.generate_ocsp_keys`. The ``serial`` URL keyword
     argument must be the serial for this CA.
+
+    If :ref:`settings-ca-enable-ocsp-response-cache` is set, signed responses for requests without a nonce are
+    stored in the cache and served without any database queries or signing operations.
     """
 
-    auto_ca: CertificateAuthority
+    ca_serial: str
 
     # NOINSPECTION NOTE: It's okay to be more specific here
     # noinspection PyMethodOverriding
@@ -366,15 +665,53 @@ class GenericOCSPView(OCSPView):
         if not isinstance(serial, str):  # pragma: no cover
             raise ImproperlyConfigured("View expects a str for a serial")
 
-        self.auto_ca = CertificateAuthority.objects.get(serial=serial)
+        self.ca_serial = serial
         return super().dispatch(request, **kwargs)
 
+    @cached_property
+    def auto_ca(self) -> CertificateAuthority:
+        """The certificate authority named in the URL (only loaded when the response is not cached)."""
+        return CertificateAuthority.objects.get(serial=self.ca_serial)
+
     def get_ca(self) -> CertificateAuthority:
         return self.auto_ca
 
+    def get_response_cache_key(self, ocsp_req: ocsp.OCSPRequest) -> str:
+        """Get the cache key for pre-signed responses for the given request."""
+        return get_ocsp_response_cache_key(
+            self.ca_serial, int_to_hex(ocsp_req.serial_number), ca_ocsp=self.ca_ocsp
+        )
+
+    def get_cached_response(self, ocsp_req: ocsp.OCSPRequest) -> Optional[bytes]:
+        if ca_settings.CA_ENABLE_OCSP_RESPONSE_CACHE is False:
+            return None
+
+        # Responses are cached per hash algorithm, as it must match the algorithm used in the request.
+        cached: dict[str, bytes] = cache.get(self.get_response_cache_key(ocsp_req), {})
+        return cached.get(ocsp_req.hash_algorithm.name)
+
+    def set_cached_response(self, ocsp_req: ocsp.OCSPRequest, response: bytes) -> None:
+        if ca_settings.CA_ENABLE_OCSP_RESPONSE_CACHE is False:
+            return
+
+        # Cache responses for half of their validity, so that clients always receive a response that is
+        # still valid for a reasonable amount of time.
+        timeout = self.auto_ca.ocsp_response_validity // 2
+        cache_key = self.get_response_cache_key(ocsp_req)
+        cached: dict[str, bytes] = cache.get(cache_key, {})
+        cached[ocsp_req.hash_algorithm.name] = response
+        cache.set(cache_key, cached, timeout)
+
     def get_expires(self, now: datetime) -> datetime:
         return now + timedelta(seconds=self.auto_ca.ocsp_response_validity)
 
+    def get_responder_key(self) -> CertificateIssuerPrivateKeyTypes:
+        # The loaded key is cached in the current process until the file is modified.
+        serial = self.auto_ca.serial.replace(":", "")
+        return load_cached_file(
+            f"ocsp/{serial}.key", self.load_responder_key, read=self.get_responder_key_data
+        )
+
     def get_responder_key_data(self) -> bytes:
         serial = self.auto_ca.serial.replace(":", "")
         return read_file(f"ocsp/{serial}.key")
@@ -390,7 +727,14 @@ class GenericCAIssuersView(View):
     :py:class:`~cg:cryptography.x509.AuthorityInformationAccess` extension.
     """
 
+    expires = 86400
+    """Time in seconds that clients may cache the certificate. The default is one day."""
+
     def get(self, request: HttpRequest, serial: str) -> HttpResponse:
         # pylint: disable=missing-function-docstring; standard Django view function
         ca = CertificateAuthority.objects.get(serial=serial)
-        return HttpResponse(ca.pub.der, content_type="application/pkix-cert")
+        response = HttpResponse(ca.pub.der, content_type="application/pkix-cert")
+
+        # The certificate of a CA never changes, so it was last modified when it became valid.
+        expires = datetime.now(tz=tz.utc) + timedelta(seconds=self.expires)
+        return _conditional_response(request, response, not_valid_before(ca.pub.loaded), expires)
@@ -0,0 +1,384 @@
+# This file is part of django-ca (https://github.com/mathiasertl/django-ca).
+#
+# django-ca is free software: you can redistribute it and/or modify it under the terms of the GNU General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# django-ca is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the
+# implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License
+# for more details.
+#
+# You should have received a copy of the GNU General Public License along with django-ca. If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""The acme-benchmark subcommand measures the throughput of the ACMEv2 interface."""
+
+import argparse
+import json
+import math
+import os
+import sys
+import tempfile
+import threading
+import time
+import typing
+from collections import defaultdict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from http import HTTPStatus
+from typing import Any, Optional, Union
+from unittest import mock
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+
+from devscripts import config
+from devscripts.commands import CommandError, DevCommand
+from devscripts.out import bold, info, ok
+
+if typing.TYPE_CHECKING:
+    import josepy as jose
+
+    from django_ca.models import AcmeChallenge
+
+#: Hostname used for all requests. ACME account URLs must be valid URLs, so "testserver" cannot be used.
+HOSTNAME = "acme.example.com"
+
+#: Endpoints in the order in which they are used in a complete ACMEv2 flow.
+ENDPOINTS = (
+    "new-nonce",
+    "new-account",
+    "new-order",
+    "authorization",
+    "challenge",
+    "order",
+    "finalize",
+    "certificate",
+)
+
+
+class Measurements:
+    """Thread-safe collection of latencies and query counts for every endpoint."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.queries: dict[str, list[int]] = defaultdict(list)
+
+    def add(self, endpoint: str, latency: float, queries: int) -> None:
+        """Add a single measurement."""
+        with self.lock:
+            self.latencies[endpoint].append(latency)
+            self.queries[endpoint].append(queries)
+
+
+def percentile(values: list[float], percent: int) -> float:
+    """Get the given percentile of `values` using the nearest-rank method."""
+    ordered = sorted(values)
+    return ordered[max(math.ceil(len(ordered) * percent / 100) - 1, 0)]
+
+
+class AcmeBenchmarkClient:
+    """A minimal ACMEv2 client using the Django test client.
+
+    Every client uses its own thread, account and account key.
+    """
+
+    def __init__(self, ca_serial: str, index: int, measurements: Measurements) -> None:
+        # pylint: disable=import-outside-toplevel  # Django is set up in Command.handle()
+        import josepy as jose
+
+        from django.test import Client
+
+        # pylint: enable=import-outside-toplevel
+
+        self.jose = jose
+        self.ca_serial = ca_serial
+        self.index = index
+        self.measurements = measurements
+        self.client: Client = Client(SERVER_NAME=HOSTNAME)
+        self.kid: Optional[str] = None
+        self.nonce: Optional[bytes] = None
+
+        # Generate keys before any requests are timed
+        self.account_key = jose.jwk.JWKRSA(
+            key=jose.util.ComparableRSAKey(rsa.generate_private_key(public_exponent=65537, key_size=2048))
+        )
+        self.csr_key = ec.generate_private_key(ec.SECP256R1())
+
+    def url(self, name: str, **kwargs: str) -> str:
+        """Get the absolute URL for the given view."""
+        from django.urls import reverse  # pylint: disable=import-outside-toplevel  # see __init__()
+
+        path = reverse(f"django_ca:acme-{name}", kwargs={"serial": self.ca_serial, **kwargs})
+        return f"http://{HOSTNAME}{path}"
+
+    def request(self, endpoint: str, method: str, url: str, expected_status: int, **kwargs: Any) -> Any:
+        """Send a request to the server and record its latency and the number of database queries."""
+        # pylint: disable=import-outside-toplevel  # see __init__()
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        # pylint: enable=import-outside-toplevel
+
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            response = getattr(self.client, method)(url, **kwargs)
+            latency = time.perf_counter() - start
+        self.measurements.add(endpoint, latency, len(queries))
+
+        if response.status_code != expected_status:
+            raise CommandError(
+                f"{endpoint}: {url}: Received HTTP status code {response.status_code}: "
+                f"{response.content.decode('utf-8')}"
+            )
+        if "replay-nonce" in response:
+            self.nonce = self.jose.json_util.decode_b64jose(response["replay-nonce"])
+        return response
+
+    def post(
+        self,
+        endpoint: str,
+        url: str,
+        message: Union["jose.json_util.JSONObjectWithFields", bytes] = b"",
+        expected_status: int = HTTPStatus.OK,
+    ) -> Any:
+        """Send a JWS-signed request (POST or POST-as-GET) to the server."""
+        import acme.jws  # pylint: disable=import-outside-toplevel  # see __init__()
+
+        if self.nonce is None:
+            self.request("new-nonce", "head", self.url("new-nonce"), HTTPStatus.OK)
+
+        if isinstance(message, bytes):
+            payload = message
+        else:
+            payload = json.dumps(message.to_json()).encode("utf-8")
+
+        # RFC 8555, section 6.2: "jwk" is used for new-account requests, "kid" for all others. acme includes
+        # the "jwk" field if (and only if) no "kid" is passed.
+        jws = acme.jws.JWS.sign(
+            payload, self.account_key, self.jose.jwa.RS256, nonce=self.nonce, url=url, kid=self.kid
+        )
+        self.nonce = None  # the nonce is used now
+        return self.request(
+            endpoint,
+            "post",
+            url,
+            expected_status,
+            data=json.dumps(jws.to_json()),
+            content_type="application/jose+json",
+        )
+
+    def register(self) -> None:
+        """Create a new account."""
+        import acme.messages  # pylint: disable=import-outside-toplevel  # see __init__()
+
+        message = acme.messages.Registration(
+            contact=(f"mailto:client-{self.index}@example.com",), terms_of_service_agreed=True
+        )
+        response = self.post("new-account", self.url("new-account"), message, HTTPStatus.CREATED)
+        self.kid = response["Location"]
+
+    def issue(self, names: list[str]) -> None:
+        """Go through a complete ACMEv2 flow to issue a certificate for the given names."""
+        # pylint: disable=import-outside-toplevel  # see __init__()
+        import acme.messages
+
+        from OpenSSL.crypto import X509Req
+
+        # pylint: enable=import-outside-toplevel
+
+        identifiers = tuple(
+            acme.messages.Identifier(typ=acme.messages.IDENTIFIER_FQDN, value=name) for name in names
+        )
+        message = acme.messages.NewOrder(identifiers=identifiers)
+        response = self.post("new-order", self.url("new-order"), message, HTTPStatus.CREATED)
+        order_url = response["Location"]
+        order = response.json()
+        finalize_url = order["finalize"]
+
+        for authorization_url in order["authorizations"]:
+            authorization = self.post("authorization", authorization_url).json()
+            challenge = next(chall for chall in authorization["challenges"] if chall["type"] == "http-01")
+            self.post("challenge", challenge["url"], b"{}")
+
+        # Challenges are validated synchronously (before the response is sent), so the order is ready now.
+        order = self.post("order", order_url).json()
+        if order["status"] != "ready":
+            raise CommandError(f"{order_url}: Order has status {order['status']} (expected: ready).")
+
+        # NOTE: certbot CSRs have an empty subject
+        subject_alternative_name = x509.SubjectAlternativeName([x509.DNSName(name) for name in names])
+        csr = (
+            x509.CertificateSigningRequestBuilder()
+            .subject_name(x509.Name([]))
+            .add_extension(subject_alternative_name, critical=False)
+            .sign(self.csr_key, hashes.SHA256())
+        )
+        csr_message = acme.messages.CertificateRequest(
+            csr=self.jose.util.ComparableX509(X509Req.from_cryptography(csr))
+        )
+        self.post("finalize", finalize_url, csr_message)
+
+        # The certificate is issued synchronously as well, so the order is now valid.
+        order = self.post("order", order_url).json()
+        if order["status"] != "valid":
+            raise CommandError(f"{order_url}: Order has status {order['status']} (expected: valid).")
+        self.post("certificate", order["certificate"])
+
+    def run(self, orders: int, names_per_order: int) -> None:
+        """Register an account and issue `orders` certificates."""
+        from django.db import connection  # pylint: disable=import-outside-toplevel  # see __init__()
+
+        try:
+            self.register()
+            for order in range(orders):
+                domain = f"order-{order}.client-{self.index}.example.com"
+                self.issue([f"name-{i}.{domain}" for i in range(names_per_order)])
+        finally:
+            connection.close()  # close the database connection used by this thread
+
+
+async def validate_challenges(challenges: Iterable["AcmeChallenge"], **kwargs: Any) -> dict[int, bool]:
+    """Stub for :py:func:`~django_ca.acme.validation.validate_challenges` where all challenges are valid."""
+    return {challenge.pk: True for challenge in challenges}
+
+
+class Command(DevCommand):
+    """Class implementing the ``dev.py acme-benchmark`` command."""
+
+    help_text = "Benchmark issuing certificates via ACMEv2."
+    description = (
+        "Run complete ACMEv2 flows (new-account, new-order, authorization, challenge, finalize, certificate) "
+        "using the Django test client and report latency percentiles and database queries per endpoint as "
+        "well as issuance throughput. Challenge validation is stubbed, so no DNS or HTTP requests are "
+        "made. The benchmark creates a temporary database using the database configured in your settings "
+        "(like when running the test suite). Use PostgreSQL for meaningful results with more than one client."
+    )
+
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        parser.add_argument(
+            "-c",
+            "--clients",
+            type=int,
+            default=1,
+            metavar="N",
+            help="Number of concurrent clients, each with its own account (default: %(default)s).",
+        )
+        parser.add_argument(
+            "-o",
+            "--orders",
+            type=int,
+            default=10,
+            metavar="N",
+            help="Number of certificates issued by every client (default: %(default)s).",
+        )
+        parser.add_argument(
+            "-n",
+            "--names",
+            type=int,
+            default=1,
+            metavar="N",
+            help="Number of DNS names in every certificate (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--validate-orders",
+            action="store_true",
+            default=False,
+            help="Validate challenges per order (see CA_ACME_VALIDATE_ORDERS).",
+        )
+
+    def output_results(self, measurements: Measurements, certificates: int, duration: float) -> None:
+        """Output benchmark results."""
+        print(f"{'Endpoint':<16}{'requests':>10}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}{'queries':>10}")
+        for endpoint in ENDPOINTS:
+            latencies = measurements.latencies[endpoint]
+            if not latencies:
+                continue
+            queries = measurements.queries[endpoint]
+            values = [percentile(latencies, percent) * 1000 for percent in (50, 90, 99, 100)]
+            print(
+                f"{endpoint:<16}{len(latencies):>10}",
+                "".join(f"{value:>8.1f}ms" for value in values),
+                f"{sum(queries) / len(queries):>10.1f}",
+                sep="",
+            )
+        print("")
+        print("Latencies are in milliseconds, queries is the average number of database queries per request.")
+        ok(
+            f"Issued {certificates} certificates in {duration:.2f} seconds "
+            f"({certificates / duration:.2f} certificates/second)."
+        )
+
+    def handle(self, args: argparse.Namespace) -> None:
+        if args.clients < 1 or args.orders < 1 or args.names < 1:
+            raise CommandError("--clients, --orders and --names must be at least 1.")
+
+        if str(config.SRC_DIR) not in sys.path:
+            # insert ca/ into path, otherwise it won't find the settings module of the Django project
+            sys.path.insert(0, str(config.SRC_DIR))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            os.environ["DJANGO_CA_SECRET_KEY"] = "dummy"
+            os.environ["DJANGO_CA_ALLOWED_HOSTS"] = HOSTNAME
+            os.environ["DJANGO_CA_CA_DIR"] = tmpdir
+            os.environ["DJANGO_CA_CA_ENABLE_ACME"] = "1"
+            os.environ["DJANGO_CA_CA_USE_CELERY"] = "0"
+            self.setup_django("ca.settings")
+            self.benchmark(args, tmpdir)
+
+    def benchmark(self, args: argparse.Namespace, tmpdir: str) -> None:
+        """Run the benchmark."""
+        # pylint: disable=import-outside-toplevel; have to call setup_django() first
+        from django.core.management import call_command as manage
+        from django.db import connection
+
+        from django_ca import ca_settings
+        from django_ca.models import CertificateAuthority
+
+        # pylint: enable=import-outside-toplevel
+
+        if connection.vendor == "sqlite":
+            connection.settings_dict["TEST"]["NAME"] = os.path.join(tmpdir, "db.sqlite3")
+
+        info("Creating temporary database...")
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            info("Creating certificate authority...")
+            manage(
+                "init_ca",
+                "--key-type=EC",
+                "--subject-format=rfc4514",
+                "--acme-enable",
+                "Benchmark",
+                "CN=Benchmark",
+                verbosity=0,
+            )
+            ca = CertificateAuthority.objects.get(name="Benchmark")
+            connection.close()  # clients use their own connection
+
+            measurements = Measurements()
+            info("Generating account keys...")
+            clients = [AcmeBenchmarkClient(ca.serial, index, measurements) for index in range(args.clients)]
+
+            print(f"Running benchmark with {bold(str(args.clients))} client(s)...")
+            with ExitStack() as stack:
+                stack.enter_context(
+                    mock.patch.object(ca_settings, "ACME_VALIDATE_ORDERS", args.validate_orders)
+                )
+                stack.enter_context(mock.patch("django_ca.tasks.validate_challenges", validate_challenges))
+                stack.enter_context(mock.patch("django_ca.tasks.validate_http_01", return_value=True))
+                stack.enter_context(mock.patch("django_ca.tasks.validate_dns_01", return_value=True))
+                executor = stack.enter_context(ThreadPoolExecutor(max_workers=args.clients))
+
+                start = time.perf_counter()
+                futures = [executor.submit(client.run, args.orders, args.names) for client in clients]
+                for future in futures:
+                    future.result()  # re-raises any exception raised in the client
+                duration = time.perf_counter() - start
+
+            self.output_results(measurements, args.clients * args.orders, duration)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
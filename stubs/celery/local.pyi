@@ -9,3 +9,9 @@ class Proxy(typing.Generic[F]):
     __call__: F
 
     def delay(self, *args: typing.Any, **kwargs: typing.Any) -> AsyncResult: ...
+    def apply_async(
+        self,
+        args: typing.Optional[tuple[typing.Any, ...]] = None,
+        kwargs: typing.Optional[dict[str, typing.Any]] = None,
+        **options: typing.Any,
+    ) -> AsyncResult: ...